@@ -16,6 +16,7 @@ from models.analysis_result import AnalysisResult  # noqa: E402
 from models.job_vacancy import JobVacancy  # noqa: E402
 from models.match_result import MatchResult  # noqa: E402
 from models.resume import Resume  # noqa: E402
+from utils.json_codec import json_deserializer, json_serializer  # noqa: E402
 
 # это объект конфигурации Alembic
 config = context.config
@@ -70,6 +71,9 @@ def run_migrations_online() -> None:
         config.get_section(config.config_ini_section, {}),
         prefix="sqlalchemy.",
         poolclass=pool.NullPool,
+        # JSON/JSONB в миграциях данных кодируется так же, как в приложении
+        json_serializer=json_serializer,
+        json_deserializer=json_deserializer,
     )
 
     with connectable.connect() as connection:
@@ -0,0 +1,73 @@
+"""
+Перевод JSON-столбцов analysis_results и analytics_events в JSONB
+
+jsonb хранится в разобранном бинарном виде (без повторного парсинга текста
+при чтении) и поддерживает GIN-индексы для запросов на вхождение (@>):
+- analytics_events.event_data: фильтрация событий по полям полезной нагрузки
+- analysis_results.skills: поиск результатов анализа по навыкам
+"""
+from typing import Sequence, Union
+
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "011_jsonb_analysis_and_events"
+down_revision: Union[str, None] = "010_add_unified_metrics"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Столбцы, переводимые из json в jsonb
+JSONB_COLUMNS = {
+    "analysis_results": [
+        "errors",
+        "skills",
+        "experience_summary",
+        "recommendations",
+        "keywords",
+        "entities",
+    ],
+    "analytics_events": ["event_data"],
+}
+
+
+def upgrade() -> None:
+    for table_name, columns in JSONB_COLUMNS.items():
+        for column_name in columns:
+            op.alter_column(
+                table_name,
+                column_name,
+                type_=postgresql.JSONB(),
+                postgresql_using=f"{column_name}::jsonb",
+            )
+
+    # GIN-индексы с классом операторов jsonb_path_ops для запросов @>
+    op.create_index(
+        "ix_analytics_events_event_data_gin",
+        "analytics_events",
+        ["event_data"],
+        postgresql_using="gin",
+        postgresql_ops={"event_data": "jsonb_path_ops"},
+    )
+    op.create_index(
+        "ix_analysis_results_skills_gin",
+        "analysis_results",
+        ["skills"],
+        postgresql_using="gin",
+        postgresql_ops={"skills": "jsonb_path_ops"},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_analysis_results_skills_gin", table_name="analysis_results")
+    op.drop_index("ix_analytics_events_event_data_gin", table_name="analytics_events")
+
+    for table_name, columns in JSONB_COLUMNS.items():
+        for column_name in columns:
+            op.alter_column(
+                table_name,
+                column_name,
+                type_=postgresql.JSON(),
+                postgresql_using=f"{column_name}::json",
+            )
@@ -0,0 +1,45 @@
+"""
+Составные индексы (event_type, created_at) и (recruiter_id, created_at) для analytics_events
+
+Аналитические запросы фильтруют события по типу или рекрутёру в диапазоне
+дат. Составные индексы отдают строки диапазона уже упорядоченными по времени
+и заменяют одностолбцовые индексы event_type и recruiter_id, которые
+становятся избыточными (ведущий столбец составного индекса).
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "012_analytics_events_time_idx"
+down_revision: Union[str, None] = "011_jsonb_analysis_and_events"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_analytics_events_event_type_created_at",
+        "analytics_events",
+        ["event_type", "created_at"],
+    )
+    op.create_index(
+        "ix_analytics_events_recruiter_id_created_at",
+        "analytics_events",
+        ["recruiter_id", "created_at"],
+    )
+    op.drop_index(op.f("ix_analytics_events_event_type"), table_name="analytics_events")
+    op.drop_index(op.f("ix_analytics_events_recruiter_id"), table_name="analytics_events")
+
+
+def downgrade() -> None:
+    op.create_index(op.f("ix_analytics_events_recruiter_id"), "analytics_events", ["recruiter_id"])
+    op.create_index(op.f("ix_analytics_events_event_type"), "analytics_events", ["event_type"])
+    op.drop_index(
+        "ix_analytics_events_recruiter_id_created_at",
+        table_name="analytics_events",
+    )
+    op.drop_index(
+        "ix_analytics_events_event_type_created_at",
+        table_name="analytics_events",
+    )
@@ -0,0 +1,55 @@
+"""
+Нативный тип ENUM для analytics_events.event_type
+
+Тип события хранился как VARCHAR(50). Значение ENUM в PostgreSQL занимает
+4 байта, что уменьшает размер строк и ключей составного индекса
+(event_type, created_at).
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "013_analytics_event_type_enum"
+down_revision: Union[str, None] = "012_analytics_events_time_idx"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+analytics_event_type = postgresql.ENUM(
+    "resume_uploaded",
+    "resume_processed",
+    "stage_changed",
+    "match_created",
+    "match_viewed",
+    "vacancy_created",
+    "vacancy_filled",
+    "feedback_submitted",
+    "report_generated",
+    "report_exported",
+    name="analytics_event_type",
+)
+
+
+def upgrade() -> None:
+    analytics_event_type.create(op.get_bind(), checkfirst=True)
+    op.alter_column(
+        "analytics_events",
+        "event_type",
+        type_=analytics_event_type,
+        postgresql_using="event_type::analytics_event_type",
+        existing_nullable=False,
+    )
+
+
+def downgrade() -> None:
+    op.alter_column(
+        "analytics_events",
+        "event_type",
+        type_=sa.String(50),
+        postgresql_using="event_type::text",
+        existing_nullable=False,
+    )
+    analytics_event_type.drop(op.get_bind(), checkfirst=True)
@@ -0,0 +1,89 @@
+"""
+Перевод оставшихся JSON-столбцов сопоставления, обратной связи и отчётов в JSONB
+
+GIN-индексы (jsonb_path_ops) для запросов на вхождение (@>):
+- job_vacancies.required_skills: вакансии, требующие навык
+- match_results.matched_skills / tfidf_matched: результаты по навыкам и ключевым словам
+- custom_synonyms.custom_synonyms: поиск канонического навыка по синониму
+- candidate_feedback.skills_feedback: фильтрация обратной связи по навыкам
+"""
+from typing import Sequence, Union
+
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "014_jsonb_matching_and_feedback"
+down_revision: Union[str, None] = "013_analytics_event_type_enum"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Столбцы, переводимые из json в jsonb
+JSONB_COLUMNS = {
+    "candidate_feedback": [
+        "grammar_feedback",
+        "skills_feedback",
+        "experience_feedback",
+        "recommendations",
+        # Атрибут модели extra_metadata, столбец создан миграцией 006 как metadata
+        "metadata",
+    ],
+    "resume_comparisons": ["resume_ids", "filters", "shared_with"],
+    "custom_synonyms": ["custom_synonyms"],
+    "job_vacancies": ["required_skills", "additional_requirements"],
+    "match_results": [
+        "matched_skills",
+        "missing_skills",
+        "additional_skills_matched",
+        "experience_details",
+        "tfidf_matched",
+        "tfidf_missing",
+    ],
+    "feedback_templates": ["sections"],
+    "reports": ["configuration"],
+    "scheduled_reports": ["schedule_config", "delivery_config", "recipients"],
+}
+
+# (имя индекса, таблица, столбец)
+GIN_INDEXES = [
+    ("ix_job_vacancies_required_skills_gin", "job_vacancies", "required_skills"),
+    ("ix_match_results_matched_skills_gin", "match_results", "matched_skills"),
+    ("ix_match_results_tfidf_matched_gin", "match_results", "tfidf_matched"),
+    ("ix_custom_synonyms_custom_synonyms_gin", "custom_synonyms", "custom_synonyms"),
+    ("ix_candidate_feedback_skills_feedback_gin", "candidate_feedback", "skills_feedback"),
+]
+
+
+def upgrade() -> None:
+    for table_name, columns in JSONB_COLUMNS.items():
+        for column_name in columns:
+            op.alter_column(
+                table_name,
+                column_name,
+                type_=postgresql.JSONB(),
+                postgresql_using=f'"{column_name}"::jsonb',
+            )
+
+    for index_name, table_name, column_name in GIN_INDEXES:
+        op.create_index(
+            index_name,
+            table_name,
+            [column_name],
+            postgresql_using="gin",
+            postgresql_ops={column_name: "jsonb_path_ops"},
+        )
+
+
+def downgrade() -> None:
+    for index_name, table_name, _ in reversed(GIN_INDEXES):
+        op.drop_index(index_name, table_name=table_name)
+
+    for table_name, columns in JSONB_COLUMNS.items():
+        for column_name in columns:
+            op.alter_column(
+                table_name,
+                column_name,
+                type_=postgresql.JSON(),
+                postgresql_using=f'"{column_name}"::json',
+            )
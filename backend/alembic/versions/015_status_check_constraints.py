@@ -0,0 +1,80 @@
+"""
+Замена ENUM на VARCHAR(12) + CHECK для batch_jobs.status и hiring_stages.stage_name
+
+Короткая строка с CHECK-ограничением даёт более узкие записи индексов
+ix_batch_jobs_status / ix_hiring_stages_stage_name и позволяет добавлять
+новые состояния без ALTER TYPE (AccessExclusive-блокировка).
+lower() нормализует значения в базах, созданных через create_all, где ENUM
+хранил имена членов (PENDING) вместо значений.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "015_status_check_constraints"
+down_revision: Union[str, None] = "014_jsonb_matching_and_feedback"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+BATCH_JOB_STATUSES = ("pending", "processing", "completed", "failed")
+HIRING_STAGE_NAMES = (
+    "applied",
+    "screening",
+    "interview",
+    "technical",
+    "offer",
+    "hired",
+    "rejected",
+    "withdrawn",
+)
+
+
+def _in_list(values: Sequence[str]) -> str:
+    return ", ".join(f"'{value}'" for value in values)
+
+
+def upgrade() -> None:
+    op.alter_column(
+        "batch_jobs",
+        "status",
+        type_=sa.String(12),
+        postgresql_using="lower(status::text)",
+    )
+    op.execute("DROP TYPE IF EXISTS batchjobstatus")
+    op.create_check_constraint(
+        "ck_batch_jobs_status",
+        "batch_jobs",
+        f"status IN ({_in_list(BATCH_JOB_STATUSES)})",
+    )
+
+    op.alter_column(
+        "hiring_stages",
+        "stage_name",
+        type_=sa.String(12),
+        postgresql_using="lower(stage_name::text)",
+    )
+    op.execute("DROP TYPE IF EXISTS hiringstagename")
+    op.create_check_constraint(
+        "ck_hiring_stages_stage_name",
+        "hiring_stages",
+        f"stage_name IN ({_in_list(HIRING_STAGE_NAMES)})",
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint("ck_hiring_stages_stage_name", "hiring_stages", type_="check")
+    op.alter_column("hiring_stages", "stage_name", type_=sa.String(50))
+
+    op.drop_constraint("ck_batch_jobs_status", "batch_jobs", type_="check")
+    batch_job_status = postgresql.ENUM(*BATCH_JOB_STATUSES, name="batchjobstatus")
+    batch_job_status.create(op.get_bind(), checkfirst=True)
+    op.alter_column(
+        "batch_jobs",
+        "status",
+        type_=batch_job_status,
+        postgresql_using="status::batchjobstatus",
+    )
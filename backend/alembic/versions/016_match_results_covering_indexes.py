@@ -0,0 +1,72 @@
+"""
+Составные индексы match_results для основных шаблонов доступа
+
+- uq_match_results_resume_vacancy: уникальность пары (resume_id, vacancy_id)
+  и точечный поиск сопоставления
+- ix_match_results_vacancy_score: (vacancy_id, overall_score DESC) INCLUDE
+  (...) — лучшие совпадения для вакансии через index-only scan без сортировки
+
+Одностолбцовый ix_match_results_vacancy_id становится избыточным.
+Перед созданием уникального индекса удаляются дубликаты пар, остаётся
+самая свежая запись.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "016_match_results_covering_idx"
+down_revision: Union[str, None] = "015_status_check_constraints"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        DELETE FROM match_results AS mr
+        USING (
+            SELECT id,
+                   row_number() OVER (
+                       PARTITION BY resume_id, vacancy_id
+                       ORDER BY updated_at DESC, created_at DESC, id DESC
+                   ) AS rn
+            FROM match_results
+        ) AS ranked
+        WHERE mr.id = ranked.id AND ranked.rn > 1
+        """
+    )
+
+    # CREATE/DROP INDEX CONCURRENTLY нельзя выполнять внутри транзакции
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "uq_match_results_resume_vacancy",
+            "match_results",
+            ["resume_id", "vacancy_id"],
+            unique=True,
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_match_results_vacancy_score",
+            "match_results",
+            ["vacancy_id", sa.text("overall_score DESC")],
+            postgresql_include=["recommendation", "keyword_score", "tfidf_score", "vector_score"],
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            op.f("ix_match_results_vacancy_id"),
+            table_name="match_results",
+            postgresql_concurrently=True,
+        )
+
+    op.execute(
+        "ALTER TABLE match_results ADD CONSTRAINT uq_match_results_resume_vacancy "
+        "UNIQUE USING INDEX uq_match_results_resume_vacancy"
+    )
+
+
+def downgrade() -> None:
+    op.create_index(op.f("ix_match_results_vacancy_id"), "match_results", ["vacancy_id"])
+    op.drop_index("ix_match_results_vacancy_score", table_name="match_results")
+    op.drop_constraint("uq_match_results_resume_vacancy", "match_results", type_="unique")
@@ -0,0 +1,48 @@
+"""
+Перевод оценок match_results из numeric в double precision
+
+numeric — программно эмулируемый десятичный тип переменной длины:
+сравнения в ORDER BY overall_score медленнее, а драйвер возвращает Decimal.
+Для оценок 0-1 (и процента 0-100) точности float8 достаточно.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "017_match_results_float_scores"
+down_revision: Union[str, None] = "016_match_results_covering_idx"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Столбец -> исходный тип numeric (для downgrade)
+SCORE_COLUMNS = {
+    "match_percentage": sa.Numeric(5, 2),
+    "overall_score": sa.Numeric(5, 4),
+    "keyword_score": sa.Numeric(5, 4),
+    "tfidf_score": sa.Numeric(5, 4),
+    "vector_score": sa.Numeric(5, 4),
+    "vector_similarity": sa.Numeric(5, 4),
+}
+
+
+def upgrade() -> None:
+    for column_name in SCORE_COLUMNS:
+        op.alter_column(
+            "match_results",
+            column_name,
+            type_=sa.Float(),
+            postgresql_using=f"{column_name}::double precision",
+        )
+
+
+def downgrade() -> None:
+    for column_name, numeric_type in SCORE_COLUMNS.items():
+        op.alter_column(
+            "match_results",
+            column_name,
+            type_=numeric_type,
+            postgresql_using=f"round({column_name}::numeric, {numeric_type.scale})",
+        )
@@ -0,0 +1,40 @@
+"""
+Частичные индексы batch_jobs
+
+- ix_batch_jobs_active: только незавершённые задания (pending/processing),
+  которые опрашивают воркеры; размер индекса ограничен числом заданий
+  в работе, а не всей историей
+- ix_batch_jobs_celery_task_id: поиск задания по ID задачи Celery
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "018_batch_jobs_partial_indexes"
+down_revision: Union[str, None] = "017_match_results_float_scores"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_batch_jobs_active",
+        "batch_jobs",
+        ["status"],
+        postgresql_where=sa.text("status IN ('pending', 'processing')"),
+    )
+    op.create_index(
+        "ix_batch_jobs_celery_task_id",
+        "batch_jobs",
+        ["celery_task_id"],
+        postgresql_where=sa.text("celery_task_id IS NOT NULL"),
+    )
+    op.drop_index(op.f("ix_batch_jobs_status"), table_name="batch_jobs")
+
+
+def downgrade() -> None:
+    op.create_index(op.f("ix_batch_jobs_status"), "batch_jobs", ["status"])
+    op.drop_index("ix_batch_jobs_celery_task_id", table_name="batch_jobs")
+    op.drop_index("ix_batch_jobs_active", table_name="batch_jobs")
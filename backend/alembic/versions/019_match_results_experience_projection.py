@@ -0,0 +1,46 @@
+"""
+Вычисляемый столбец match_results.experience_total_months
+
+STORED-проекция experience_details->>'total_months' с b-tree индексом:
+фильтр «кандидаты с опытом >= N месяцев» выполняется диапазонным
+сканированием индекса без разбора JSONB в каждой строке.
+Добавление STORED-столбца перезаписывает таблицу.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "019_match_results_exp_projection"
+down_revision: Union[str, None] = "018_batch_jobs_partial_indexes"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+EXPERIENCE_TOTAL_MONTHS_SQL = (
+    "CASE WHEN jsonb_typeof(experience_details->'total_months') = 'number' "
+    "THEN (experience_details->>'total_months')::numeric::integer END"
+)
+
+
+def upgrade() -> None:
+    op.add_column(
+        "match_results",
+        sa.Column(
+            "experience_total_months",
+            sa.Integer(),
+            sa.Computed(EXPERIENCE_TOTAL_MONTHS_SQL, persisted=True),
+            nullable=True,
+        ),
+    )
+    op.create_index(
+        "ix_match_results_experience_total_months",
+        "match_results",
+        ["experience_total_months"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_match_results_experience_total_months", table_name="match_results")
+    op.drop_column("match_results", "experience_total_months")
@@ -0,0 +1,62 @@
+"""
+Серверное значение по умолчанию gen_random_uuid() для первичных ключей
+
+ORM по-прежнему генерирует UUIDv7 на клиенте; серверный default нужен для
+вставок в обход ORM (сырой SQL, COPY). Заодно scheduled_reports.report_id
+приводится к нативному uuid: в базах, созданных через create_all, столбец
+был объявлен строковым.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "020_uuid_server_defaults"
+down_revision: Union[str, None] = "019_match_results_exp_projection"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Таблицы с первичным ключом UUIDMixin, создаваемые миграциями
+UUID_PK_TABLES = [
+    "resumes",
+    "analysis_results",
+    "job_vacancies",
+    "match_results",
+    "skill_taxonomies",
+    "custom_synonyms",
+    "skill_feedback",
+    "ml_model_versions",
+    "resume_comparisons",
+    "hiring_stages",
+    "analytics_events",
+    "recruiters",
+    "reports",
+    "scheduled_reports",
+    "batch_jobs",
+    "feedback_templates",
+    "candidate_feedback",
+    "saved_searches",
+    "search_alerts",
+    "resume_analyses",
+]
+
+
+def upgrade() -> None:
+    # gen_random_uuid() встроена в PostgreSQL 13+
+    for table_name in UUID_PK_TABLES:
+        op.alter_column(table_name, "id", server_default=sa.text("gen_random_uuid()"))
+
+    op.alter_column(
+        "scheduled_reports",
+        "report_id",
+        type_=postgresql.UUID(as_uuid=True),
+        postgresql_using="report_id::uuid",
+    )
+
+
+def downgrade() -> None:
+    for table_name in UUID_PK_TABLES:
+        op.alter_column(table_name, "id", server_default=None)
@@ -0,0 +1,94 @@
+"""
+Перенос resume_comparisons.resume_ids из JSON-массива в связующую таблицу
+
+resume_comparison_members(comparison_id, resume_id, position) индексируется
+в обе стороны, поэтому запрос «сравнения, содержащие резюме X» выполняется
+поиском по индексу вместо полного сканирования с разбором JSONB.
+Существующие массивы переносятся с сохранением порядка; элементы, не
+являющиеся UUID существующих резюме, отбрасываются.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "021_resume_comparison_members"
+down_revision: Union[str, None] = "020_uuid_server_defaults"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "resume_comparison_members",
+        sa.Column(
+            "comparison_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("resume_comparisons.id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column(
+            "resume_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("resumes.id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column("position", sa.SmallInteger(), nullable=False, server_default="0"),
+    )
+    op.create_index(
+        "ix_resume_comparison_members_resume_id",
+        "resume_comparison_members",
+        ["resume_id", "comparison_id"],
+    )
+
+    # Порядок вычисления операндов AND в PostgreSQL не гарантирован, поэтому
+    # приведение к uuid защищено CASE: не-UUID элемент даёт NULL и не
+    # соединяется с resumes, а не прерывает миграцию ошибкой приведения
+    op.execute(
+        """
+        INSERT INTO resume_comparison_members (comparison_id, resume_id, position)
+        SELECT rc.id, r.id, (elem.ord - 1)::smallint
+        FROM resume_comparisons AS rc
+        CROSS JOIN LATERAL jsonb_array_elements_text(rc.resume_ids)
+            WITH ORDINALITY AS elem(value, ord)
+        JOIN resumes AS r
+            ON r.id = CASE
+                WHEN elem.value ~* '^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$'
+                THEN elem.value::uuid
+            END
+        ON CONFLICT DO NOTHING
+        """
+    )
+    op.drop_column("resume_comparisons", "resume_ids")
+
+
+def downgrade() -> None:
+    op.add_column(
+        "resume_comparisons",
+        sa.Column(
+            "resume_ids",
+            postgresql.JSONB(),
+            nullable=False,
+            server_default=sa.text("'[]'::jsonb"),
+        ),
+    )
+    op.execute(
+        """
+        UPDATE resume_comparisons AS rc
+        SET resume_ids = members.ids
+        FROM (
+            SELECT comparison_id,
+                   jsonb_agg(resume_id::text ORDER BY position) AS ids
+            FROM resume_comparison_members
+            GROUP BY comparison_id
+        ) AS members
+        WHERE rc.id = members.comparison_id
+        """
+    )
+    op.drop_index(
+        "ix_resume_comparison_members_resume_id",
+        table_name="resume_comparison_members",
+    )
+    op.drop_table("resume_comparison_members")
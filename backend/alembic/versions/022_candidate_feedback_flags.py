@@ -0,0 +1,61 @@
+"""
+Упаковка candidate_feedback.viewed_by_candidate/downloaded в битовую маску flags
+
+Два boolean-столбца заменяются одним SMALLINT (бит 0 — просмотрено,
+бит 1 — скачано). Частичный индекс по resume_id WHERE (flags & 1) = 0
+обслуживает выборку непросмотренной обратной связи.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "022_candidate_feedback_flags"
+down_revision: Union[str, None] = "021_resume_comparison_members"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "candidate_feedback",
+        sa.Column("flags", sa.SmallInteger(), nullable=False, server_default="0"),
+    )
+    op.execute(
+        """
+        UPDATE candidate_feedback
+        SET flags = (CASE WHEN viewed_by_candidate THEN 1 ELSE 0 END)
+                  | (CASE WHEN downloaded THEN 2 ELSE 0 END)
+        WHERE viewed_by_candidate OR downloaded
+        """
+    )
+    op.drop_column("candidate_feedback", "downloaded")
+    op.drop_column("candidate_feedback", "viewed_by_candidate")
+    op.create_index(
+        "ix_candidate_feedback_unseen",
+        "candidate_feedback",
+        ["resume_id"],
+        postgresql_where=sa.text("(flags & 1) = 0"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_candidate_feedback_unseen", table_name="candidate_feedback")
+    op.add_column(
+        "candidate_feedback",
+        sa.Column("viewed_by_candidate", sa.Boolean(), nullable=False, server_default="false"),
+    )
+    op.add_column(
+        "candidate_feedback",
+        sa.Column("downloaded", sa.Boolean(), nullable=False, server_default="false"),
+    )
+    op.execute(
+        """
+        UPDATE candidate_feedback
+        SET viewed_by_candidate = (flags & 1) <> 0,
+            downloaded = (flags & 2) <> 0
+        WHERE flags <> 0
+        """
+    )
+    op.drop_column("candidate_feedback", "flags")
@@ -0,0 +1,95 @@
+"""
+Уникальные частичные индексы для batch_jobs.celery_task_id и job_vacancies.external_id
+
+- uq_batch_jobs_celery_task_id заменяет неуникальный ix_batch_jobs_celery_task_id
+- uq_job_vacancies_external_id_source заменяет ix_job_vacancies_external_id;
+  уникальность в пределах источника (source)
+
+Уникальность позволяет планировщику доказать, что совпадает не более одной
+строки. Перед созданием индексов у более старых дубликатов обнуляется
+идентификатор, сами строки не удаляются.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "023_unique_external_ids"
+down_revision: Union[str, None] = "022_candidate_feedback_flags"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        UPDATE batch_jobs AS bj
+        SET celery_task_id = NULL
+        FROM (
+            SELECT id,
+                   row_number() OVER (
+                       PARTITION BY celery_task_id ORDER BY created_at DESC, id DESC
+                   ) AS rn
+            FROM batch_jobs
+            WHERE celery_task_id IS NOT NULL
+        ) AS ranked
+        WHERE bj.id = ranked.id AND ranked.rn > 1
+        """
+    )
+    op.execute(
+        """
+        UPDATE job_vacancies AS jv
+        SET external_id = NULL
+        FROM (
+            SELECT id,
+                   row_number() OVER (
+                       PARTITION BY external_id, source ORDER BY created_at DESC, id DESC
+                   ) AS rn
+            FROM job_vacancies
+            WHERE external_id IS NOT NULL
+        ) AS ranked
+        WHERE jv.id = ranked.id AND ranked.rn > 1
+        """
+    )
+
+    # CREATE/DROP INDEX CONCURRENTLY нельзя выполнять внутри транзакции
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "uq_batch_jobs_celery_task_id",
+            "batch_jobs",
+            ["celery_task_id"],
+            unique=True,
+            postgresql_where=sa.text("celery_task_id IS NOT NULL"),
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_batch_jobs_celery_task_id",
+            table_name="batch_jobs",
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "uq_job_vacancies_external_id_source",
+            "job_vacancies",
+            ["external_id", "source"],
+            unique=True,
+            postgresql_where=sa.text("external_id IS NOT NULL"),
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            op.f("ix_job_vacancies_external_id"),
+            table_name="job_vacancies",
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    op.create_index(op.f("ix_job_vacancies_external_id"), "job_vacancies", ["external_id"])
+    op.drop_index("uq_job_vacancies_external_id_source", table_name="job_vacancies")
+    op.create_index(
+        "ix_batch_jobs_celery_task_id",
+        "batch_jobs",
+        ["celery_task_id"],
+        postgresql_where=sa.text("celery_task_id IS NOT NULL"),
+    )
+    op.drop_index("uq_batch_jobs_celery_task_id", table_name="batch_jobs")
@@ -0,0 +1,63 @@
+"""
+BRIN-индекс по match_results.created_at и однобуквенные коды рекомендаций
+
+- brin_match_results_created_at заменяет b-tree ix_match_results_created_at:
+  таблица пополняется в порядке created_at, и BRIN на порядки меньше
+  при тех же диапазонных выборках аналитики
+- recommendation хранится как CHAR(1) ('E', 'G', 'M', 'P') с CHECK вместо
+  VARCHAR(20); преобразование выполняет тип RecommendationCode модели
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "024_match_results_brin_rec"
+down_revision: Union[str, None] = "023_unique_external_ids"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "brin_match_results_created_at",
+        "match_results",
+        ["created_at"],
+        postgresql_using="brin",
+        postgresql_with={"pages_per_range": 32},
+    )
+    op.drop_index(op.f("ix_match_results_created_at"), table_name="match_results")
+
+    op.alter_column(
+        "match_results",
+        "recommendation",
+        type_=sa.CHAR(1),
+        postgresql_using=(
+            "CASE recommendation "
+            "WHEN 'excellent' THEN 'E' WHEN 'good' THEN 'G' "
+            "WHEN 'maybe' THEN 'M' WHEN 'poor' THEN 'P' END"
+        ),
+    )
+    op.create_check_constraint(
+        "ck_match_results_recommendation",
+        "match_results",
+        "recommendation IN ('E', 'G', 'M', 'P')",
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint("ck_match_results_recommendation", "match_results", type_="check")
+    op.alter_column(
+        "match_results",
+        "recommendation",
+        type_=sa.String(20),
+        postgresql_using=(
+            "CASE recommendation "
+            "WHEN 'E' THEN 'excellent' WHEN 'G' THEN 'good' "
+            "WHEN 'M' THEN 'maybe' WHEN 'P' THEN 'poor' END"
+        ),
+    )
+
+    op.create_index(op.f("ix_match_results_created_at"), "match_results", ["created_at"])
+    op.drop_index("brin_match_results_created_at", table_name="match_results")
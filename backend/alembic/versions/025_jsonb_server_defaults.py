@@ -0,0 +1,35 @@
+"""
+Серверные значения по умолчанию '[]'::jsonb для JSONB-массивов
+
+Пустой массив материализуется PostgreSQL: INSERT без этих столбцов не
+несёт лишний параметр, а значение по умолчанию действует и при загрузке
+данных сырым SQL в обход ORM.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "025_jsonb_server_defaults"
+down_revision: Union[str, None] = "024_match_results_brin_rec"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (таблица, столбец)
+JSONB_ARRAY_COLUMNS = [
+    ("job_vacancies", "required_skills"),
+    ("job_vacancies", "additional_requirements"),
+    ("resume_comparisons", "shared_with"),
+]
+
+
+def upgrade() -> None:
+    for table_name, column_name in JSONB_ARRAY_COLUMNS:
+        op.alter_column(table_name, column_name, server_default=sa.text("'[]'::jsonb"))
+
+
+def downgrade() -> None:
+    for table_name, column_name in JSONB_ARRAY_COLUMNS:
+        op.alter_column(table_name, column_name, server_default="[]")
@@ -0,0 +1,33 @@
+"""
+Покрывающий индекс hiring_stages (resume_id, created_at DESC) INCLUDE (stage_name)
+
+Запрос воронки «последний этап по каждому резюме»
+(DISTINCT ON (resume_id) ... ORDER BY resume_id, created_at DESC)
+выполняется index-only scan без сортировки. Одностолбцовый
+ix_hiring_stages_resume_id становится избыточным.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "026_hiring_stages_resume_created"
+down_revision: Union[str, None] = "025_jsonb_server_defaults"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_hiring_stages_resume_created",
+        "hiring_stages",
+        ["resume_id", sa.text("created_at DESC")],
+        postgresql_include=["stage_name"],
+    )
+    op.drop_index(op.f("ix_hiring_stages_resume_id"), table_name="hiring_stages")
+
+
+def downgrade() -> None:
+    op.create_index(op.f("ix_hiring_stages_resume_id"), "hiring_stages", ["resume_id"])
+    op.drop_index("ix_hiring_stages_resume_created", table_name="hiring_stages")
@@ -0,0 +1,56 @@
+"""
+Развёрнутая таблица custom_synonym_terms с trigram GIN-индексом
+
+Каждый синоним из custom_synonyms.custom_synonyms хранится отдельной
+строкой: поиск канонического навыка по термину (в том числе нечёткий,
+через pg_trgm) выполняется одним обращением к индексу вместо разбора
+JSON-массивов всех строк организации.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "027_custom_synonym_terms"
+down_revision: Union[str, None] = "026_hiring_stages_resume_created"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    op.create_table(
+        "custom_synonym_terms",
+        sa.Column(
+            "custom_synonym_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("custom_synonyms.id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column("term", sa.String(255), primary_key=True),
+    )
+    op.execute(
+        """
+        INSERT INTO custom_synonym_terms (custom_synonym_id, term)
+        SELECT cs.id, left(t.term, 255)
+        FROM custom_synonyms AS cs
+        CROSS JOIN LATERAL jsonb_array_elements_text(cs.custom_synonyms) AS t(term)
+        WHERE jsonb_typeof(cs.custom_synonyms) = 'array'
+        ON CONFLICT DO NOTHING
+        """
+    )
+    op.create_index(
+        "ix_custom_synonym_terms_term_trgm",
+        "custom_synonym_terms",
+        ["term"],
+        postgresql_using="gin",
+        postgresql_ops={"term": "gin_trgm_ops"},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_custom_synonym_terms_term_trgm", table_name="custom_synonym_terms")
+    op.drop_table("custom_synonym_terms")
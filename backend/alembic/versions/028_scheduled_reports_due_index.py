@@ -0,0 +1,30 @@
+"""
+Частичный индекс scheduled_reports(next_run_at) WHERE is_active
+
+Планировщик постоянно опрашивает
+WHERE is_active AND next_run_at <= now() ORDER BY next_run_at LIMIT K;
+без индекса каждый тик выполнял последовательное сканирование.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "028_scheduled_reports_due_index"
+down_revision: Union[str, None] = "027_custom_synonym_terms"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_scheduled_reports_due",
+        "scheduled_reports",
+        ["next_run_at"],
+        postgresql_where=sa.text("is_active AND next_run_at IS NOT NULL"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_scheduled_reports_due", table_name="scheduled_reports")
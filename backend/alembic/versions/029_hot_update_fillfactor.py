@@ -0,0 +1,39 @@
+"""
+fillfactor=80 для часто обновляемых таблиц batch_jobs и scheduled_reports
+
+Счётчики batch_jobs и next_run_at/last_run_at scheduled_reports переписываются
+много раз на строку. Свободные 20% страницы позволяют PostgreSQL делать
+HOT-обновления: новая версия строки остаётся на той же странице, индексы не
+трогаются. Индексы по обновляемым столбцам (status, next_run_at) получают тот же
+запас. Остальные таблицы в основном только дополняются и остаются с fillfactor=100.
+
+Новое значение применяется к вновь заполняемым страницам; существующие
+перепаковываются при VACUUM FULL / pg_repack.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "029_hot_update_fillfactor"
+down_revision: Union[str, None] = "028_scheduled_reports_due_index"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+TABLES = ["batch_jobs", "scheduled_reports"]
+INDEXES = ["ix_batch_jobs_active", "ix_scheduled_reports_due"]
+
+
+def upgrade() -> None:
+    for table_name in TABLES:
+        op.execute(f"ALTER TABLE {table_name} SET (fillfactor = 80)")
+    for index_name in INDEXES:
+        op.execute(f"ALTER INDEX {index_name} SET (fillfactor = 80)")
+
+
+def downgrade() -> None:
+    for index_name in INDEXES:
+        op.execute(f"ALTER INDEX {index_name} RESET (fillfactor)")
+    for table_name in TABLES:
+        op.execute(f"ALTER TABLE {table_name} RESET (fillfactor)")
@@ -0,0 +1,96 @@
+"""
+Перевод JSON-столбцов анализов резюме, таксономии, сохранённых поисков и
+обратной связи по навыкам в JSONB
+
+GIN-индексы (jsonb_path_ops) для запросов на вхождение (@>):
+- resume_analyses.skills: резюме, содержащие навык
+- skill_taxonomies.variants: канонический навык по написанию
+- saved_searches.filters: сохранённые поиски по значению фильтра
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "030_jsonb_analyses_and_taxonomy"
+down_revision: Union[str, None] = "029_hot_update_fillfactor"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Столбцы, переводимые из json в jsonb (имена столбцов по миграциям 002/007/20250129)
+JSONB_COLUMNS = {
+    "resume_analyses": [
+        "skills",
+        "keywords",
+        "entities",
+        "education",
+        "contact_info",
+        "grammar_issues",
+        "warnings",
+    ],
+    "skill_taxonomies": ["variants", "metadata"],
+    "skill_feedback": ["metadata"],
+}
+
+# (имя индекса, таблица, столбец)
+GIN_INDEXES = [
+    ("ix_resume_analyses_skills_gin", "resume_analyses", "skills"),
+    ("ix_skill_taxonomies_variants_gin", "skill_taxonomies", "variants"),
+    ("ix_saved_searches_filters_gin", "saved_searches", "filters"),
+]
+
+
+def upgrade() -> None:
+    for table_name, columns in JSONB_COLUMNS.items():
+        for column_name in columns:
+            op.alter_column(
+                table_name,
+                column_name,
+                type_=postgresql.JSONB(),
+                postgresql_using=f'"{column_name}"::jsonb',
+            )
+
+    # У filters есть DEFAULT '{}' типа json: снимаем его на время смены типа
+    op.alter_column("saved_searches", "filters", server_default=None)
+    op.alter_column(
+        "saved_searches",
+        "filters",
+        type_=postgresql.JSONB(),
+        postgresql_using="filters::jsonb",
+        server_default=sa.text("'{}'::jsonb"),
+    )
+
+    for index_name, table_name, column_name in GIN_INDEXES:
+        op.create_index(
+            index_name,
+            table_name,
+            [column_name],
+            postgresql_using="gin",
+            postgresql_ops={column_name: "jsonb_path_ops"},
+        )
+
+
+def downgrade() -> None:
+    for index_name, table_name, _ in reversed(GIN_INDEXES):
+        op.drop_index(index_name, table_name=table_name)
+
+    op.alter_column("saved_searches", "filters", server_default=None)
+    op.alter_column(
+        "saved_searches",
+        "filters",
+        type_=postgresql.JSON(),
+        postgresql_using="filters::json",
+        server_default="{}",
+    )
+
+    for table_name, columns in JSONB_COLUMNS.items():
+        for column_name in columns:
+            op.alter_column(
+                table_name,
+                column_name,
+                type_=postgresql.JSON(),
+                postgresql_using=f'"{column_name}"::json',
+            )
@@ -0,0 +1,51 @@
+"""
+Составные и частичные индексы skill_taxonomies и search_alerts
+
+- ix_skill_taxonomies_industry_name (industry, skill_name): навык отрасли по
+  каноническому имени; заменяет ix_skill_taxonomies_industry
+- ix_skill_taxonomies_active_industry (industry) WHERE is_active
+- ix_search_alerts_search_unsent (saved_search_id) WHERE is_sent = false;
+  заменяет ix_search_alerts_is_sent
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "031_taxonomy_and_alert_indexes"
+down_revision: Union[str, None] = "030_jsonb_analyses_and_taxonomy"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_skill_taxonomies_industry_name",
+        "skill_taxonomies",
+        ["industry", "skill_name"],
+    )
+    op.create_index(
+        "ix_skill_taxonomies_active_industry",
+        "skill_taxonomies",
+        ["industry"],
+        postgresql_where=sa.text("is_active"),
+    )
+    op.drop_index("ix_skill_taxonomies_industry", table_name="skill_taxonomies")
+
+    op.create_index(
+        "ix_search_alerts_search_unsent",
+        "search_alerts",
+        ["saved_search_id"],
+        postgresql_where=sa.text("is_sent = false"),
+    )
+    op.drop_index("ix_search_alerts_is_sent", table_name="search_alerts")
+
+
+def downgrade() -> None:
+    op.create_index("ix_search_alerts_is_sent", "search_alerts", ["is_sent"])
+    op.drop_index("ix_search_alerts_search_unsent", table_name="search_alerts")
+
+    op.create_index("ix_skill_taxonomies_industry", "skill_taxonomies", ["industry"])
+    op.drop_index("ix_skill_taxonomies_active_industry", table_name="skill_taxonomies")
+    op.drop_index("ix_skill_taxonomies_industry_name", table_name="skill_taxonomies")
@@ -0,0 +1,31 @@
+"""
+Столбец resume_analyses.content_hash (SHA-256 raw_text)
+
+Загрузчик тестовых данных по хэшу находит уже проанализированный текст и не
+повторяет NLP-извлечение. Индекс неуникальный: одно и то же резюме может быть
+загружено повторно как отдельная запись.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "032_resume_analyses_content_hash"
+down_revision: Union[str, None] = "031_taxonomy_and_alert_indexes"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("resume_analyses", sa.Column("content_hash", sa.CHAR(64), nullable=True))
+    op.create_index(
+        "ix_resume_analyses_content_hash",
+        "resume_analyses",
+        ["content_hash"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_resume_analyses_content_hash", table_name="resume_analyses")
+    op.drop_column("resume_analyses", "content_hash")
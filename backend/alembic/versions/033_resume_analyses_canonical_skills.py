@@ -0,0 +1,38 @@
+"""
+Столбец resume_analyses.canonical_skills (text[]) с GIN-индексом
+
+Навыки резюме, приведённые к каноническим именам skill_taxonomies.
+Сопоставление с вакансией сводится к пересечению множеств (в SQL -
+canonical_skills && / @> ARRAY[...] по GIN-индексу) вместо попарного
+нечёткого сравнения строк. Существующие строки заполняются при следующем
+сохранении анализа.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "033_analyses_canonical_skills"
+down_revision: Union[str, None] = "032_resume_analyses_content_hash"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "resume_analyses",
+        sa.Column("canonical_skills", postgresql.ARRAY(sa.Text()), nullable=True),
+    )
+    op.create_index(
+        "ix_resume_analyses_canonical_skills_gin",
+        "resume_analyses",
+        ["canonical_skills"],
+        postgresql_using="gin",
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_resume_analyses_canonical_skills_gin", table_name="resume_analyses")
+    op.drop_column("resume_analyses", "canonical_skills")
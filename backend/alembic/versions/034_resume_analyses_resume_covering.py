@@ -0,0 +1,42 @@
+"""
+Один уникальный покрывающий индекс resume_analyses(resume_id) INCLUDE (quality_score)
+
+Ограничение UNIQUE (resume_id) и ix_resume_analyses_resume_id были двумя
+одинаковыми B-tree по одному столбцу. Их заменяет уникальный индекс
+ix_resume_analyses_resume_covering.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "034_analyses_resume_covering"
+down_revision: Union[str, None] = "033_analyses_canonical_skills"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # CREATE/DROP INDEX CONCURRENTLY нельзя выполнять внутри транзакции
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_resume_analyses_resume_covering",
+            "resume_analyses",
+            ["resume_id"],
+            unique=True,
+            postgresql_include=["quality_score"],
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            op.f("ix_resume_analyses_resume_id"),
+            table_name="resume_analyses",
+            postgresql_concurrently=True,
+        )
+
+    op.drop_constraint("resume_analyses_resume_id_key", "resume_analyses", type_="unique")
+
+
+def downgrade() -> None:
+    op.create_unique_constraint("resume_analyses_resume_id_key", "resume_analyses", ["resume_id"])
+    op.create_index(op.f("ix_resume_analyses_resume_id"), "resume_analyses", ["resume_id"])
+    op.drop_index("ix_resume_analyses_resume_covering", table_name="resume_analyses")
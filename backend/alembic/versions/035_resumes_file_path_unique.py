@@ -0,0 +1,33 @@
+"""
+Уникальный индекс resumes(file_path)
+
+Служит целью INSERT ... ON CONFLICT (file_path) DO NOTHING при массовой
+загрузке резюме: дубликаты отсекаются индексом вместо предварительного SELECT.
+Загрузка через API сохраняет файлы под именем <uuid>.<ext>, поэтому
+существующие пути уже уникальны.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "035_resumes_file_path_unique"
+down_revision: Union[str, None] = "034_analyses_resume_covering"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # CREATE INDEX CONCURRENTLY нельзя выполнять внутри транзакции
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "uq_resumes_file_path",
+            "resumes",
+            ["file_path"],
+            unique=True,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    op.drop_index("uq_resumes_file_path", table_name="resumes")
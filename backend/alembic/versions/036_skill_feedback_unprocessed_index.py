@@ -0,0 +1,33 @@
+"""
+Частичный индекс skill_feedback(created_at) WHERE processed = false
+
+Задача aggregate_feedback_and_generate_synonyms выбирает необработанную
+обратную связь за последние N дней; без индекса это последовательное
+сканирование всей таблицы.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "036_skill_feedback_unprocessed"
+down_revision: Union[str, None] = "035_resumes_file_path_unique"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # CREATE INDEX CONCURRENTLY нельзя выполнять внутри транзакции
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_skill_feedback_unprocessed",
+            "skill_feedback",
+            ["created_at"],
+            postgresql_where=sa.text("processed = false"),
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_skill_feedback_unprocessed", table_name="skill_feedback")
@@ -0,0 +1,71 @@
+"""
+Ограниченные по длине типы для resume_analyses и CITEXT для skill_taxonomies.skill_name
+
+language (код языка) и analyzer_version переводятся из TEXT в VARCHAR(8) и
+VARCHAR(32). skill_name становится CITEXT: поиск навыка без учёта регистра
+использует существующие btree-индексы вместо сканирования с lower(skill_name).
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "037_analysis_sizes_citext"
+down_revision: Union[str, None] = "036_skill_feedback_unprocessed"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS citext")
+
+    op.alter_column(
+        "resume_analyses",
+        "language",
+        type_=sa.String(8),
+        existing_type=sa.Text(),
+        existing_nullable=True,
+        postgresql_using="left(language, 8)",
+    )
+    op.alter_column(
+        "resume_analyses",
+        "analyzer_version",
+        type_=sa.String(32),
+        existing_type=sa.Text(),
+        existing_nullable=True,
+        postgresql_using="left(analyzer_version, 32)",
+    )
+    # Индексы по skill_name перестраиваются вместе со сменой типа
+    op.alter_column(
+        "skill_taxonomies",
+        "skill_name",
+        type_=postgresql.CITEXT(),
+        existing_type=sa.String(),
+        existing_nullable=False,
+    )
+
+
+def downgrade() -> None:
+    op.alter_column(
+        "skill_taxonomies",
+        "skill_name",
+        type_=sa.String(),
+        existing_type=postgresql.CITEXT(),
+        existing_nullable=False,
+    )
+    op.alter_column(
+        "resume_analyses",
+        "analyzer_version",
+        type_=sa.Text(),
+        existing_type=sa.String(32),
+        existing_nullable=True,
+    )
+    op.alter_column(
+        "resume_analyses",
+        "language",
+        type_=sa.Text(),
+        existing_type=sa.String(8),
+        existing_nullable=True,
+    )
@@ -0,0 +1,59 @@
+"""
+Компактные типы метрик resume_analyses
+
+quality_score (0-100) становится SMALLINT с CHECK-ограничением диапазона,
+processing_time_seconds - REAL вместо DOUBLE PRECISION. Значения вне
+диапазона приводятся к границам до создания ограничения.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "038_analyses_compact_metrics"
+down_revision: Union[str, None] = "037_analysis_sizes_citext"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # ix_resume_analyses_resume_covering (INCLUDE quality_score) перестраивается вместе с типом
+    op.alter_column(
+        "resume_analyses",
+        "quality_score",
+        type_=sa.SmallInteger(),
+        existing_type=sa.Integer(),
+        existing_nullable=True,
+        postgresql_using="greatest(0, least(quality_score, 100))::smallint",
+    )
+    op.create_check_constraint(
+        "ck_resume_analyses_quality_score",
+        "resume_analyses",
+        "quality_score BETWEEN 0 AND 100",
+    )
+    op.alter_column(
+        "resume_analyses",
+        "processing_time_seconds",
+        type_=sa.REAL(),
+        existing_type=sa.Float(),
+        existing_nullable=True,
+    )
+
+
+def downgrade() -> None:
+    op.alter_column(
+        "resume_analyses",
+        "processing_time_seconds",
+        type_=sa.Float(),
+        existing_type=sa.REAL(),
+        existing_nullable=True,
+    )
+    op.drop_constraint("ck_resume_analyses_quality_score", "resume_analyses", type_="check")
+    op.alter_column(
+        "resume_analyses",
+        "quality_score",
+        type_=sa.Integer(),
+        existing_type=sa.SmallInteger(),
+        existing_nullable=True,
+    )
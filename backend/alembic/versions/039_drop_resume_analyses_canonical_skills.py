@@ -0,0 +1,36 @@
+"""
+Удаление resume_analyses.canonical_skills
+
+Столбец заполнялся при каждом сохранении анализа (с чтением всей таксономии
+навыков), но ни один запрос сопоставления его не читал. Сопоставление
+по-прежнему выполняет EnhancedSkillMatcher (синонимы и нечёткое сравнение).
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "039_drop_canonical_skills"
+down_revision: Union[str, None] = "038_analyses_compact_metrics"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.drop_index("ix_resume_analyses_canonical_skills_gin", table_name="resume_analyses")
+    op.drop_column("resume_analyses", "canonical_skills")
+
+
+def downgrade() -> None:
+    op.add_column(
+        "resume_analyses",
+        sa.Column("canonical_skills", postgresql.ARRAY(sa.Text()), nullable=True),
+    )
+    op.create_index(
+        "ix_resume_analyses_canonical_skills_gin",
+        "resume_analyses",
+        ["canonical_skills"],
+        postgresql_using="gin",
+    )
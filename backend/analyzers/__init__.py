@@ -51,6 +51,7 @@ from .error_detector import (
 )
 from .enhanced_matcher import (
     EnhancedSkillMatcher,
+    get_enhanced_matcher,
 )
 from .tfidf_matcher import (
     TfidfSkillMatcher,
@@ -113,6 +114,7 @@ __all__ = [
     "get_error_summary",
     "format_errors_for_display",
     "EnhancedSkillMatcher",
+    "get_enhanced_matcher",
     "TfidfSkillMatcher",
     "TfidfMatchResult",
     "get_tfidf_matcher",
@@ -0,0 +1,184 @@
+"""
+Кэш результатов NLP-извлечения по хэшу содержимого текста.
+
+extract_resume_entities и extract_resume_skills детерминированы для одного
+текста и параметров, а загрузка моделей и разбор занимают секунды. Результаты
+хранятся в двух уровнях:
+- LRU в памяти процесса (повторные вызовы в одном запуске);
+- SQLite-файл на диске (повторные запуски скриптов, разные процессы пула).
+
+Ключ — SHA-256 текста и параметры вызова (сам текст в ключ не входит, поэтому
+LRU не удерживает тексты резюме в памяти); значения сериализуются pickle,
+поэтому кортежи и прочие типы результата сохраняются как есть. Возвращаемые
+объекты разделяются между вызовами и не должны изменяться.
+
+В том же файле кэшируется текст, извлечённый из .docx (распаковка и разбор
+XML): ключ — путь, время изменения и размер файла.
+"""
+import hashlib
+import logging
+import os
+import pickle
+import sqlite3
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+from .hf_skill_extractor import extract_resume_skills
+from .ner_extractor import extract_resume_entities
+
+logger = logging.getLogger(__name__)
+
+# Путь к файлу кэша по умолчанию (относительно рабочей директории)
+DEFAULT_CACHE_PATH = Path("./data/cache/nlp.sqlite3")
+
+# Размер LRU в памяти процесса
+MEMORY_CACHE_SIZE = 1024
+
+
+def content_hash(text: str) -> str:
+    """
+    SHA-256 текста в шестнадцатеричном виде (64 символа).
+
+    Example:
+        >>> len(content_hash("Python developer"))
+        64
+    """
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class NLPDiskCache:
+    """
+    Дисковый кэш ключ-значение на SQLite.
+
+    WAL-режим позволяет нескольким процессам (ProcessPoolExecutor загрузчика)
+    читать и писать один файл одновременно.
+    """
+
+    def __init__(self, path: Path = DEFAULT_CACHE_PATH) -> None:
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._connection: Optional[sqlite3.Connection] = None
+        self._pid: Optional[int] = None
+
+    def _connect(self) -> sqlite3.Connection:
+        # Соединение, унаследованное через fork, в дочернем процессе не используется
+        if self._connection is None or self._pid != os.getpid():
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(str(self.path), timeout=30, check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS nlp_cache (key TEXT PRIMARY KEY, value BLOB NOT NULL)"
+            )
+            self._connection = connection
+            self._pid = os.getpid()
+        return self._connection
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            try:
+                row = self._connect().execute(
+                    "SELECT value FROM nlp_cache WHERE key = ?", (key,)
+                ).fetchone()
+            except sqlite3.Error as e:
+                logger.warning(f"Ошибка чтения кэша NLP: {e}")
+                return None
+        return pickle.loads(row[0]) if row else None
+
+    def set(self, key: str, value: Any) -> None:
+        payload = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        with self._lock:
+            try:
+                connection = self._connect()
+                connection.execute(
+                    "INSERT OR REPLACE INTO nlp_cache (key, value) VALUES (?, ?)", (key, payload)
+                )
+                connection.commit()
+            except sqlite3.Error as e:
+                logger.warning(f"Ошибка записи кэша NLP: {e}")
+
+
+_disk_cache = NLPDiskCache()
+
+
+def _through_disk(key: str, compute: Callable[[], Any]) -> Any:
+    value = _disk_cache.get(key)
+    if value is None:
+        value = compute()
+        _disk_cache.set(key, value)
+    return value
+
+
+# LRU в памяти процесса: ключ кэша -> результат
+_memory_cache: "OrderedDict[str, Any]" = OrderedDict()
+_memory_lock = threading.Lock()
+
+
+def _cached(key: str, compute: Callable[[], Any]) -> Any:
+    """Результат по ключу из LRU в памяти, затем с диска, иначе вычислить"""
+    with _memory_lock:
+        if key in _memory_cache:
+            _memory_cache.move_to_end(key)
+            return _memory_cache[key]
+
+    value = _through_disk(key, compute)
+
+    with _memory_lock:
+        _memory_cache[key] = value
+        _memory_cache.move_to_end(key)
+        while len(_memory_cache) > MEMORY_CACHE_SIZE:
+            _memory_cache.popitem(last=False)
+    return value
+
+
+def cached_resume_entities(resume_text: str, language: str = "en") -> Dict[str, Any]:
+    """
+    extract_resume_entities с кэшированием по хэшу текста.
+
+    Example:
+        >>> entities = cached_resume_entities(text)
+    """
+    return _cached(
+        f"entities:{language}:{content_hash(resume_text)}",
+        lambda: extract_resume_entities(resume_text, language),
+    )
+
+
+def cached_resume_skills(
+    resume_text: str, *, method: str = "ner", top_n: int = 10
+) -> Dict[str, Any]:
+    """
+    extract_resume_skills с кэшированием по хэшу текста.
+
+    Поддерживаются методы без candidate_skills (ner, pattern).
+
+    Example:
+        >>> skills = cached_resume_skills(text, method="pattern", top_n=30)
+    """
+    return _cached(
+        f"skills:{method}:{top_n}:{content_hash(resume_text)}",
+        lambda: extract_resume_skills(resume_text, method=method, top_n=top_n),
+    )
+
+
+def cached_docx_text(file_path: str) -> Dict[str, Any]:
+    """
+    extract_text_from_docx с кэшированием на диске.
+
+    Ключ включает mtime и размер файла, поэтому изменённый файл разбирается
+    заново. Результаты без текста (ошибки разбора) не сохраняются.
+
+    Example:
+        >>> text = cached_docx_text("data/uploads/3.docx").get("text", "")
+    """
+    from services.data_extractor.extract import extract_text_from_docx
+
+    stat = os.stat(file_path)
+    key = f"docx:{os.path.abspath(file_path)}:{stat.st_mtime_ns}:{stat.st_size}"
+    result = _disk_cache.get(key)
+    if result is None:
+        result = extract_text_from_docx(file_path)
+        if result.get("text"):
+            _disk_cache.set(key, result)
+    return result
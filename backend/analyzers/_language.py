@@ -0,0 +1,70 @@
+"""
+Определение языка текста резюме с кэшированием.
+
+langdetect написан на чистом Python и тратит несколько миллисекунд на вызов,
+а при повторном анализе (переанализ, повторы задач, пакетная обработка) один и
+тот же текст определяется снова. Язык определяется по началу текста длиной
+LANGUAGE_SAMPLE_SIZE; результат кэшируется в LRU по этому фрагменту.
+
+Ключом служит сам фрагмент: хэш строки Python вычисляется один раз и
+хранится в объекте, а ограниченная длина фрагмента ограничивает память кэша.
+
+Большинство резюме однозначны по алфавиту: текст только из ASCII считается
+английским, текст с преобладанием кириллицы - русским, и langdetect для них не
+вызывается. Смешанные и прочие тексты определяет langdetect.
+"""
+import functools
+import re
+from typing import Optional
+
+# Длина начала текста, по которому определяется язык
+LANGUAGE_SAMPLE_SIZE = 1000
+
+# Размер LRU определённых языков
+LANGUAGE_CACHE_SIZE = 4096
+
+# Минимум кириллических букв во фрагменте для определения русского по алфавиту
+MIN_CYRILLIC_LETTERS = 20
+
+_CYRILLIC_LETTER = re.compile(r"[\u0400-\u04FF]")
+_LATIN_LETTER = re.compile(r"[A-Za-z]")
+
+
+def _detect_by_script(sample: str) -> Optional[str]:
+    """
+    Определить язык по алфавиту, если он однозначен.
+
+    Returns:
+        'en' для текста только из ASCII, 'ru' при преобладании кириллицы,
+        иначе None (решает langdetect)
+    """
+    if sample.isascii():
+        return "en"
+    cyrillic = len(_CYRILLIC_LETTER.findall(sample))
+    if cyrillic >= MIN_CYRILLIC_LETTERS and cyrillic >= len(_LATIN_LETTER.findall(sample)):
+        return "ru"
+    return None
+
+
+@functools.lru_cache(maxsize=LANGUAGE_CACHE_SIZE)
+def _detect_sample(sample: str) -> str:
+    from langdetect import detect
+
+    return detect(sample)
+
+
+def detect_language_code(text: str) -> str:
+    """
+    Код языка текста по langdetect ('en', 'ru', ...).
+
+    Текст с однозначным алфавитом определяется без langdetect (см. описание
+    модуля). Исключения langdetect не перехватываются, чтобы вызывающий код
+    сохранял свою обработку: LangDetectException (не-ASCII текст без букв)
+    не кэшируется, ImportError возникает, если langdetect не установлен.
+
+    Example:
+        >>> detect_language_code("Опытный Python-разработчик")
+        'ru'
+    """
+    sample = text[:LANGUAGE_SAMPLE_SIZE]
+    return _detect_by_script(sample) or _detect_sample(sample)
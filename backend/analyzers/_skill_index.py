@@ -0,0 +1,109 @@
+"""
+Индекс написаний навыков на автомате Ахо-Корасик.
+
+Поиск навыков по шаблонам раньше запускал отдельное регулярное выражение на
+каждый навык из списка, то есть проходил текст резюме столько раз, сколько
+навыков в словаре. Автомат находит все написания за один проход по тексту.
+
+Используется pyahocorasick; если пакет не установлен, функции возвращают None
+и вызывающий код остаётся на прежнем поиске регулярными выражениями.
+
+Индексируются только статические списки навыков, передаваемые в
+extract_skills_pattern_matching (например, COMMON_SKILLS). Написания из
+SkillTaxonomy.variants сюда не входят: извлечение навыков выполняется без
+сессии базы данных (в воркерах Celery и синхронных скриптах), а таксономия
+доступна только через асинхронную сессию.
+"""
+import logging
+from typing import Any, Dict, FrozenSet, Iterable, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+def _is_word_char(char: str) -> bool:
+    """Символ класса \\w регулярных выражений"""
+    return char.isalnum() or char == "_"
+
+
+class SkillIndex:
+    """
+    Автомат поиска написаний навыков (в нижнем регистре) с границами слов.
+
+    Совпадение засчитывается по тем же правилам, что r'\\b' + re.escape(skill) + r'\\b':
+    на каждом краю написания должна быть граница между символом слова и не-словом.
+
+    Example:
+        >>> index = SkillIndex.build([("js", "javascript"), ("python", "python")])
+        >>> index.count("Python and JS")
+        {'python': 1, 'javascript': 1}
+    """
+
+    def __init__(self, automaton: Any) -> None:
+        self._automaton = automaton
+
+    @classmethod
+    def build(cls, spellings: Iterable[Tuple[str, str]]) -> Optional["SkillIndex"]:
+        """
+        Построить индекс из пар (написание, значение).
+
+        Returns:
+            SkillIndex или None, если pyahocorasick не установлен
+        """
+        try:
+            import ahocorasick
+        except ImportError as e:
+            logger.warning(f"pyahocorasick не установлен, используется поиск регулярными выражениями: {e}")
+            return None
+
+        automaton = ahocorasick.Automaton()
+        for spelling, value in spellings:
+            key = spelling.lower()
+            if key and key not in automaton:
+                automaton.add_word(key, (len(key), value))
+        automaton.make_automaton()
+        return cls(automaton)
+
+    def count(self, text: str) -> Dict[str, int]:
+        """
+        Найти написания в тексте за один проход.
+
+        Returns:
+            Словарь значение -> число вхождений, в порядке первого вхождения
+        """
+        haystack = text.lower()
+        last = len(haystack) - 1
+        counts: Dict[str, int] = {}
+        if last < 0 or len(self._automaton) == 0:
+            return counts
+
+        for end, (length, value) in self._automaton.iter(haystack):
+            start = end - length + 1
+            first_is_word = _is_word_char(haystack[start])
+            last_is_word = _is_word_char(haystack[end])
+            before_is_word = start > 0 and _is_word_char(haystack[start - 1])
+            after_is_word = end < last and _is_word_char(haystack[end + 1])
+            if first_is_word == before_is_word or last_is_word == after_is_word:
+                continue
+            counts[value] = counts.get(value, 0) + 1
+        return counts
+
+
+# Индексы для списков навыков extract_skills_pattern_matching (ключ - сам список)
+_skill_list_indexes: Dict[FrozenSet[str], Optional[SkillIndex]] = {}
+_SKILL_LIST_INDEXES_MAX = 16
+
+
+def get_skill_list_index(skill_list: Iterable[str]) -> Optional[SkillIndex]:
+    """
+    Индекс для набора навыков; значение совпадения - навык в исходном написании.
+
+    Индексы кэшируются по содержимому набора, поэтому COMMON_SKILLS строится
+    один раз на процесс.
+    """
+    key = frozenset(skill_list)
+    if key not in _skill_list_indexes:
+        if len(_skill_list_indexes) >= _SKILL_LIST_INDEXES_MAX:
+            _skill_list_indexes.pop(next(iter(_skill_list_indexes)))
+        _skill_list_indexes[key] = SkillIndex.build((skill, skill) for skill in key)
+    return _skill_list_indexes[key]
+
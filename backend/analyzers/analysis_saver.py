@@ -7,7 +7,8 @@
 from typing import Optional, Any, Dict, List
 from uuid import UUID
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, delete
+from sqlalchemy import delete, func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 
 from models.resume_analysis import ResumeAnalysis
 
@@ -52,33 +53,7 @@ async def save_resume_analysis(
     Returns:
         ResumeAnalysis: Созданная или обновленная запись анализа
     """
-    # Проверка существования анализа
-    existing = await db.execute(
-        select(ResumeAnalysis).where(ResumeAnalysis.resume_id == resume_id)
-    )
-    existing_analysis = existing.scalar_one_or_none()
-
-    if existing_analysis:
-        # Обновление существующего
-        existing_analysis.raw_text = raw_text
-        existing_analysis.language = language
-        existing_analysis.skills = skills
-        existing_analysis.keywords = keywords
-        existing_analysis.entities = entities
-        existing_analysis.quality_score = quality_score
-        existing_analysis.processing_time_seconds = processing_time_seconds
-        existing_analysis.analyzer_version = analyzer_version
-        existing_analysis.grammar_issues = grammar_issues
-        existing_analysis.warnings = warnings
-        existing_analysis.total_experience_months = total_experience_months
-        existing_analysis.education = education
-        existing_analysis.contact_info = contact_info
-        await db.flush()
-        return existing_analysis
-
-    # Создание нового
-    analysis = ResumeAnalysis(
-        resume_id=resume_id,
+    values = dict(
         raw_text=raw_text,
         language=language,
         skills=skills,
@@ -93,9 +68,20 @@ async def save_resume_analysis(
         education=education,
         contact_info=contact_info,
     )
-    db.add(analysis)
-    await db.flush()
-    return analysis
+
+    # Создание или обновление одним INSERT ... ON CONFLICT (resume_id) DO UPDATE
+    # вместо SELECT существующей записи и отдельного flush
+    statement = (
+        pg_insert(ResumeAnalysis)
+        .values(resume_id=resume_id, **values)
+        .on_conflict_do_update(
+            index_elements=[ResumeAnalysis.resume_id],
+            set_={**values, "updated_at": func.now()},
+        )
+        .returning(ResumeAnalysis)
+    )
+    result = await db.execute(statement, execution_options={"populate_existing": True})
+    return result.scalar_one()
 
 
 async def get_resume_analysis(
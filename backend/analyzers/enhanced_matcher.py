@@ -621,3 +621,26 @@ class EnhancedSkillMatcher:
             for skill, result in match_results.items()
             if result.get("matched", False) and result.get("confidence", 0) < threshold
         ]
+
+
+# Общий экземпляр: синонимы читаются из JSON один раз на процесс, а не на каждый запрос
+_default_matcher: Optional[EnhancedSkillMatcher] = None
+
+
+def get_enhanced_matcher() -> EnhancedSkillMatcher:
+    """
+    Получить общий экземпляр EnhancedSkillMatcher со встроенным файлом синонимов.
+
+    Синонимы загружаются сразу при создании, поэтому дальнейшие вызовы
+    только читают карты и экземпляр можно разделять между запросами.
+
+    Example:
+        >>> matcher = get_enhanced_matcher()
+        >>> results = matcher.match_multiple(resume_skills, required_skills)
+    """
+    global _default_matcher
+    if _default_matcher is None:
+        matcher = EnhancedSkillMatcher()
+        matcher.load_synonyms()
+        _default_matcher = matcher
+    return _default_matcher
@@ -5,6 +5,7 @@
 включая обработку перекрывающихся периодов, фильтрацию по навыкам и конвертацию
 между месяцами и годами.
 """
+import functools
 import logging
 import re
 from datetime import datetime
@@ -46,8 +47,15 @@ def _parse_date(date_str: Optional[str]) -> Optional[datetime]:
     if not isinstance(date_str, str):
         raise ValueError(f"Date must be string or None, got {type(date_str)}")
 
-    date_str = date_str.strip()
+    return _parse_date_string(date_str.strip())
 
+
+# Разбор перебирает форматы через исключения strptime, а одни и те же даты
+# ("2020-01", "Jan 2020") встречаются во многих резюме; datetime неизменяем,
+# поэтому результат можно разделять между вызовами
+@functools.lru_cache(maxsize=4096)
+def _parse_date_string(date_str: str) -> datetime:
+    """Разобрать строку даты без пробелов по краям (см. _parse_date)"""
     # Расширенный список форматов даты для попытки
     formats = [
         "%Y-%m-%d",     # 2023-02-01
@@ -293,42 +301,39 @@ def _merge_overlapping_periods(
     if not periods:
         return []
 
-    # Sort by start date
-    sorted_periods = sorted(
-        periods,
-        key=lambda p: datetime.fromisoformat(p["start_parsed"]),
+    # Each period is parsed once; open-ended periods run until the same "now"
+    now = datetime.now()
+    bounded = sorted(
+        (
+            (
+                datetime.fromisoformat(p["start_parsed"]),
+                datetime.fromisoformat(p["end_parsed"]) if p["end_parsed"] else now,
+                p,
+            )
+            for p in periods
+        ),
+        key=lambda item: item[0],
     )
 
     merged = []
-    current = sorted_periods[0].copy()
-
-    for period in sorted_periods[1:]:
-        current_start = datetime.fromisoformat(current["start_parsed"])
-        current_end = datetime.fromisoformat(
-            current["end_parsed"]
-            if current["end_parsed"]
-            else datetime.now().isoformat()
-        )
-        period_start = datetime.fromisoformat(period["start_parsed"])
-        period_end = datetime.fromisoformat(
-            period["end_parsed"]
-            if period["end_parsed"]
-            else datetime.now().isoformat()
-        )
+    current_start, current_end, first = bounded[0]
+    current = first.copy()
 
-        # Check if periods overlap
+    # Sweep in start order, extending the current period while the next one overlaps
+    for period_start, period_end, period in bounded[1:]:
         if _dates_overlap(current_start, current_end, period_start, period_end):
             # Merge periods
-            merged_start = min(current_start, period_start)
-            merged_end = max(current_end, period_end)
+            current_start = min(current_start, period_start)
+            current_end = max(current_end, period_end)
 
-            current["start_parsed"] = merged_start.isoformat()
-            current["end_parsed"] = merged_end.isoformat()
-            current["months"] = _calculate_months_between(merged_start, merged_end)
+            current["start_parsed"] = current_start.isoformat()
+            current["end_parsed"] = current_end.isoformat()
+            current["months"] = _calculate_months_between(current_start, current_end)
         else:
             # No overlap, add current and start new
             merged.append(current)
             current = period.copy()
+            current_start, current_end = period_start, period_end
 
     merged.append(current)
     return merged
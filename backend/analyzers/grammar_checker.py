@@ -6,7 +6,9 @@
 с автоматическим определением языка.
 """
 import logging
-from typing import Dict, List, Optional, Union, Tuple
+from typing import Any, Dict, List, Optional, Union, Tuple
+
+import httpx
 
 logger = logging.getLogger(__name__)
 
@@ -17,6 +19,68 @@ _language_tools: Dict[str, Optional["LanguageTool"]] = {
     "ru-RU": None,
 }
 
+# HTTP-клиент сервера LanguageTool: пул keep-alive соединений на процесс,
+# разделяемый потоками анализаторов
+_languagetool_client: Optional[httpx.Client] = None
+
+
+class _RemoteMatch:
+    """
+    Ошибка из ответа /v2/check с атрибутами language_tool_python.Match,
+    которые использует check_grammar.
+    """
+
+    def __init__(self, match: Dict[str, Any]) -> None:
+        rule = match.get("rule", {})
+        self.ruleId = rule.get("id", "unknown")
+        self.category = rule.get("category", {}).get("id")
+        self.message = match.get("message", "")
+        self.context = match.get("context", {}).get("text", "")
+        self.replacements = [r["value"] for r in match.get("replacements", [])]
+        self.offset = match.get("offset", 0)
+        self.errorLength = match.get("length", 0)
+
+
+class _RemoteLanguageTool:
+    """
+    Проверка через HTTP API отдельного сервера LanguageTool.
+
+    Сервер держит прогретую JVM для всех воркеров, а соединения с ним
+    переиспользуются между вызовами. Интерфейс check() совпадает с
+    language_tool_python.LanguageTool.
+    """
+
+    def __init__(self, url: str, lang_code: str) -> None:
+        self.url = url
+        self.lang_code = lang_code
+
+    def check(self, text: str) -> List[_RemoteMatch]:
+        global _languagetool_client
+
+        if _languagetool_client is None:
+            _languagetool_client = httpx.Client(
+                timeout=30.0,
+                limits=httpx.Limits(max_connections=8, max_keepalive_connections=8),
+                transport=httpx.HTTPTransport(retries=2),
+            )
+
+        response = _languagetool_client.post(
+            self.url, data={"text": text, "language": self.lang_code}
+        )
+        response.raise_for_status()
+        return [_RemoteMatch(match) for match in response.json().get("matches", [])]
+
+
+def _languagetool_url() -> Optional[str]:
+    """URL /v2/check из настройки languagetool_server или None для локального сервера"""
+    from config import get_settings
+
+    server = get_settings().languagetool_server
+    if not server:
+        return None
+    url = server.rstrip("/")
+    return url if url.endswith("/v2/check") else f"{url}/v2/check"
+
 
 def _detect_language(text: str) -> str:
     """
@@ -29,10 +93,12 @@ def _detect_language(text: str) -> str:
         Код обнаруженного языка ('en' или 'ru')
     """
     try:
-        from langdetect import detect, LangDetectException
+        from langdetect import LangDetectException
+
+        from ._language import detect_language_code
 
         try:
-            lang = detect(text)
+            lang = detect_language_code(text)
             logger.info(f"Обнаружен язык: {lang}")
             return lang
         except LangDetectException:
@@ -47,6 +113,9 @@ def _get_tool(language: str = "en") -> "LanguageTool":
     """
     Получить или инициализировать LanguageTool для указанного языка.
 
+    Если задан languagetool_server, возвращается HTTP-клиент этого сервера;
+    иначе language_tool_python запускает собственный локальный сервер.
+
     Args:
         language: Код языка ('en' для английского, 'ru' для русского)
 
@@ -70,6 +139,12 @@ def _get_tool(language: str = "en") -> "LanguageTool":
     lang_code = lang_map.get(language.lower(), "en-US")
 
     if _language_tools.get(lang_code) is None:
+        url = _languagetool_url()
+        if url:
+            logger.info(f"LanguageTool {lang_code}: сервер {url}")
+            _language_tools[lang_code] = _RemoteLanguageTool(url, lang_code)
+            return _language_tools[lang_code]
+
         try:
             from language_tool_python import LanguageTool
 
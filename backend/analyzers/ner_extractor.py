@@ -18,6 +18,10 @@ _nlp_models: Dict[str, Optional["spacy.language.Language"]] = {
 }
 
 
+# Компоненты конвейера SpaCy, результаты которых extract_entities не использует
+_UNUSED_PIPES = ["parser", "lemmatizer"]
+
+
 def _get_model(language: str = "en") -> "spacy.language.Language":
     """
     Получить или инициализировать модель SpaCy для указанного языка.
@@ -58,7 +62,9 @@ def _get_model(language: str = "en") -> "spacy.language.Language":
             logger.info(f"Загрузка модели SpaCy: {model_name} для языка: {lang}")
 
             try:
-                _nlp_models[lang] = spacy.load(model_name)
+                # Используются только doc.ents: синтаксический разбор и
+                # лемматизация не загружаются и не выполняются для каждого текста
+                _nlp_models[lang] = spacy.load(model_name, exclude=_UNUSED_PIPES)
             except OSError:
                 raise RuntimeError(
                     f"Модель SpaCy '{model_name}' не найдена. "
@@ -214,13 +220,14 @@ def extract_entities(
         if include_custom_skills:
             skills = _extract_technical_skills(text, language)
             if skills:
+                text_lower = text.lower()
                 entities_dict["SKILL"] = [
                     {
                         "text": skill,
                         "label": "SKILL",
                         "start": -1,  # На основе шаблона, без позиции
                         "end": -1,
-                        "count": text.lower().count(skill.lower()),
+                        "count": text_lower.count(skill.lower()),
                     }
                     for skill in skills
                 ]
@@ -258,25 +265,10 @@ def extract_entities(
         }
 
 
-def _extract_technical_skills(
-    text: str,
-    language: str = "en"
-) -> List[str]:
-    """
-    Extract technical skills using pattern matching.
-
-    This function uses regex patterns to identify common technical skills,
-    programming languages, frameworks, and tools in resume text.
-
-    Args:
-        text: Resume text to extract skills from
-        language: Document language ('en' or 'ru')
-
-    Returns:
-        List of unique technical skills found in text
-    """
-    # Common technical skill patterns
-    skill_patterns = [
+# Шаблоны технических навыков компилируются один раз при импорте модуля
+_SKILL_PATTERNS = tuple(
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
         # Programming languages
         r'\b(Python|Java|JavaScript|TypeScript|C\+\+|C#|Go|Rust|PHP|Ruby|Swift|Kotlin|Scala|R|MATLAB)\b',
         # Web frameworks
@@ -295,30 +287,51 @@ def _extract_technical_skills(
         r'\b(REST API|GraphQL|gRPC|Microservices|CI/CD|TDD|Agile|Scrum|Kanban)\b',
         # Version specific
         r'\b(Java \d+|Python 3\.\d+|Node\.js \d+|React \d+)\b',
-    ]
+    )
+)
 
-    text_lower = text.lower()
+# Строки разделов навыков и разделители внутри них
+_SKILL_SECTION_PATTERNS = tuple(
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r'(?:Skills|Technical Skills|Technologies|Tech Stack|Stack):?\s*([^\n]+)',
+        r'(?:Навыки|Технические навыки|Стек технологий):?\s*([^\n]+)',
+    )
+)
+_SKILL_SEPARATORS = re.compile(r'[,;·•\-\n]')
+
+
+def _extract_technical_skills(
+    text: str,
+    language: str = "en"
+) -> List[str]:
+    """
+    Extract technical skills using pattern matching.
+
+    This function uses regex patterns to identify common technical skills,
+    programming languages, frameworks, and tools in resume text.
+
+    Args:
+        text: Resume text to extract skills from
+        language: Document language ('en' or 'ru')
+
+    Returns:
+        List of unique technical skills found in text
+    """
     found_skills: Set[str] = set()
 
-    for pattern in skill_patterns:
-        matches = re.finditer(pattern, text, re.IGNORECASE)
-        for match in matches:
-            skill = match.group()
-            # Add both original and lowercase
-            found_skills.add(skill)
+    # Patterns overlap ("GitLab CI" and "GitLab", "Java 11" and "Java"), so each
+    # one is scanned separately rather than as a single alternation
+    for pattern in _SKILL_PATTERNS:
+        for match in pattern.finditer(text):
+            found_skills.add(match.group())
 
     # Additional skill extraction from common sections
-    skill_section_patterns = [
-        r'(?:Skills|Technical Skills|Technologies|Tech Stack|Stack):?\s*([^\n]+)',
-        r'(?:Навыки|Технические навыки|Стек технологий):?\s*([^\n]+)',
-    ]
-
-    for pattern in skill_section_patterns:
-        matches = re.finditer(pattern, text, re.IGNORECASE)
-        for match in matches:
+    for pattern in _SKILL_SECTION_PATTERNS:
+        for match in pattern.finditer(text):
             skills_text = match.group(1)
             # Split by common separators
-            potential_skills = re.split(r'[,;·•\-\n]', skills_text)
+            potential_skills = _SKILL_SEPARATORS.split(skills_text)
             for skill in potential_skills:
                 skill = skill.strip()
                 if len(skill) > 1 and len(skill) < 50:  # Reasonable skill length
@@ -15,7 +15,7 @@ import logging
 from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional
 
-from .enhanced_matcher import EnhancedSkillMatcher
+from .enhanced_matcher import get_enhanced_matcher
 from .tfidf_matcher import TfidfSkillMatcher, TfidfMatchResult
 from .vector_matcher import VectorSimilarityMatcher, VectorMatchResult, _HAS_SENTENCE_TRANSFORMERS
 
@@ -139,7 +139,7 @@ class UnifiedSkillMatcher:
         self.overall_threshold = overall_threshold
 
         # Инициализировать сопоставители
-        self.keyword_matcher = EnhancedSkillMatcher()
+        self.keyword_matcher = get_enhanced_matcher()
         self.tfidf_matcher = TfidfSkillMatcher(threshold=tfidf_threshold)
 
         if _HAS_SENTENCE_TRANSFORMERS:
@@ -11,6 +11,7 @@ from pathlib import Path
 from typing import Dict, List, Optional, Any
 
 from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import JSONResponse
 from pydantic import BaseModel, Field
 from sqlalchemy import select
@@ -29,6 +30,7 @@ from analyzers import (
 from database import get_db
 from models.resume import ResumeStatus
 from i18n.backend_translations import get_error_message, get_success_message
+from utils.resume_files import locate_resume_file
 
 logger = logging.getLogger(__name__)
 
@@ -159,11 +161,10 @@ def find_resume_file(resume_id: str, locale: str = "en") -> Path:
     Raises:
         HTTPException: Если файл резюме не найден
     """
-    # Пробуем распространённые расширения файлов
-    for ext in [".pdf", ".docx", ".PDF", ".DOCX"]:
-        file_path = UPLOAD_DIR / f"{resume_id}{ext}"
-        if file_path.exists():
-            return file_path
+    # Индекс путей в Redis, иначе один просмотр каталога (расширение без учёта регистра)
+    file_path = locate_resume_file(UPLOAD_DIR, resume_id)
+    if file_path is not None:
+        return file_path
 
     # Если не найден, возвращаем ошибку
     error_msg = get_error_message("file_not_found", locale)
@@ -298,7 +299,8 @@ async def analyze_resume(http_request: Request, request: AnalysisRequest, db: As
         logger.info(f"Начало анализа для resume_id: {request.resume_id}")
 
         # Шаг 1: Найти файл резюме
-        file_path = find_resume_file(request.resume_id, locale)
+        # Поиск обращается к Redis синхронно, поэтому выполняется в пуле потоков
+        file_path = await run_in_threadpool(find_resume_file, request.resume_id, locale)
         logger.info(f"Найден файл резюме: {file_path}")
 
         # Шаг 2: Извлечь текст из файла
@@ -306,10 +308,11 @@ async def analyze_resume(http_request: Request, request: AnalysisRequest, db: As
 
         # Шаг 3: Определить язык текста
         try:
-            from langdetect import detect, LangDetectException
+            from langdetect import LangDetectException
+            from analyzers._language import detect_language_code
 
             try:
-                detected_lang = detect(resume_text)
+                detected_lang = detect_language_code(resume_text)
                 # Нормализация к поддерживаемым языкам
                 language = "ru" if detected_lang == "ru" else "en"
             except LangDetectException:
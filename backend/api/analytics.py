@@ -235,10 +235,10 @@ async def get_quality_metrics(
         from models import MatchResult, Resume, ResumeAnalysis
 
         # Получение сессии базы данных
-        from database import get_db
+        from database import get_db_ro
 
         response_data = {}
-        async for db in get_db():
+        async for db in get_db_ro():
             # Общее количество резюме в базе данных
             total_resumes_result = await db.execute(
                 select(func.count(Resume.id))
@@ -276,11 +276,16 @@ async def get_quality_metrics(
                     "total_analyzed": 0
                 }
             else:
-                # Получение всех анализов для вычисления метрик
+                # Только нужные столбцы в виде кортежей: без построения
+                # ORM-объектов и identity map для каждого анализа
                 all_analyses = await db.execute(
-                    select(ResumeAnalysis)
+                    select(
+                        ResumeAnalysis.skills,
+                        ResumeAnalysis.entities,
+                        ResumeAnalysis.grammar_issues,
+                        ResumeAnalysis.processing_time_seconds,
+                    )
                 )
-                analyses = all_analyses.scalars().all()
 
                 # Вычисление метрик из данных ResumeAnalysis
                 total_keywords = 0
@@ -288,24 +293,24 @@ async def get_quality_metrics(
                 total_grammar_issues = 0
                 total_processing_time = 0.0
 
-                for analysis in analyses:
+                for skills, entities, grammar_issues, processing_time in all_analyses.tuples():
                     # Подсчёт ключевых слов
-                    if analysis.skills and isinstance(analysis.skills, list):
-                        total_keywords += len(analysis.skills)
+                    if skills and isinstance(skills, list):
+                        total_keywords += len(skills)
 
                     # Подсчёт сущностей
-                    if analysis.entities and isinstance(analysis.entities, dict):
-                        for key, value in analysis.entities.items():
+                    if entities and isinstance(entities, dict):
+                        for value in entities.values():
                             if isinstance(value, list):
                                 total_entities += len(value)
 
                     # Подсчёт грамматических проблем
-                    if analysis.grammar_issues and isinstance(analysis.grammar_issues, list):
-                        total_grammar_issues += len(analysis.grammar_issues)
+                    if grammar_issues and isinstance(grammar_issues, list):
+                        total_grammar_issues += len(grammar_issues)
 
                     # Суммирование времени обработки
-                    if analysis.processing_time_seconds:
-                        total_processing_time += analysis.processing_time_seconds
+                    if processing_time:
+                        total_processing_time += processing_time
 
                 entities_per_resume = total_entities / total_analyses if total_analyses > 0 else 15.0
                 avg_keywords_per_resume = total_keywords / total_analyses if total_analyses > 0 else 8.0
@@ -24,7 +24,7 @@ from analyzers import (
     extract_resume_entities,
     calculate_skill_experience,
     format_experience_summary,
-    EnhancedSkillMatcher,
+    get_enhanced_matcher,
 )
 
 logger = logging.getLogger(__name__)
@@ -194,10 +194,11 @@ def compare_multiple_resumes(
 
                 # Шаг 3: Определить язык
                 try:
-                    from langdetect import detect, LangDetectException
+                    from langdetect import LangDetectException
+                    from analyzers._language import detect_language_code
 
                     try:
-                        detected_lang = detect(resume_text)
+                        detected_lang = detect_language_code(resume_text)
                         language = "ru" if detected_lang == "ru" else "en"
                     except LangDetectException:
                         language = "en"
@@ -223,7 +224,7 @@ def compare_multiple_resumes(
                 logger.info(f"Extracted {len(resume_skills)} unique skills from resume")
 
                 # Шаг 5: Инициализировать улучшенный сопоставитель навыков
-                enhanced_matcher = EnhancedSkillMatcher()
+                enhanced_matcher = get_enhanced_matcher()
                 synonyms_map = enhanced_matcher.load_synonyms()
                 logger.info(f"Initialized enhanced skill matcher with {len(synonyms_map)} synonym mappings")
 
@@ -29,7 +29,7 @@ from analyzers import (
     extract_resume_entities,
     calculate_skill_experience,
     format_experience_summary,
-    EnhancedSkillMatcher,
+    get_enhanced_matcher,
     UnifiedSkillMatcher,
     get_unified_matcher,
 )
@@ -470,10 +470,11 @@ async def compare_resume_to_vacancy(
 
         # Шаг 3: Определить язык
         try:
-            from langdetect import detect, LangDetectException
+            from langdetect import LangDetectException
+            from analyzers._language import detect_language_code
 
             try:
-                detected_lang = detect(resume_text)
+                detected_lang = detect_language_code(resume_text)
                 language = "ru" if detected_lang == "ru" else "en"
             except LangDetectException:
                 language = "en"
@@ -526,7 +527,7 @@ async def compare_resume_to_vacancy(
         logger.info(f"Извлечено {len(resume_skills)} уникальных навыков из резюме")
 
         # Шаг 5: Инициализировать улучшенный сопоставитель навыков
-        enhanced_matcher = EnhancedSkillMatcher()
+        enhanced_matcher = get_enhanced_matcher()
         # Предварительная загрузка синонимов для логирования
         synonyms_map = enhanced_matcher.load_synonyms()
         logger.info(f"Инициализирован улучшенный сопоставитель с {len(synonyms_map)} отображениями синонимов")
@@ -1014,16 +1015,6 @@ async def compare_resume_to_vacancy_unified(
             vacancy_id = request.vacancy_data.get("id")
             vacancy_uuid = UUID(vacancy_id) if vacancy_id else None
 
-            # Проверить, существует ли уже результат сопоставления
-            existing_match = None
-            if vacancy_uuid:
-                existing_query = select(MatchResult).where(
-                    MatchResult.resume_id == resume_uuid,
-                    MatchResult.vacancy_id == vacancy_uuid
-                )
-                existing_result = await db.execute(existing_query)
-                existing_match = existing_result.scalar_one_or_none()
-
             # Подготовка данных сопоставления для сохранения
             match_percentage = round(match_result.overall_score * 100, 2)
             matched_skills_detailed = [
@@ -1035,48 +1026,29 @@ async def compare_resume_to_vacancy_unified(
                 for s in match_result.missing_skills
             ]
 
-            if existing_match:
-                # Обновить существующую запись
-                existing_match.match_percentage = match_percentage
-                existing_match.matched_skills = matched_skills_detailed
-                existing_match.missing_skills = missing_skills_detailed
-                existing_match.overall_score = match_result.overall_score
-                existing_match.keyword_score = match_result.keyword_score
-                existing_match.tfidf_score = match_result.tfidf_score
-                existing_match.vector_score = match_result.vector_score
-                existing_match.vector_similarity = match_result.vector_similarity
-                existing_match.recommendation = match_result.recommendation
-                existing_match.keyword_passed = match_result.keyword_passed
-                existing_match.tfidf_passed = match_result.tfidf_passed
-                existing_match.vector_passed = match_result.vector_passed
-                existing_match.tfidf_matched = match_result.tfidf_matched
-                existing_match.tfidf_missing = match_result.tfidf_missing
-                existing_match.matcher_version = "unified-v1"
-                logger.info(f"Обновлён существующий результат сопоставления: {existing_match.id}")
-            else:
-                # Создать новую запись результата сопоставления (только если есть vacancy_id)
-                if vacancy_uuid:
-                    new_match = MatchResult(
-                        resume_id=resume_uuid,
-                        vacancy_id=vacancy_uuid,
-                        match_percentage=match_percentage,
-                        matched_skills=matched_skills_detailed,
-                        missing_skills=missing_skills_detailed,
-                        overall_score=match_result.overall_score,
-                        keyword_score=match_result.keyword_score,
-                        tfidf_score=match_result.tfidf_score,
-                        vector_score=match_result.vector_score,
-                        vector_similarity=match_result.vector_similarity,
-                        recommendation=match_result.recommendation,
-                        keyword_passed=match_result.keyword_passed,
-                        tfidf_passed=match_result.tfidf_passed,
-                        vector_passed=match_result.vector_passed,
-                        tfidf_matched=match_result.tfidf_matched,
-                        tfidf_missing=match_result.tfidf_missing,
-                        matcher_version="unified-v1",
-                    )
-                    db.add(new_match)
-                    logger.info(f"Создан новый результат сопоставления для резюме {resume_uuid} и вакансии {vacancy_uuid}")
+            # Создать или обновить результат одним INSERT ... ON CONFLICT
+            # (только если есть vacancy_id)
+            if vacancy_uuid:
+                await MatchResult.bulk_upsert(db, [{
+                    "resume_id": resume_uuid,
+                    "vacancy_id": vacancy_uuid,
+                    "match_percentage": match_percentage,
+                    "matched_skills": matched_skills_detailed,
+                    "missing_skills": missing_skills_detailed,
+                    "overall_score": match_result.overall_score,
+                    "keyword_score": match_result.keyword_score,
+                    "tfidf_score": match_result.tfidf_score,
+                    "vector_score": match_result.vector_score,
+                    "vector_similarity": match_result.vector_similarity,
+                    "recommendation": match_result.recommendation,
+                    "keyword_passed": match_result.keyword_passed,
+                    "tfidf_passed": match_result.tfidf_passed,
+                    "vector_passed": match_result.vector_passed,
+                    "tfidf_matched": match_result.tfidf_matched,
+                    "tfidf_missing": match_result.tfidf_missing,
+                    "matcher_version": "unified-v1",
+                }])
+                logger.info(f"Сохранён результат сопоставления для резюме {resume_uuid} и вакансии {vacancy_uuid}")
 
             await db.commit()
 
@@ -11,6 +11,7 @@ from typing import Dict, Optional
 from uuid import UUID, uuid4
 
 from fastapi import APIRouter, Depends, File, HTTPException, Request, UploadFile, status
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import JSONResponse
 from pydantic import BaseModel, Field
 from sqlalchemy.exc import SQLAlchemyError
@@ -21,6 +22,7 @@ from config import get_settings
 from i18n.backend_translations import get_error_message, get_success_message
 from database import get_db
 from models.resume import Resume, ResumeStatus
+from utils.resume_files import forget_resume_file, register_resume_file
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
@@ -82,8 +84,8 @@ def validate_file_type(filename: str, content_type: str, locale: str = "en") ->
     """
     # Проверка расширения файла
     file_ext = Path(filename).suffix.lower()
-    if file_ext not in settings.allowed_file_types:
-        allowed = ", ".join(settings.allowed_file_types)
+    if file_ext not in settings.allowed_file_types_set:
+        allowed = ", ".join(sorted(settings.allowed_file_types_set))
         error_msg = get_error_message("invalid_file_type", locale, file_ext=file_ext, allowed=allowed)
         raise HTTPException(
             status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
@@ -211,6 +213,10 @@ async def upload_resume(
         await db.commit()
         await db.refresh(new_resume)
 
+        # Путь в индексе файлов: задачи анализа находят файл без перебора расширений.
+        # Redis вызывается синхронно, поэтому в пуле потоков, а не в event loop
+        await run_in_threadpool(register_resume_file, str(resume_id), file_path)
+
         # Получить переведённое сообщение об успехе
         success_message = get_success_message("file_uploaded", locale)
 
@@ -376,7 +382,7 @@ async def get_resume(request: Request, resume_id: str, db: AsyncSession = Depend
         extract_resume_keywords_hf as extract_resume_keywords,
         extract_resume_entities,
         check_grammar_resume,
-        EnhancedSkillMatcher,
+        get_enhanced_matcher,
     )
     from models.job_vacancy import JobVacancy
 
@@ -460,9 +466,9 @@ async def get_resume(request: Request, resume_id: str, db: AsyncSession = Depend
         logger.info(f"Running analysis for resume: {resume_id}")
 
         # Detect language for model selection
-        from langdetect import detect
+        from analyzers._language import detect_language_code
         try:
-            lang_code = detect(text[:1000])
+            lang_code = detect_language_code(text)
             # Map to our language format
             if lang_code == 'ru':
                 detected_language = 'ru'
@@ -504,7 +510,7 @@ async def get_resume(request: Request, resume_id: str, db: AsyncSession = Depend
             vacancy_result = await db.execute(vacancy_query)
             vacancies = vacancy_result.scalars().all()
 
-            matcher = EnhancedSkillMatcher()
+            matcher = get_enhanced_matcher()
             best_match_pct = 0
             best_match_data = None
 
@@ -630,6 +636,7 @@ async def delete_resume(
         # Delete file from disk if exists
         if file_path and file_path.exists():
             file_path.unlink()
+        await run_in_threadpool(forget_resume_file, resume_id)
 
         logger.info(f"Deleted resume: {resume_id}")
 
@@ -10,7 +10,7 @@ from typing import Optional
 from uuid import UUID
 
 from fastapi import APIRouter, HTTPException, Request, status, Depends, Query
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 from pydantic import BaseModel, Field
 from sqlalchemy import select, delete
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -18,7 +18,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 # Импорт анализаторов для сопоставления
 from analyzers import (
     extract_resume_entities,
-    EnhancedSkillMatcher,
+    get_enhanced_matcher,
 )
 from database import get_db
 from models.job_vacancy import JobVacancy
@@ -188,17 +188,20 @@ async def list_vacancies(
     request: Request,
     skip: int = 0,
     limit: int = 100,
+    skill: Optional[str] = Query(None, description="Only vacancies requiring this skill"),
     db: AsyncSession = Depends(get_db)
 ) -> JSONResponse:
     """
     List all job vacancies.
 
-    Returns a paginated list of all job vacancies.
+    Returns a paginated list of all job vacancies, optionally filtered by a
+    required skill.
 
     Args:
         request: FastAPI request object
         skip: Number of records to skip (pagination)
         limit: Maximum number of records to return
+        skill: Optional skill that must be present in required_skills
         db: Database session
 
     Returns:
@@ -210,7 +213,11 @@ async def list_vacancies(
     """
     try:
         # Query vacancies from database
-        query = select(JobVacancy).order_by(JobVacancy.created_at.desc()).offset(skip).limit(limit)
+        query = select(JobVacancy)
+        if skill:
+            # required_skills @> '["skill"]' обслуживается GIN-индексом
+            query = query.where(JobVacancy.required_skills.contains([skill]))
+        query = query.order_by(JobVacancy.created_at.desc()).offset(skip).limit(limit)
         result = await db.execute(query)
         vacancies = result.scalars().all()
 
@@ -238,7 +245,7 @@ async def match_resume_with_all_vacancies(
     request: Request,
     resume_id: str = Query(..., description="Resume file ID (without extension)"),
     db: AsyncSession = Depends(get_db)
-) -> JSONResponse:
+) -> ORJSONResponse:
     """
     Match a resume against ALL available vacancies.
 
@@ -275,21 +282,21 @@ async def match_resume_with_all_vacancies(
         # First, try to find resume in database to get file_path
         from models.resume import Resume as ResumeModel
 
-        resume_record = None
+        stored_path = None
         file_path = None
 
-        # Try to parse as UUID for database lookup
+        # Try to parse as UUID for database lookup (only the path is needed)
         try:
-            resume_query = select(ResumeModel).where(ResumeModel.id == UUID(resume_id))
+            resume_query = select(ResumeModel.file_path).where(ResumeModel.id == UUID(resume_id))
             resume_result = await db.execute(resume_query)
-            resume_record = resume_result.scalar_one_or_none()
+            stored_path = resume_result.scalar_one_or_none()
         except ValueError:
             # Not a valid UUID, skip database lookup
             pass
 
         # Determine file path
-        if resume_record and resume_record.file_path:
-            file_path = Path(resume_record.file_path)
+        if stored_path:
+            file_path = Path(stored_path)
         else:
             # Fallback: look for file by resume_id in uploads directory
             upload_dir = Path("data/uploads")
@@ -303,10 +310,21 @@ async def match_resume_with_all_vacancies(
                 detail=f"Resume file with ID '{resume_id}' not found",
             )
 
-        # Get all vacancies from database
-        query = select(JobVacancy)
+        # Get all vacancies from database: plain rows with the columns used for
+        # the response, without hydrating ORM objects and their descriptions
+        query = select(
+            JobVacancy.id,
+            JobVacancy.title,
+            JobVacancy.required_skills,
+            JobVacancy.additional_requirements,
+            JobVacancy.salary_min,
+            JobVacancy.salary_max,
+            JobVacancy.location,
+            JobVacancy.work_format,
+            JobVacancy.industry,
+        )
         result = await db.execute(query)
-        vacancies = result.scalars().all()
+        vacancies = result.all()
 
         logger.info(f"Matching resume {resume_id} against {len(vacancies)} vacancies")
 
@@ -338,7 +356,7 @@ async def match_resume_with_all_vacancies(
         logger.info(f"Extracted {len(resume_skills)} skills from resume")
 
         # Match against all vacancies
-        matcher = EnhancedSkillMatcher()
+        matcher = get_enhanced_matcher()
         matches = []
 
         for vacancy in vacancies:
@@ -398,7 +416,9 @@ async def match_resume_with_all_vacancies(
             f"Best match: {best_match['match_percentage'] if best_match else 0}%"
         )
 
-        return JSONResponse(
+        # Ranking depends on the fuzzy matcher, so it is computed here; the
+        # response is serialized with orjson in one pass
+        return ORJSONResponse(
             status_code=status.HTTP_200_OK,
             content={
                 "resume_id": resume_id,
@@ -541,7 +561,7 @@ async def match_resume_with_vacancy(
         required_skills = vacancy.required_skills or []
 
         # Match skills using EnhancedSkillMatcher
-        matcher = EnhancedSkillMatcher()
+        matcher = get_enhanced_matcher()
         match_results = matcher.match_multiple(
             resume_skills=resume_skills,
             required_skills=required_skills,
@@ -16,7 +16,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from database import get_db
 from models.job_vacancy import JobVacancy
-from analyzers import EnhancedSkillMatcher
+from analyzers import get_enhanced_matcher
 from analyzers.hf_skill_extractor import extract_resume_keywords, extract_resume_entities
 
 logger = logging.getLogger(__name__)
@@ -554,7 +554,7 @@ async def match_resume_against_all_vacancies(
             )
 
         # Сопоставление с каждой вакансией
-        matcher = EnhancedSkillMatcher()
+        matcher = get_enhanced_matcher()
         matches = []
 
         for vacancy in vacancies:
@@ -9,29 +9,39 @@ from typing import Dict, Any, Optional
 
 from celery import Celery, shared_task
 from celery.result import AsyncResult
+from celery.signals import worker_process_init
+from redis import Redis
+from redis.exceptions import RedisError
 
-from celery_config import get_celery_config
+from celery_config import celery_config
 from config import get_settings
-from tasks import (
-    analyze_resume_async,
-    batch_analyze_resumes,
-    generate_scheduled_reports,
-    process_all_pending_reports,
-)
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
 
 # Создание экземпляра приложения Celery
 # Используем 'backend.tasks' как имя основного модуля
-celery_app = Celery(
-    "backend.tasks",
-    config_source=get_celery_config(),
+celery_app = Celery("backend.tasks")
+
+# Конфигурация читается напрямую из атрибутов объекта CeleryConfig
+# без промежуточного словаря и повторного conf.update()
+celery_app.config_from_object(celery_config)
+
+# Ленивая регистрация модулей задач: модули импортируются только при запуске
+# воркера, а не при импорте celery_app (например, отправителями задач или beat),
+# поэтому тяжёлые ML-зависимости не загружаются там, где они не нужны
+celery_app.autodiscover_tasks(
+    [
+        "tasks.analysis_task",
+        "tasks.learning_tasks",
+        "tasks.report_generation",
+        "tasks.search_alerts_task",
+        "tasks.email_task",
+    ],
+    related_name=None,
+    force=False,
 )
 
-# Опционально: явная установка конфигурации из словаря
-celery_app.conf.update(get_celery_config())
-
 # Логирование информации о запуске
 logger.info("Приложение Celery инициализировано")
 logger.info(f"URL брокера: {settings.celery_broker_url}")
@@ -101,8 +111,10 @@ def add_numbers_task(self, x: int, y: int) -> int:
         >>> print(result.get())
         8
     """
-    if not isinstance(x, int) or not isinstance(y, int):
-        error_msg = f"Оба входных значения должны быть целыми числами, получено {type(x)} и {type(y)}"
+    # Проверка точного типа обходится без обхода MRO; сообщение об ошибке
+    # форматируется только на редком пути отказа
+    if type(x) is not int or type(y) is not int:
+        error_msg = "Оба входных значения должны быть целыми числами, получено %r и %r" % (type(x), type(y))
         logger.error(error_msg)
         raise ValueError(error_msg)
 
@@ -239,6 +251,39 @@ def get_task_status(task_id: str) -> Dict[str, Any]:
     return status_info
 
 
+def get_redis_client() -> Redis:
+    """
+    Получить клиент Redis, разделяющий пул соединений с бэкендом результатов Celery.
+
+    Используйте этот клиент для любых ad-hoc запросов к Redis вместо создания
+    нового подключения по URL: так приложение и Celery работают через один пул.
+
+    Returns:
+        Клиент Redis бэкенда результатов Celery
+
+    Example:
+        >>> from celery_app import get_redis_client
+        >>> get_redis_client().ping()
+        True
+    """
+    return celery_app.backend.client
+
+
+@worker_process_init.connect
+def warm_up_redis_connection(**kwargs: Any) -> None:
+    """
+    Открыть соединение с Redis бэкенда результатов при старте процесса воркера.
+
+    Пул соединений создаётся заново в каждом процессе после fork; без прогрева
+    TCP-подключение открывалось бы на первом update_state первой задачи.
+    Ошибка не мешает запуску: соединение будет открыто при первом обращении.
+    """
+    try:
+        get_redis_client().ping()
+    except RedisError as e:
+        logger.warning(f"Не удалось подключиться к Redis при старте процесса воркера: {e}")
+
+
 def revoke_task(task_id: str, terminate: bool = False) -> Dict[str, Any]:
     """
     Отменить или завершить выполняющуюся задачу Celery.
@@ -277,10 +322,7 @@ __all__ = [
     "health_check_task",
     "add_numbers_task",
     "long_running_task",
-    "analyze_resume_async",
-    "batch_analyze_resumes",
-    "generate_scheduled_reports",
-    "process_all_pending_reports",
     "get_task_status",
+    "get_redis_client",
     "revoke_task",
 ]
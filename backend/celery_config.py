@@ -5,7 +5,16 @@
 конфигурации приложения. Он настраивает брокер, бэкенд результатов и поведение задач.
 """
 import logging
-from typing import Dict, Any
+import socket
+from dataclasses import asdict, dataclass, field
+from datetime import date, datetime, time
+from decimal import Decimal
+from typing import Any, Dict, List, Tuple, Type
+from uuid import UUID
+
+import msgpack
+import orjson
+from kombu.serialization import register
 
 from config import get_settings
 
@@ -13,62 +22,173 @@ logger = logging.getLogger(__name__)
 settings = get_settings()
 
 
-# Словарь конфигурации Celery
-# Эта конфигурация используется приложением Celery в tasks.py
-celery_config: Dict[str, Any] = {
+def _orjson_default(obj: Any) -> Any:
+    """Сериализовать типы, которые orjson не поддерживает нативно."""
+    if isinstance(obj, Decimal):
+        return str(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def _orjson_dumps(obj: Any) -> bytes:
+    """Закодировать полезную нагрузку задачи в JSON-байты через orjson."""
+    return orjson.dumps(obj, default=_orjson_default, option=orjson.OPT_NON_STR_KEYS)
+
+
+# Регистрация сериализатора orjson в Kombu. Формат на проводе остаётся
+# application/json, поэтому сообщения совместимы со стандартным "json",
+# но кодирование/декодирование выполняется быстрее и без промежуточной str.
+register(
+    "orjson",
+    _orjson_dumps,
+    orjson.loads,
+    content_type="application/json",
+    content_encoding="utf-8",
+)
+
+
+def _msgpack_default(obj: Any) -> Any:
+    """
+    Привести к строкам значения, для которых в msgpack нет типа.
+
+    Даты и время записываются в ISO 8601, Decimal и UUID - строкой.
+    """
+    if isinstance(obj, (datetime, date, time)):
+        return obj.isoformat()
+    if isinstance(obj, (Decimal, UUID)):
+        return str(obj)
+    raise TypeError(f"Type is not msgpack serializable: {type(obj).__name__}")
+
+
+def _msgpack_dumps(obj: Any) -> bytes:
+    """Закодировать результат задачи в msgpack."""
+    return msgpack.packb(obj, default=_msgpack_default, use_bin_type=True)
+
+
+def _msgpack_loads(data: bytes) -> Any:
+    """Декодировать msgpack; строковые ключи и значения возвращаются как str."""
+    return msgpack.unpackb(data, raw=False, strict_map_key=False)
+
+
+# Результаты задач (вложенные результаты анализа - десятки КБ) хранятся в
+# msgpack: компактнее JSON и быстрее разбирается. Регистрация заменяет
+# встроенный в Kombu "msgpack" тем же content type, добавляя типы выше
+register(
+    "msgpack",
+    _msgpack_dumps,
+    _msgpack_loads,
+    content_type="application/x-msgpack",
+    content_encoding="binary",
+)
+
+
+# Параметры TCP keepalive для соединений с Redis (брокер и бэкенд результатов).
+# Константы TCP_KEEP* доступны не на всех платформах, поэтому берём только существующие.
+_tcp_keepalive_options: Dict[int, int] = {
+    getattr(socket, name): value
+    for name, value in (("TCP_KEEPIDLE", 30), ("TCP_KEEPINTVL", 10), ("TCP_KEEPCNT", 3))
+    if hasattr(socket, name)
+}
+
+
+@dataclass(slots=True)
+class CeleryConfig:
+    """
+    Типизированная конфигурация Celery.
+
+    Каждое поле соответствует ключу настроек Celery. Благодаря __slots__
+    опечатка в имени ключа при обновлении сразу приводит к AttributeError.
+    """
+
     # Настройки брокера
-    "broker_url": settings.celery_broker_url,
-    "result_backend": settings.celery_result_backend,
-    "broker_connection_retry_on_startup": True,
+    broker_url: str
+    result_backend: str
+    broker_connection_retry_on_startup: bool = True
+    broker_pool_limit: int = 20  # Общий пул соединений с брокером на процесс
+    broker_transport_options: Dict[str, Any] = field(default_factory=lambda: {
+        "socket_keepalive": True,
+        "socket_keepalive_options": dict(_tcp_keepalive_options),
+        "health_check_interval": 30,
+    })
+    redis_socket_keepalive: bool = True  # Keepalive для соединений бэкенда результатов
+    # Таймаут подключения к Redis бэкенда (секунды): при недоступном Redis ad-hoc
+    # запросы через get_redis_client() быстро получают ошибку, а не ждут TCP-таймаут
+    redis_socket_connect_timeout: float = 2.0
+    redis_backend_health_check_interval: int = 30
 
     # Настройки задач
-    "task_serializer": "json",
-    "result_serializer": "json",
-    "accept_content": ["json"],
-    "timezone": "UTC",
-    "enable_utc": True,
+    task_serializer: str = "orjson"
+    result_serializer: str = "msgpack"
+    accept_content: List[str] = field(default_factory=lambda: ["orjson", "json"])
+    # orjson/json остаются, чтобы читались результаты, записанные до перехода на msgpack
+    result_accept_content: List[str] = field(
+        default_factory=lambda: ["msgpack", "orjson", "json"]
+    )
+    timezone: str = "UTC"
+    enable_utc: bool = True
 
     # Настройки выполнения задач
-    "task_acks_late": True,  # Подтверждение задачи после выполнения (надёжность)
-    "task_reject_on_worker_lost": True,  # Повторная постановка задачи при смерти воркера
-    "task_track_started": True,  # Отслеживание начала задач
-    "task_time_limit": 3600,  # Жёсткий лимит: 1 час (60 минут * 60 секунд)
-    "task_soft_time_limit": 3300,  # Мягкий лимит: 55 минут (позволяет корректное завершение)
+    task_acks_late: bool = True  # Подтверждение задачи после выполнения (надёжность)
+    task_reject_on_worker_lost: bool = True  # Повторная постановка задачи при смерти воркера
+    task_track_started: bool = True  # Отслеживание начала задач
+    task_time_limit: int = 3600  # Жёсткий лимит: 1 час (60 минут * 60 секунд)
+    task_soft_time_limit: int = 3300  # Мягкий лимит: 55 минут (позволяет корректное завершение)
 
     # Настройки результатов
-    "result_expires": 86400,  # Результаты истекают через 24 часа (в секундах)
-    "result_compression": "gzip",  # Сжатие результатов для экономии места
+    result_expires: int = 86400  # Результаты истекают через 24 часа (в секундах)
+    result_compression: str = "zstd"  # Сжатие результатов: степень как у gzip, заметно быстрее
 
     # Настройки воркеров
-    "worker_prefetch_multiplier": 1,  # Отключение префетчинга для долгих задач
-    "worker_max_tasks_per_child": 100,  # Перезапуск воркера после 100 задач (управление памятью)
+    # Префетч для коротких задач; воркер очереди analysis запускается
+    # с --prefetch-multiplier=1, чтобы долгие задачи не резервировались заранее
+    worker_prefetch_multiplier: int = 4
+    # Перезапуск процесса воркера после 1000 задач (управление памятью); загруженные
+    # ML-модели живут в процессе, поэтому частый перезапуск означал бы их повторную загрузку
+    worker_max_tasks_per_child: int = 1000
+    # Время на запуск дочернего процесса (по умолчанию 4 с). При заданном
+    # ANALYSIS_WARMUP_LANGUAGES обработчик worker_process_init загружает NER-конвейер,
+    # SpaCy и LanguageTool - это десятки секунд, а при пустом кэше моделей ещё и
+    # загрузка из сети; без запаса Celery убивал бы процессы и перезапускал их по кругу
+    worker_proc_alive_timeout: float = 300.0
 
     # Маршрутизация задач (можно расширить для специфических очередей)
-    "task_routes": {
+    task_routes: Dict[str, Dict[str, str]] = field(default_factory=lambda: {
         "tasks.analysis_task.analyze_resume_async": {"queue": "analysis"},
         "tasks.analysis_task.*": {"queue": "analysis"},
         "tasks.learning_tasks.aggregate_feedback_and_generate_synonyms": {"queue": "learning"},
         "tasks.learning_tasks.review_and_activate_synonyms": {"queue": "learning"},
         "tasks.learning_tasks.periodic_feedback_aggregation": {"queue": "learning"},
         "tasks.learning_tasks.*": {"queue": "learning"},
-    },
+    })
 
     # Приоритет задач (если понадобится в будущем)
-    "task_default_priority": 5,
-    "worker_disable_rate_limits": False,
+    task_default_priority: int = 5
+    worker_disable_rate_limits: bool = False
 
     # Мониторинг
-    "worker_send_task_events": True,  # Включение событий задач для мониторинга Flower
-    "task_send_sent_event": True,  # Отправка событий отправки задач
+    worker_send_task_events: bool = True  # Включение событий задач для мониторинга Flower
+    task_send_sent_event: bool = True  # Отправка событий отправки задач
 
     # Обработка ошибок
-    "task_autoretry_for": (Exception,),  # Автоматическая повторная попытка при исключениях
-    "task_retry_kwargs": {"max_retries": 3, "countdown": 60},  # Настройки повторных попыток
+    task_autoretry_for: Tuple[Type[BaseException], ...] = (Exception,)  # Автоматическая повторная попытка при исключениях
+    task_retry_kwargs: Dict[str, int] = field(
+        default_factory=lambda: {"max_retries": 3, "countdown": 60}
+    )  # Настройки повторных попыток
 
     # Оптимизация производительности
-    "broker_connection_retry": True,
-    "broker_connection_max_retries": 10,
-}
+    broker_connection_retry: bool = True
+    broker_connection_max_retries: int = 10
+
+    def asdict(self) -> Dict[str, Any]:
+        """Получить конфигурацию в виде словаря для передачи в Celery."""
+        return asdict(self)
+
+
+# Экземпляр конфигурации Celery
+# Эта конфигурация используется приложением Celery в tasks.py
+celery_config = CeleryConfig(
+    broker_url=settings.celery_broker_url,
+    result_backend=settings.celery_result_backend,
+)
 
 
 def get_celery_config() -> Dict[str, Any]:
@@ -87,7 +207,7 @@ def get_celery_config() -> Dict[str, Any]:
         >>> print(config['broker_url'])
         'redis://localhost:6379/0'
     """
-    return celery_config
+    return celery_config.asdict()
 
 
 def update_celery_config(**kwargs: Any) -> None:
@@ -100,17 +220,17 @@ def update_celery_config(**kwargs: Any) -> None:
     Args:
         **kwargs: Configuration key-value pairs to update
 
+    Raises:
+        AttributeError: Если ключ не является полем CeleryConfig
+
     Example:
         >>> update_celery_config(task_time_limit=1800)
         >>> # Updates task_time_limit to 30 minutes
     """
     for key, value in kwargs.items():
-        if key in celery_config:
-            old_value = celery_config[key]
-            celery_config[key] = value
-            logger.info(f"Updated Celery config: {key} = {old_value} -> {value}")
-        else:
-            logger.warning(f"Attempted to update non-existent config key: {key}")
+        old_value = getattr(celery_config, key)
+        setattr(celery_config, key, value)
+        logger.info(f"Updated Celery config: {key} = {old_value} -> {value}")
 
 
 # Log configuration on import
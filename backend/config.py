@@ -5,8 +5,9 @@
 из переменных окружения с разумными значениями по умолчанию.
 """
 import logging
+from functools import cached_property
 from pathlib import Path
-from typing import List, Optional
+from typing import FrozenSet, Optional
 
 from pydantic import AnyUrl, Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -29,6 +30,17 @@ class Settings(BaseSettings):
         max_upload_size_mb: Максимальный размер загружаемого файла в мегабайтах
         allowed_file_types: Список разрешённых расширений файлов через запятую
         analysis_timeout_seconds: Максимальное время анализа резюме
+        analysis_warmup_languages: Языки, для которых процесс воркера анализа
+            загружает модели при старте (через запятую; пусто - не загружать)
+        analysis_torch_threads: Число потоков PyTorch в процессе воркера анализа
+            (0 - значение PyTorch по умолчанию, по числу ядер)
+        ner_int8_quantization: Квантизовать линейные слои NER-моделей в INT8
+        smtp_host: Хост SMTP-сервера (пусто - письма только логируются)
+        smtp_port: Порт SMTP-сервера
+        smtp_user: Пользователь SMTP (пусто - без аутентификации)
+        smtp_password: Пароль SMTP
+        smtp_from: Адрес отправителя писем
+        smtp_tls: Включать STARTTLS после подключения
         log_level: Уровень логирования (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         celery_broker_url: URL брокера Celery
         celery_result_backend: URL бэкенда результатов Celery
@@ -102,6 +114,55 @@ class Settings(BaseSettings):
         description="Максимальное время анализа резюме в секундах",
     )
 
+    analysis_warmup_languages: str = Field(
+        default="",
+        description="Языки моделей, загружаемых при старте процесса воркера анализа (через запятую)",
+    )
+
+    analysis_torch_threads: int = Field(
+        default=0,
+        ge=0,
+        description="Число потоков PyTorch в процессе воркера анализа (0 - по умолчанию)",
+    )
+
+    ner_int8_quantization: bool = Field(
+        default=False,
+        description="Динамическая INT8-квантизация NER-моделей для инференса на CPU",
+    )
+
+    # Конфигурация email
+    smtp_host: str = Field(
+        default="",
+        description="Хост SMTP-сервера (пусто - письма только логируются)",
+    )
+
+    smtp_port: int = Field(
+        default=587,
+        ge=1,
+        le=65535,
+        description="Порт SMTP-сервера",
+    )
+
+    smtp_user: str = Field(
+        default="",
+        description="Пользователь SMTP (пусто - без аутентификации)",
+    )
+
+    smtp_password: str = Field(
+        default="",
+        description="Пароль SMTP",
+    )
+
+    smtp_from: str = Field(
+        default="noreply@resume-analysis.com",
+        description="Адрес отправителя писем",
+    )
+
+    smtp_tls: bool = Field(
+        default=True,
+        description="Включать STARTTLS после подключения к SMTP-серверу",
+    )
+
     # Конфигурация логирования
     log_level: str = Field(
         default="INFO",
@@ -129,6 +190,18 @@ class Settings(BaseSettings):
             )
         return v
 
+    @field_validator("allowed_file_types")
+    @classmethod
+    def validate_allowed_file_types(cls, v: str) -> str:
+        """Нормализовать список расширений: нижний регистр и ведущая точка."""
+        extensions = []
+        for ext in v.split(","):
+            ext = ext.strip().lower()
+            if not ext:
+                continue
+            extensions.append(ext if ext.startswith(".") else f".{ext}")
+        return ",".join(extensions)
+
     @field_validator("log_level")
     @classmethod
     def validate_log_level(cls, v: str) -> str:
@@ -145,16 +218,31 @@ class Settings(BaseSettings):
         """Преобразовать max_upload_size_mb в байты."""
         return self.max_upload_size_mb * 1024 * 1024
 
-    @property
-    def cors_origins(self) -> List[str]:
-        """Получить список разрешённых источников CORS."""
-        return [
+    @cached_property
+    def cors_origins(self) -> FrozenSet[str]:
+        """
+        Получить множество разрешённых источников CORS.
+
+        Вычисляется один раз на экземпляр настроек: CORS middleware проверяет
+        источник на каждом запросе, и поиск в frozenset выполняется за O(1).
+        """
+        return frozenset({
             self.frontend_url,
             "http://localhost:3000",
             "http://127.0.0.1:3000",
             "http://localhost:5173",
             "http://127.0.0.1:5173",
-        ]
+        })
+
+    @cached_property
+    def allowed_file_types_set(self) -> FrozenSet[str]:
+        """
+        Получить множество разрешённых расширений файлов.
+
+        Строка allowed_file_types разбирается один раз, после чего проверка
+        расширения загружаемого файла сводится к поиску в frozenset.
+        """
+        return frozenset(self.allowed_file_types.split(","))
 
     def get_db_url_async(self) -> str:
         """
@@ -5,18 +5,23 @@
 зависимостей для эндпоинтов FastAPI.
 """
 import logging
-from typing import AsyncGenerator
+from contextvars import ContextVar
+from typing import AsyncGenerator, Optional
 
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy import text
 
 from config import get_settings
 from models.base import Base
+from utils.json_codec import json_deserializer, json_serializer
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
 
-# Создание асинхронного движка с драйвером asyncpg
+
+# Создание асинхронного движка с драйвером asyncpg. JSON/JSONB-столбцы
+# кодируются и разбираются orjson: диалект asyncpg регистрирует эти функции
+# как кодеки json/jsonb соединения, поэтому значения приходят уже разобранными
 engine = create_async_engine(
     settings.get_db_url_async(),
     echo=settings.log_level == "DEBUG",
@@ -24,6 +29,8 @@ engine = create_async_engine(
     pool_pre_ping=True,
     pool_size=10,
     max_overflow=20,
+    json_serializer=json_serializer,
+    json_deserializer=json_deserializer,
 )
 
 # Создание фабрики асинхронных сессий
@@ -35,6 +42,22 @@ async_session_maker = async_sessionmaker(
     autoflush=False,
 )
 
+# Фабрика сессий только для чтения: движок в режиме AUTOCOMMIT разделяет пул
+# с основным, но не отправляет BEGIN/COMMIT вокруг каждого запроса
+read_only_session_maker = async_sessionmaker(
+    engine.execution_options(isolation_level="AUTOCOMMIT"),
+    class_=AsyncSession,
+    expire_on_commit=False,
+    autoflush=False,
+)
+
+# Сессия, открытая get_db() в текущем контексте (запросе). Каждый запрос
+# обрабатывается в отдельной asyncio-задаче с собственной копией контекста,
+# поэтому повторные вызовы get_db() в рамках одного запроса переиспользуют сессию
+_current_session: ContextVar[Optional[AsyncSession]] = ContextVar(
+    "current_db_session", default=None
+)
+
 
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """
@@ -42,6 +65,7 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
 
     Эта функция используется как зависимость FastAPI для предоставления
     сессий базы данных эндпоинтам. Автоматически обрабатывает очистку сессий.
+    Повторные вызовы в пределах одного запроса получают уже открытую сессию.
 
     Yields:
         AsyncSession: Асинхронная сессия SQLAlchemy
@@ -52,7 +76,14 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
             result = await db.execute(select(Item))
             return result.scalars().all()
     """
+    current = _current_session.get()
+    if current is not None:
+        # Сессией управляет внешний вызов get_db(): он выполнит commit/rollback
+        yield current
+        return
+
     async with async_session_maker() as session:
+        _current_session.set(session)
         try:
             yield session
             await session.commit()
@@ -60,9 +91,31 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
             await session.rollback()
             raise
         finally:
+            _current_session.set(None)
             await session.close()
 
 
+async def get_db_ro() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Внедрение зависимостей для сессий базы данных только для чтения.
+
+    Используется эндпоинтами, которые выполняют только SELECT-запросы
+    (статусы, аналитика). Сессия работает в режиме AUTOCOMMIT, поэтому
+    изменения через неё не должны выполняться.
+
+    Yields:
+        AsyncSession: Асинхронная сессия SQLAlchemy в режиме AUTOCOMMIT
+
+    Example:
+        @router.get("/stats")
+        async def get_stats(db: AsyncSession = Depends(get_db_ro)):
+            result = await db.execute(select(func.count(Item.id)))
+            return result.scalar()
+    """
+    async with read_only_session_maker() as session:
+        yield session
+
+
 async def init_db(create_tables: bool = True) -> None:
     """
     Инициализация подключения к базе данных и создание таблиц при необходимости.
@@ -99,6 +152,10 @@ async def init_db(create_tables: bool = True) -> None:
                     Report,
                     ScheduledReport,
                 )
+                # Расширение для trigram-индекса custom_synonym_terms
+                await conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+                # Тип citext для skill_taxonomies.skill_name
+                await conn.execute(text("CREATE EXTENSION IF NOT EXISTS citext"))
                 # Создание всех таблиц
                 await conn.run_sync(Base.metadata.create_all)
                 logger.info("Таблицы базы данных успешно созданы")
@@ -10,6 +10,7 @@ from .backend_translations import (
     get_success_message,
     get_validation_message,
     get_message,
+    MsgKey,
     SUPPORTED_LANGUAGES,
     DEFAULT_LANGUAGE,
 )
@@ -19,6 +20,7 @@ __all__ = [
     "get_success_message",
     "get_validation_message",
     "get_message",
+    "MsgKey",
     "SUPPORTED_LANGUAGES",
     "DEFAULT_LANGUAGE",
 ]
@@ -6,13 +6,17 @@
 что и другие модули backend, с полными docstrings, подсказками типов и обработкой ошибок.
 """
 import logging
-from typing import Dict, Optional, Any
+import sys
+from enum import IntEnum
+from functools import lru_cache
+from string import Formatter
+from typing import Dict, FrozenSet, Optional, Any, Tuple, Union
 
 logger = logging.getLogger(__name__)
 
 
 # Константы языков
-SUPPORTED_LANGUAGES = ["en", "ru"]
+SUPPORTED_LANGUAGES: FrozenSet[str] = frozenset({"en", "ru"})
 DEFAULT_LANGUAGE = "en"
 
 
@@ -171,10 +175,95 @@ VALIDATION_MESSAGES: Dict[str, Dict[str, str]] = {
 }
 
 
+# Интернирование ключей сообщений: ключи из вызывающего кода (литералы, которые
+# Python интернирует сам) сравниваются с ключами словарей по идентичности
+for _messages in (ERROR_MESSAGES, SUCCESS_MESSAGES, VALIDATION_MESSAGES):
+    for _lang in _messages:
+        _messages[_lang] = {sys.intern(key): template for key, template in _messages[_lang].items()}
+del _messages, _lang
+
+
+# Порядок языков в таблицах шаблонов (индекс языка = позиция в кортеже)
+_LANGUAGES: Tuple[str, ...] = ("en", "ru")
+_LANG_INDEX: Dict[str, int] = {lang: index for index, lang in enumerate(_LANGUAGES)}
+
+
+# Стабильные целочисленные идентификаторы всех ключей сообщений
+MsgKey = IntEnum(
+    "MsgKey",
+    [
+        key
+        for messages in (ERROR_MESSAGES, SUCCESS_MESSAGES, VALIDATION_MESSAGES)
+        for key in messages[DEFAULT_LANGUAGE]
+    ],
+    start=0,
+)
+
+# Перевод строкового ключа (или самого MsgKey) в MsgKey одним поиском
+_KEY_IDS: Dict[Union[str, MsgKey], MsgKey] = {
+    **{key.name: key for key in MsgKey},
+    **{key: key for key in MsgKey},
+}
+
+
+def _build_tables(messages: Dict[str, Dict[str, str]]) -> Tuple[Tuple[Optional[str], ...], ...]:
+    """
+    Построить таблицы шаблонов одной категории сообщений: [индекс языка][MsgKey].
+
+    Для ключей других категорий в таблице хранится None; отсутствующий
+    перевод заранее заменяется шаблоном языка по умолчанию.
+    """
+    default_templates = messages[DEFAULT_LANGUAGE]
+    return tuple(
+        tuple(messages[lang].get(key.name, default_templates.get(key.name)) for key in MsgKey)
+        for lang in _LANGUAGES
+    )
+
+
+# Таблицы шаблонов по категориям: два обращения по индексу вместо хеширования
+_ERROR_TABLES = _build_tables(ERROR_MESSAGES)
+_SUCCESS_TABLES = _build_tables(SUCCESS_MESSAGES)
+_VALIDATION_TABLES = _build_tables(VALIDATION_MESSAGES)
+
+
+# Индекс "ключ сообщения -> (MsgKey, таблицы категории)", построенный один раз при импорте.
+# При совпадении ключей приоритет: ошибки > успех > валидация (как в get_message).
+_KEY_INDEX: Dict[Union[str, MsgKey], Tuple[MsgKey, Tuple[Tuple[Optional[str], ...], ...]]] = {
+    key: (_KEY_IDS[key], tables)
+    for messages, tables in (
+        (VALIDATION_MESSAGES, _VALIDATION_TABLES),
+        (SUCCESS_MESSAGES, _SUCCESS_TABLES),
+        (ERROR_MESSAGES, _ERROR_TABLES),
+    )
+    for name in messages[DEFAULT_LANGUAGE]
+    for key in (name, MsgKey[name])
+}
+
+
+# Шаблоны, содержащие поля подстановки; остальные возвращаются без str.format
+_TEMPLATES_WITH_FIELDS: FrozenSet[str] = frozenset(
+    template
+    for tables in (_ERROR_TABLES, _SUCCESS_TABLES, _VALIDATION_TABLES)
+    for templates in tables
+    for template in templates
+    if template is not None
+    and any(field_name is not None for _, field_name, _, _ in Formatter().parse(template))
+)
+
+
+def _key_name(key: Union[str, MsgKey]) -> str:
+    """Получить строковое имя ключа сообщения."""
+    return key.name if isinstance(key, MsgKey) else key
+
+
+@lru_cache(maxsize=64)
 def _validate_locale(locale: str) -> str:
     """
     Validate and normalize locale string.
 
+    Results are memoized: the set of locales seen in requests is small, so
+    repeated calls skip the split/lower string allocations.
+
     Args:
         locale: Language code (e.g., 'en', 'en-US', 'ru-RU')
 
@@ -218,6 +307,9 @@ def _format_message(template: str, **kwargs: Any) -> str:
         >>> _format_message("File size {size} exceeds {max}", size=10, max=5)
         'File size 10 exceeds 5'
     """
+    if not kwargs or template not in _TEMPLATES_WITH_FIELDS:
+        return template
+
     try:
         return template.format(**kwargs)
     except KeyError as e:
@@ -228,7 +320,40 @@ def _format_message(template: str, **kwargs: Any) -> str:
         return template
 
 
-def get_error_message(error_key: str, locale: str = DEFAULT_LANGUAGE, **kwargs: Any) -> str:
+def _lookup(
+    tables: Tuple[Tuple[Optional[str], ...], ...],
+    category: str,
+    key: Union[str, MsgKey],
+    locale: str,
+    kwargs: Dict[str, Any],
+) -> str:
+    """
+    Найти и отформатировать шаблон в таблицах одной категории сообщений.
+
+    Args:
+        tables: Таблицы шаблонов категории ([индекс языка][MsgKey])
+        category: Название категории для журнала (Error, Success, Validation)
+        key: Ключ сообщения (строка или MsgKey)
+        locale: Код языка
+        kwargs: Параметры для подстановки в шаблон
+
+    Returns:
+        Переведённое сообщение или сам ключ, если он не найден в категории
+    """
+    key_id = _KEY_IDS.get(key)
+    template = None if key_id is None else tables[_LANG_INDEX[_validate_locale(locale)]][key_id]
+
+    if template is None:
+        key_name = _key_name(key)
+        logger.error(f"{category} key '{key_name}' not found in any language")
+        return key_name  # Return key as fallback
+
+    return _format_message(template, **kwargs)
+
+
+def get_error_message(
+    error_key: Union[str, MsgKey], locale: str = DEFAULT_LANGUAGE, **kwargs: Any
+) -> str:
     """
     Get translated error message for the given error key.
 
@@ -249,20 +374,12 @@ def get_error_message(error_key: str, locale: str = DEFAULT_LANGUAGE, **kwargs:
         >>> get_error_message("file_too_large", "ru", size=10.5, max_mb=5)
         'Размер файла 10.50МБ превышает максимально допустимый размер (5МБ)'
     """
-    lang = _validate_locale(locale)
+    return _lookup(_ERROR_TABLES, "Error", error_key, locale, kwargs)
 
-    if error_key not in ERROR_MESSAGES[lang]:
-        logger.warning(f"Error key '{error_key}' not found for language '{lang}', checking default")
-        if error_key not in ERROR_MESSAGES[DEFAULT_LANGUAGE]:
-            logger.error(f"Error key '{error_key}' not found in any language")
-            return error_key  # Return key as fallback
-        lang = DEFAULT_LANGUAGE
 
-    template = ERROR_MESSAGES[lang][error_key]
-    return _format_message(template, **kwargs)
-
-
-def get_success_message(success_key: str, locale: str = DEFAULT_LANGUAGE, **kwargs: Any) -> str:
+def get_success_message(
+    success_key: Union[str, MsgKey], locale: str = DEFAULT_LANGUAGE, **kwargs: Any
+) -> str:
     """
     Get translated success message for the given key.
 
@@ -280,20 +397,12 @@ def get_success_message(success_key: str, locale: str = DEFAULT_LANGUAGE, **kwar
         >>> get_success_message("file_uploaded", "ru")
         'Резюме успешно загружено'
     """
-    lang = _validate_locale(locale)
-
-    if success_key not in SUCCESS_MESSAGES[lang]:
-        logger.warning(f"Success key '{success_key}' not found for language '{lang}', checking default")
-        if success_key not in SUCCESS_MESSAGES[DEFAULT_LANGUAGE]:
-            logger.error(f"Success key '{success_key}' not found in any language")
-            return success_key  # Return key as fallback
-        lang = DEFAULT_LANGUAGE
-
-    template = SUCCESS_MESSAGES[lang][success_key]
-    return _format_message(template, **kwargs)
+    return _lookup(_SUCCESS_TABLES, "Success", success_key, locale, kwargs)
 
 
-def get_validation_message(validation_key: str, locale: str = DEFAULT_LANGUAGE, **kwargs: Any) -> str:
+def get_validation_message(
+    validation_key: Union[str, MsgKey], locale: str = DEFAULT_LANGUAGE, **kwargs: Any
+) -> str:
     """
     Get translated validation message for the given key.
 
@@ -311,22 +420,12 @@ def get_validation_message(validation_key: str, locale: str = DEFAULT_LANGUAGE,
         >>> get_validation_message("invalid_resume_id", "ru")
         'Неверный формат ID резюме'
     """
-    lang = _validate_locale(locale)
-
-    if validation_key not in VALIDATION_MESSAGES[lang]:
-        logger.warning(
-            f"Validation key '{validation_key}' not found for language '{lang}', checking default"
-        )
-        if validation_key not in VALIDATION_MESSAGES[DEFAULT_LANGUAGE]:
-            logger.error(f"Validation key '{validation_key}' not found in any language")
-            return validation_key  # Return key as fallback
-        lang = DEFAULT_LANGUAGE
-
-    template = VALIDATION_MESSAGES[lang][validation_key]
-    return _format_message(template, **kwargs)
+    return _lookup(_VALIDATION_TABLES, "Validation", validation_key, locale, kwargs)
 
 
-def get_message(message_key: str, locale: str = DEFAULT_LANGUAGE, **kwargs: Any) -> str:
+def get_message(
+    message_key: Union[str, MsgKey], locale: str = DEFAULT_LANGUAGE, **kwargs: Any
+) -> str:
     """
     Get translated message by searching all message dictionaries.
 
@@ -345,18 +444,12 @@ def get_message(message_key: str, locale: str = DEFAULT_LANGUAGE, **kwargs: Any)
         >>> get_message("file_too_large", "en", size=10.5, max_mb=5)
         'File size 10.50MB exceeds maximum allowed size (5MB)'
     """
-    # Try error messages first
-    if message_key in ERROR_MESSAGES.get(_validate_locale(locale), {}):
-        return get_error_message(message_key, locale, **kwargs)
-
-    # Try success messages
-    if message_key in SUCCESS_MESSAGES.get(_validate_locale(locale), {}):
-        return get_success_message(message_key, locale, **kwargs)
-
-    # Try validation messages
-    if message_key in VALIDATION_MESSAGES.get(_validate_locale(locale), {}):
-        return get_validation_message(message_key, locale, **kwargs)
-
-    # Not found
-    logger.error(f"Message key '{message_key}' not found in any translation dictionary")
-    return message_key
+    entry = _KEY_INDEX.get(message_key)
+    if entry is None:
+        key_name = _key_name(message_key)
+        logger.error(f"Message key '{key_name}' not found in any translation dictionary")
+        return key_name
+
+    key_id, tables = entry
+    template = tables[_LANG_INDEX[_validate_locale(locale)]][key_id]
+    return _format_message(template, **kwargs)
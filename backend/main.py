@@ -4,13 +4,15 @@
 Этот модуль предоставляет основное приложение FastAPI с middleware CORS,
 управлением сессиями базы данных и эндпоинтами проверки работоспособности.
 """
+import importlib
 import logging
 from contextlib import asynccontextmanager
-from typing import AsyncGenerator
+from typing import AsyncGenerator, Tuple
 
+import orjson
 from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse, Response
 from sqlalchemy.exc import SQLAlchemyError
 
 from config import get_settings
@@ -19,13 +21,58 @@ from database import init_db
 logger = logging.getLogger(__name__)
 settings = get_settings()
 
+# Декларативный список API-роутеров: (модуль, префикс, тег).
+# Модули импортируются при запуске приложения в lifespan, а не при импорте main
+_ROUTER_SPECS: Tuple[Tuple[str, str, str], ...] = (
+    ("api.resumes", "/api/resumes", "Resumes"),
+    ("api.analysis", "/api/analysis", "Analysis"),
+    ("api.matching", "/api/matching", "Matching"),
+    ("api.skill_taxonomies", "/api/skill-taxonomies", "Skill Taxonomies"),
+    ("api.custom_synonyms", "/api/custom-synonyms", "Custom Synonyms"),
+    ("api.feedback", "/api/feedback", "Feedback"),
+    ("api.model_versions", "/api/model-versions", "Model Versions"),
+    ("api.comparisons", "/api/comparisons", "Comparisons"),
+    ("api.analytics", "/api/analytics", "Analytics"),
+    ("api.reports", "/api/reports", "Reports"),
+    ("api.vacancies", "/api/vacancies", "Vacancies"),
+)
+
+
+def include_routers(app: FastAPI) -> None:
+    """
+    Импортировать модули API и подключить их роутеры к приложению.
+
+    Вызывается в lifespan, поэтому импорт main не загружает модули API
+    (и их зависимости: модели, анализаторы). Инструменты, работающие без
+    запуска lifespan (экспорт схемы OpenAPI, TestClient без контекстного
+    менеджера), вызывают функцию сами перед обращением к маршрутам:
+
+        >>> from main import app, include_routers
+        >>> include_routers(app)
+        >>> schema = app.openapi()
+
+    Повторный вызов ничего не делает.
+
+    Args:
+        app: Приложение FastAPI
+    """
+    if getattr(app.state, "routers_included", False):
+        return
+
+    for module_name, prefix, tag in _ROUTER_SPECS:
+        module = importlib.import_module(module_name)
+        app.include_router(module.router, prefix=prefix, tags=[tag])
+
+    app.state.routers_included = True
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator:
     """
     Контекстный менеджер жизненного цикла приложения для запуска и остановки.
 
-    Обрабатывает инициализацию пула подключений к базе данных и его очистку.
+    Обрабатывает подключение API-роутеров, инициализацию пула подключений
+    к базе данных и его очистку.
 
     Yields:
         None
@@ -36,11 +83,14 @@ async def lifespan(app: FastAPI) -> AsyncGenerator:
     # Запуск
     logger.info("Запуск API анализа резюме")
 
+    # Подключение API-роутеров
+    include_routers(app)
+
     # Инициализация базы данных и создание таблиц
     await init_db(create_tables=True)
 
     logger.info(f"URL базы данных: {settings.database_url[:30]}...")
-    logger.info(f"CORS источники: {settings.cors_origins}")
+    logger.info(f"CORS источники: {sorted(settings.cors_origins)}")
     logger.info(f"Макс. размер загрузки: {settings.max_upload_size_mb}МБ")
     logger.info(f"Разрешённые типы файлов: {settings.allowed_file_types}")
 
@@ -62,6 +112,7 @@ app = FastAPI(
     docs_url="/docs",
     redoc_url="/redoc",
     openapi_url="/openapi.json",
+    default_response_class=ORJSONResponse,
     lifespan=lifespan,
 )
 
@@ -84,9 +135,22 @@ app.add_middleware(
 )
 
 
+# Предсериализованные тела ответов об ошибках (не зависят от исключения)
+_DATABASE_ERROR_BODY = orjson.dumps({
+    "error": "Произошла ошибка базы данных",
+    "detail": "Возникла ошибка при доступе к базе данных",
+    "type": "database_error",
+})
+_INTERNAL_ERROR_BODY = orjson.dumps({
+    "error": "Внутренняя ошибка сервера",
+    "detail": "Произошла неожиданная ошибка. Пожалуйста, попробуйте позже.",
+    "type": "internal_error",
+})
+
+
 # Обработчики исключений
 @app.exception_handler(SQLAlchemyError)
-async def sqlalchemy_exception_handler(request: Request, exc: SQLAlchemyError) -> JSONResponse:
+async def sqlalchemy_exception_handler(request: Request, exc: SQLAlchemyError) -> Response:
     """
     Обработка ошибок базы данных SQLAlchemy.
 
@@ -98,18 +162,15 @@ async def sqlalchemy_exception_handler(request: Request, exc: SQLAlchemyError) -
         JSON-ответ с деталями ошибки
     """
     logger.error(f"Ошибка базы данных: {exc}")
-    return JSONResponse(
+    return Response(
+        content=_DATABASE_ERROR_BODY,
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-        content={
-            "error": "Произошла ошибка базы данных",
-            "detail": "Возникла ошибка при доступе к базе данных",
-            "type": "database_error",
-        },
+        media_type="application/json",
     )
 
 
 @app.exception_handler(ValueError)
-async def value_error_handler(request: Request, exc: ValueError) -> JSONResponse:
+async def value_error_handler(request: Request, exc: ValueError) -> Response:
     """
     Обработка ошибок валидации значений.
 
@@ -121,18 +182,19 @@ async def value_error_handler(request: Request, exc: ValueError) -> JSONResponse
         JSON-ответ с деталями ошибки
     """
     logger.warning(f"Ошибка валидации: {exc}")
-    return JSONResponse(
-        status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-        content={
+    return Response(
+        content=orjson.dumps({
             "error": "Ошибка валидации",
             "detail": str(exc),
             "type": "validation_error",
-        },
+        }),
+        status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+        media_type="application/json",
     )
 
 
 @app.exception_handler(Exception)
-async def general_exception_handler(request: Request, exc: Exception) -> JSONResponse:
+async def general_exception_handler(request: Request, exc: Exception) -> Response:
     """
     Обработка всех остальных исключений.
 
@@ -144,19 +206,33 @@ async def general_exception_handler(request: Request, exc: Exception) -> JSONRes
         JSON-ответ с деталями ошибки
     """
     logger.error(f"Неожиданная ошибка: {exc}", exc_info=True)
-    return JSONResponse(
+    return Response(
+        content=_INTERNAL_ERROR_BODY,
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-        content={
-            "error": "Внутренняя ошибка сервера",
-            "detail": "Произошла неожиданная ошибка. Пожалуйста, попробуйте позже.",
-            "type": "internal_error",
-        },
+        media_type="application/json",
     )
 
 
+# Предсериализованные тела ответов служебных эндпоинтов (содержимое неизменно)
+_HEALTH_BODY = orjson.dumps({
+    "status": "healthy",
+    "service": "resume-analysis-api",
+    "version": "1.0.0",
+})
+_READY_BODY = orjson.dumps({"status": "ready"})
+_ROOT_BODY = orjson.dumps({
+    "message": "Resume Analysis API",
+    "version": "1.0.0",
+    "docs": "/docs",
+    "redoc": "/redoc",
+    "health": "/health",
+    "ready": "/ready",
+})
+
+
 # Эндпоинты проверки работоспособности
 @app.get("/health", tags=["Health"])
-async def health_check() -> JSONResponse:
+async def health_check() -> Response:
     """
     Эндпоинт проверки работоспособности.
 
@@ -170,18 +246,15 @@ async def health_check() -> JSONResponse:
         >>> curl http://localhost:8000/health
         {"status":"healthy","service":"resume-analysis-api","version":"1.0.0"}
     """
-    return JSONResponse(
+    return Response(
+        content=_HEALTH_BODY,
         status_code=status.HTTP_200_OK,
-        content={
-            "status": "healthy",
-            "service": "resume-analysis-api",
-            "version": "1.0.0",
-        },
+        media_type="application/json",
     )
 
 
 @app.get("/ready", tags=["Health"])
-async def readiness_check() -> JSONResponse:
+async def readiness_check() -> Response:
     """
     Эндпоинт проверки готовности.
 
@@ -199,14 +272,15 @@ async def readiness_check() -> JSONResponse:
     # TODO: Добавить проверку подключения к Redis
     # TODO: Добавить проверку доступности ML-моделей
 
-    return JSONResponse(
+    return Response(
+        content=_READY_BODY,
         status_code=status.HTTP_200_OK,
-        content={"status": "ready"},
+        media_type="application/json",
     )
 
 
 @app.get("/", tags=["Root"])
-async def root() -> JSONResponse:
+async def root() -> Response:
     """
     Корневой эндпоинт с информацией об API.
 
@@ -222,47 +296,13 @@ async def root() -> JSONResponse:
           "health": "/health"
         }
     """
-    return JSONResponse(
+    return Response(
+        content=_ROOT_BODY,
         status_code=status.HTTP_200_OK,
-        content={
-            "message": "Resume Analysis API",
-            "version": "1.0.0",
-            "docs": "/docs",
-            "redoc": "/redoc",
-            "health": "/health",
-            "ready": "/ready",
-        },
+        media_type="application/json",
     )
 
 
-# Подключение API-роутеров
-from api import (
-    resumes,
-    analysis,
-    matching,
-    skill_taxonomies,
-    custom_synonyms,
-    feedback,
-    model_versions,
-    comparisons,
-    analytics,
-    reports,
-    vacancies,
-)
-
-app.include_router(resumes.router, prefix="/api/resumes", tags=["Resumes"])
-app.include_router(analysis.router, prefix="/api/analysis", tags=["Analysis"])
-app.include_router(matching.router, prefix="/api/matching", tags=["Matching"])
-app.include_router(skill_taxonomies.router, prefix="/api/skill-taxonomies", tags=["Skill Taxonomies"])
-app.include_router(custom_synonyms.router, prefix="/api/custom-synonyms", tags=["Custom Synonyms"])
-app.include_router(feedback.router, prefix="/api/feedback", tags=["Feedback"])
-app.include_router(model_versions.router, prefix="/api/model-versions", tags=["Model Versions"])
-app.include_router(comparisons.router, prefix="/api/comparisons", tags=["Comparisons"])
-app.include_router(analytics.router, prefix="/api/analytics", tags=["Analytics"])
-app.include_router(reports.router, prefix="/api/reports", tags=["Reports"])
-app.include_router(vacancies.router, prefix="/api/vacancies", tags=["Vacancies"])
-
-
 if __name__ == "__main__":
     import uvicorn
 
@@ -275,6 +315,8 @@ if __name__ == "__main__":
         "main:app",
         host=settings.backend_host,
         port=settings.backend_port,
+        loop="uvloop",
+        http="httptools",
         reload=True,
         log_level=settings.log_level.lower(),
     )
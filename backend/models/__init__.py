@@ -5,11 +5,11 @@ from .base import Base
 from .resume import Resume
 from .resume_analysis import ResumeAnalysis
 from .analysis_result import AnalysisResult
-from .comparison import ResumeComparison
+from .comparison import ResumeComparison, ResumeComparisonMember
 from .job_vacancy import JobVacancy
 from .match_result import MatchResult
 from .skill_taxonomy import SkillTaxonomy
-from .custom_synonyms import CustomSynonym
+from .custom_synonyms import CustomSynonym, CustomSynonymTerm
 from .skill_feedback import SkillFeedback
 from .ml_model_version import MLModelVersion
 from .user_preferences import UserPreferences
@@ -24,10 +24,12 @@ __all__ = [
     "ResumeAnalysis",
     "AnalysisResult",
     "ResumeComparison",
+    "ResumeComparisonMember",
     "JobVacancy",
     "MatchResult",
     "SkillTaxonomy",
     "CustomSynonym",
+    "CustomSynonymTerm",
     "SkillFeedback",
     "MLModelVersion",
     "UserPreferences",
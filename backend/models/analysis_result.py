@@ -4,7 +4,8 @@
 from typing import Optional
 from uuid import UUID
 
-from sqlalchemy import ForeignKey, JSON, Text
+from sqlalchemy import ForeignKey, Index, Text
+from sqlalchemy.dialects.postgresql import JSONB, UUID as PG_UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
 from .base import Base, TimestampMixin, UUIDMixin
@@ -27,16 +28,28 @@ class AnalysisResult(Base, UUIDMixin, TimestampMixin):
     """
 
     __tablename__ = "analysis_results"
+    __table_args__ = (
+        # GIN-индекс для запросов на вхождение навыков (skills @> '["python"]')
+        Index(
+            "ix_analysis_results_skills_gin",
+            "skills",
+            postgresql_using="gin",
+            postgresql_ops={"skills": "jsonb_path_ops"},
+        ),
+    )
 
     resume_id: Mapped[UUID] = mapped_column(
-        ForeignKey("resumes.id", ondelete="CASCADE"), nullable=False, unique=True
+        PG_UUID(as_uuid=True),
+        ForeignKey("resumes.id", ondelete="CASCADE"),
+        nullable=False,
+        unique=True,
     )
-    errors: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
-    skills: Mapped[Optional[list]] = mapped_column(JSON, nullable=True)
-    experience_summary: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
-    recommendations: Mapped[Optional[list]] = mapped_column(JSON, nullable=True)
-    keywords: Mapped[Optional[list]] = mapped_column(JSON, nullable=True)
-    entities: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
+    errors: Mapped[Optional[dict]] = mapped_column(JSONB, nullable=True)
+    skills: Mapped[Optional[list]] = mapped_column(JSONB, nullable=True)
+    experience_summary: Mapped[Optional[dict]] = mapped_column(JSONB, nullable=True)
+    recommendations: Mapped[Optional[list]] = mapped_column(JSONB, nullable=True)
+    keywords: Mapped[Optional[list]] = mapped_column(JSONB, nullable=True)
+    entities: Mapped[Optional[dict]] = mapped_column(JSONB, nullable=True)
 
     def __repr__(self) -> str:
         return f"<AnalysisResult(id={self.id}, resume_id={self.resume_id})>"
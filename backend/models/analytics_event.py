@@ -2,14 +2,20 @@
 Модель AnalyticsEvent для отслеживания событий аналитики по времени
 """
 import enum
-from typing import Optional
+from typing import TYPE_CHECKING, Any, Dict, Optional, Sequence
 from uuid import UUID
 
-from sqlalchemy import ForeignKey, JSON, String
+from sqlalchemy import Enum, ForeignKey, Index, String
+from sqlalchemy.dialects.postgresql import JSONB, UUID as PG_UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
 from .base import Base, TimestampMixin, UUIDMixin
 
+if TYPE_CHECKING:
+    # Только для аннотаций: модели импортируются Alembic и воркерами Celery,
+    # которым асинхронное расширение SQLAlchemy не нужно
+    from sqlalchemy.ext.asyncio import AsyncSession
+
 
 class AnalyticsEventType(str, enum.Enum):
     """Типы событий аналитики, которые можно отслеживать"""
@@ -49,18 +55,61 @@ class AnalyticsEvent(Base, UUIDMixin, TimestampMixin):
     """
 
     __tablename__ = "analytics_events"
+    __table_args__ = (
+        # GIN-индекс для фильтрации по полезной нагрузке (event_data @> '{"source": "linkedin"}')
+        Index(
+            "ix_analytics_events_event_data_gin",
+            "event_data",
+            postgresql_using="gin",
+            postgresql_ops={"event_data": "jsonb_path_ops"},
+        ),
+        # Выборки по типу события или рекрутёру за период, упорядоченные по времени
+        Index("ix_analytics_events_event_type_created_at", "event_type", "created_at"),
+        Index("ix_analytics_events_recruiter_id_created_at", "recruiter_id", "created_at"),
+    )
 
     event_type: Mapped[AnalyticsEventType] = mapped_column(
-        String(50), nullable=False, index=True
+        Enum(
+            AnalyticsEventType,
+            name="analytics_event_type",
+            values_callable=lambda enum_cls: [member.value for member in enum_cls],
+        ),
+        nullable=False,
     )
     entity_type: Mapped[Optional[str]] = mapped_column(String(100), nullable=True, index=True)
     entity_id: Mapped[Optional[UUID]] = mapped_column(nullable=True, index=True)
     user_id: Mapped[Optional[UUID]] = mapped_column(nullable=True, index=True)
     recruiter_id: Mapped[Optional[UUID]] = mapped_column(
-        ForeignKey("recruiters.id", ondelete="SET NULL"), nullable=True, index=True
+        PG_UUID(as_uuid=True),
+        ForeignKey("recruiters.id", ondelete="SET NULL"),
+        nullable=True,
     )
     session_id: Mapped[Optional[str]] = mapped_column(String(255), nullable=True, index=True)
-    event_data: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
+    event_data: Mapped[Optional[dict]] = mapped_column(JSONB, nullable=True)
 
     def __repr__(self) -> str:
         return f"<AnalyticsEvent(id={self.id}, type={self.event_type}, entity={self.entity_type})>"
+
+
+async def bulk_log_events(session: "AsyncSession", rows: Sequence[Dict[str, Any]]) -> None:
+    """
+    Массово записать события аналитики одним INSERT через SQLAlchemy Core.
+
+    В отличие от session.add() для каждого события, не создаёт ORM-объекты и
+    не помещает их в identity map: строки передаются драйверу пакетом
+    (executemany). Первичный ключ заполняется значением по умолчанию столбца.
+
+    Args:
+        session: Асинхронная сессия базы данных
+        rows: Словари со значениями столбцов (event_type, entity_type, entity_id,
+            user_id, recruiter_id, session_id, event_data)
+
+    Example:
+        >>> await bulk_log_events(db, [
+        ...     {"event_type": AnalyticsEventType.RESUME_UPLOADED.value, "entity_type": "resume"},
+        ...     {"event_type": AnalyticsEventType.MATCH_VIEWED.value, "entity_type": "match"},
+        ... ])
+    """
+    if not rows:
+        return
+    await session.execute(AnalyticsEvent.__table__.insert(), list(rows))
@@ -1,10 +1,12 @@
 """
 Базовая конфигурация базы данных и общие миксины
 """
+import os
+import time
 from datetime import datetime
-from uuid import uuid4
+from uuid import UUID as PyUUID, uuid4
 
-from sqlalchemy import DateTime, func
+from sqlalchemy import DateTime, func, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import DeclarativeBase, Mapped, declared_attr, mapped_column
 
@@ -29,11 +31,36 @@ class TimestampMixin:
     )
 
 
+def uuid7() -> PyUUID:
+    """
+    Сгенерировать UUID версии 7 (RFC 9562).
+
+    Старшие 48 бит содержат время в миллисекундах, остальные 74 бита случайны.
+    Такие идентификаторы монотонно растут во времени, поэтому новые записи
+    попадают в "горячий" правый край B-tree индекса первичного ключа, а не
+    разбрасываются по всему индексу, как при uuid4.
+    """
+    timestamp_ms = time.time_ns() // 1_000_000
+    rand = int.from_bytes(os.urandom(10), "big")
+
+    value = (timestamp_ms & 0xFFFF_FFFF_FFFF) << 80
+    value |= 0x7 << 76  # Версия
+    value |= ((rand >> 62) & 0xFFF) << 64  # rand_a
+    value |= 0b10 << 62  # Вариант RFC 4122/9562
+    value |= rand & 0x3FFF_FFFF_FFFF_FFFF  # rand_b
+    return PyUUID(int=value)
+
+
 class UUIDMixin:
-    """Миксин для добавления первичного ключа UUID"""
+    """Миксин для добавления первичного ключа UUID (версии 7, упорядоченного по времени)"""
 
     @declared_attr.directive
     def id(cls) -> Mapped[uuid4]:
         return mapped_column(
-            UUID(as_uuid=True), primary_key=True, default=uuid4, nullable=False
+            UUID(as_uuid=True),
+            primary_key=True,
+            default=uuid7,
+            # Запасной вариант для вставок в обход ORM (сырой SQL, COPY)
+            server_default=text("gen_random_uuid()"),
+            nullable=False,
         )
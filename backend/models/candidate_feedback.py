@@ -1,14 +1,23 @@
 """
 Модель CandidateFeedback для хранения конструктивной обратной связи для кандидатов
 """
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 from uuid import UUID
 
-from sqlalchemy import ForeignKey, JSON, String, Boolean
-from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy import ForeignKey, Index, SmallInteger, String, text
+from sqlalchemy.dialects.postgresql import JSONB, UUID as PG_UUID
+from sqlalchemy.ext.hybrid import hybrid_property
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from .base import Base, TimestampMixin, UUIDMixin
 
+if TYPE_CHECKING:
+    from .resume import Resume
+
+# Биты столбца CandidateFeedback.flags
+FLAG_VIEWED_BY_CANDIDATE = 1 << 0
+FLAG_DOWNLOADED = 1 << 1
+
 
 class CandidateFeedback(Base, UUIDMixin, TimestampMixin):
     """
@@ -28,8 +37,9 @@ class CandidateFeedback(Base, UUIDMixin, TimestampMixin):
         match_score: Общий балл соответствия
         tone: Тон обратной связи
         feedback_source: Источник обратной связи (автоматическая, ручная)
-        viewed_by_candidate: Просмотрел ли кандидат обратную связь
-        downloaded: Была ли скачана обратная связь
+        flags: Битовая маска состояний (FLAG_VIEWED_BY_CANDIDATE, FLAG_DOWNLOADED)
+        viewed_by_candidate: Просмотрел ли кандидат обратную связь (бит 0 flags)
+        downloaded: Была ли скачана обратная связь (бит 1 flags)
         extra_metadata: Дополнительные метаданные в формате JSON
         created_at: Время создания обратной связи (унаследовано)
         updated_at: Время последнего обновления обратной связи (унаследовано)
@@ -37,31 +47,91 @@ class CandidateFeedback(Base, UUIDMixin, TimestampMixin):
 
     __tablename__ = "candidate_feedback"
 
+    __table_args__ = (
+        # GIN-индекс для запросов на вхождение по skills_feedback
+        Index(
+            "ix_candidate_feedback_skills_feedback_gin",
+            "skills_feedback",
+            postgresql_using="gin",
+            postgresql_ops={"skills_feedback": "jsonb_path_ops"},
+        ),
+        # Обратная связь, которую кандидат ещё не просматривал
+        Index(
+            "ix_candidate_feedback_unseen",
+            "resume_id",
+            postgresql_where=text("(flags & 1) = 0"),
+        ),
+    )
+
     resume_id: Mapped[UUID] = mapped_column(
-        ForeignKey("resumes.id", ondelete="CASCADE"), nullable=False, index=True
+        PG_UUID(as_uuid=True),
+        ForeignKey("resumes.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
     )
     vacancy_id: Mapped[Optional[UUID]] = mapped_column(
-        ForeignKey("job_vacancies.id", ondelete="SET NULL"), nullable=True, index=True
+        PG_UUID(as_uuid=True),
+        ForeignKey("job_vacancies.id", ondelete="SET NULL"),
+        nullable=True,
+        index=True,
     )
     match_result_id: Mapped[Optional[UUID]] = mapped_column(
-        ForeignKey("match_results.id", ondelete="SET NULL"), nullable=True
+        PG_UUID(as_uuid=True),
+        ForeignKey("match_results.id", ondelete="SET NULL"),
+        nullable=True,
     )
     template_id: Mapped[Optional[UUID]] = mapped_column(
-        ForeignKey("feedback_templates.id", ondelete="SET NULL"), nullable=True
+        PG_UUID(as_uuid=True),
+        ForeignKey("feedback_templates.id", ondelete="SET NULL"),
+        nullable=True,
     )
     language: Mapped[str] = mapped_column(String(10), nullable=False, server_default="en")
-    grammar_feedback: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
-    skills_feedback: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
-    experience_feedback: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
-    recommendations: Mapped[Optional[list]] = mapped_column(JSON, nullable=True)
+    grammar_feedback: Mapped[Optional[dict]] = mapped_column(JSONB, nullable=True)
+    skills_feedback: Mapped[Optional[dict]] = mapped_column(JSONB, nullable=True)
+    experience_feedback: Mapped[Optional[dict]] = mapped_column(JSONB, nullable=True)
+    recommendations: Mapped[Optional[list]] = mapped_column(JSONB, nullable=True)
     match_score: Mapped[Optional[int]] = mapped_column(nullable=True)
     tone: Mapped[str] = mapped_column(String(50), nullable=False, server_default="constructive")
     feedback_source: Mapped[str] = mapped_column(
         String(50), nullable=False, server_default="automated"
     )
-    viewed_by_candidate: Mapped[bool] = mapped_column(Boolean, nullable=False, server_default="false")
-    downloaded: Mapped[bool] = mapped_column(Boolean, nullable=False, server_default="false")
-    extra_metadata: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
+    flags: Mapped[int] = mapped_column(SmallInteger, nullable=False, default=0, server_default="0")
+    extra_metadata: Mapped[Optional[dict]] = mapped_column(JSONB, nullable=True)
+
+    resume: Mapped["Resume"] = relationship(back_populates="candidate_feedback", lazy="raise_on_sql")
+
+    def _get_flag(self, flag: int) -> bool:
+        return bool((self.flags or 0) & flag)
+
+    def _set_flag(self, flag: int, value: bool) -> None:
+        flags = self.flags or 0
+        self.flags = flags | flag if value else flags & ~flag
+
+    @hybrid_property
+    def viewed_by_candidate(self) -> bool:
+        return self._get_flag(FLAG_VIEWED_BY_CANDIDATE)
+
+    @viewed_by_candidate.inplace.setter
+    def _viewed_by_candidate_setter(self, value: bool) -> None:
+        self._set_flag(FLAG_VIEWED_BY_CANDIDATE, value)
+
+    @viewed_by_candidate.inplace.expression
+    @classmethod
+    def _viewed_by_candidate_expression(cls):
+        return cls.flags.op("&")(FLAG_VIEWED_BY_CANDIDATE) != 0
+
+    @hybrid_property
+    def downloaded(self) -> bool:
+        return self._get_flag(FLAG_DOWNLOADED)
+
+    @downloaded.inplace.setter
+    def _downloaded_setter(self, value: bool) -> None:
+        self._set_flag(FLAG_DOWNLOADED, value)
+
+    @downloaded.inplace.expression
+    @classmethod
+    def _downloaded_expression(cls):
+        return cls.flags.op("&")(FLAG_DOWNLOADED) != 0
 
     def __repr__(self) -> str:
         return f"<CandidateFeedback(id={self.id}, resume_id={self.resume_id}, language={self.language})>"
@@ -1,14 +1,62 @@
 """
 Модель ResumeComparison для хранения сохранённых представлений сравнения резюме
 """
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 from uuid import UUID
 
-from sqlalchemy import ForeignKey, JSON, String
-from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy import ForeignKey, Index, SmallInteger, String, text
+from sqlalchemy.dialects.postgresql import JSONB, UUID as PG_UUID
+from sqlalchemy.ext.associationproxy import AssociationProxy, association_proxy
+from sqlalchemy.ext.orderinglist import ordering_list
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from .base import Base, TimestampMixin, UUIDMixin
 
+if TYPE_CHECKING:
+    from .resume import Resume
+
+
+class ResumeComparisonMember(Base):
+    """
+    Связующая таблица ResumeComparison <-> Resume
+
+    Индексируется в обе стороны: резюме сравнения (по первичному ключу) и
+    сравнения, содержащие резюме (ix_resume_comparison_members_resume_id).
+
+    Attributes:
+        comparison_id: Внешний ключ к ResumeComparison
+        resume_id: Внешний ключ к Resume
+        position: Порядок резюме в сравнении (заполняется ordering_list
+            при изменении ResumeComparison.members/resumes)
+        resume: Резюме участника сравнения
+    """
+
+    __tablename__ = "resume_comparison_members"
+
+    __table_args__ = (
+        Index("ix_resume_comparison_members_resume_id", "resume_id", "comparison_id"),
+    )
+
+    comparison_id: Mapped[UUID] = mapped_column(
+        PG_UUID(as_uuid=True),
+        ForeignKey("resume_comparisons.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    resume_id: Mapped[UUID] = mapped_column(
+        PG_UUID(as_uuid=True),
+        ForeignKey("resumes.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    position: Mapped[int] = mapped_column(SmallInteger, nullable=False, default=0)
+
+    resume: Mapped["Resume"] = relationship(lazy="selectin")
+
+    def __repr__(self) -> str:
+        return (
+            f"<ResumeComparisonMember(comparison_id={self.comparison_id}, "
+            f"resume_id={self.resume_id}, position={self.position})>"
+        )
+
 
 class ResumeComparison(Base, UUIDMixin, TimestampMixin):
     """
@@ -17,7 +65,10 @@ class ResumeComparison(Base, UUIDMixin, TimestampMixin):
     Attributes:
         id: Первичный ключ UUID
         vacancy_id: Внешний ключ к JobVacancy
-        resume_ids: JSON-массив ID сравниваемых резюме
+        members: Строки resume_comparison_members в порядке position
+        resumes: Сравниваемые резюме в порядке сравнения; добавление в список
+            создаёт участника, а его position равен индексу в списке
+        resume_ids: ID сравниваемых резюме в порядке сравнения
         filters: JSON-объект с настройками фильтров (диапазон совпадения, поле сортировки и т.д.)
         created_by: Идентификатор пользователя, создавшего сравнение
         shared_with: JSON-массив ID пользователей/email, с которыми поделено сравнение
@@ -27,13 +78,39 @@ class ResumeComparison(Base, UUIDMixin, TimestampMixin):
 
     __tablename__ = "resume_comparisons"
 
+    # shared_with по умолчанию вычисляется на сервере и возвращается через RETURNING
+    __mapper_args__ = {"eager_defaults": True}
+
     vacancy_id: Mapped[UUID] = mapped_column(
-        ForeignKey("job_vacancies.id", ondelete="CASCADE"), nullable=False, index=True
+        PG_UUID(as_uuid=True),
+        ForeignKey("job_vacancies.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
     )
-    resume_ids: Mapped[list] = mapped_column(JSON, nullable=False, default=list)
-    filters: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
+    filters: Mapped[Optional[dict]] = mapped_column(JSONB, nullable=True)
     created_by: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
-    shared_with: Mapped[Optional[list]] = mapped_column(JSON, nullable=True, default=list)
+    shared_with: Mapped[Optional[list]] = mapped_column(
+        JSONB, nullable=True, server_default=text("'[]'::jsonb")
+    )
+
+    members: Mapped[list[ResumeComparisonMember]] = relationship(
+        order_by=ResumeComparisonMember.position,
+        collection_class=ordering_list("position"),
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="selectin",
+    )
+
+    resumes: AssociationProxy[list["Resume"]] = association_proxy(
+        "members",
+        "resume",
+        creator=lambda resume: ResumeComparisonMember(resume=resume),
+    )
+
+    @property
+    def resume_ids(self) -> list[UUID]:
+        """ID сравниваемых резюме в порядке сравнения"""
+        return [resume.id for resume in self.resumes]
 
     def __repr__(self) -> str:
-        return f"<ResumeComparison(id={self.id}, vacancy_id={self.vacancy_id}, resumes={len(self.resume_ids)})>"
+        return f"<ResumeComparison(id={self.id}, vacancy_id={self.vacancy_id})>"
@@ -2,13 +2,50 @@
 Модель CustomSynonym для хранения специфичных для организации синонимов навыков
 """
 from typing import Optional
+from uuid import UUID
 
-from sqlalchemy import ForeignKey, JSON
-from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy import ForeignKey, Index, Select, String, func, select
+from sqlalchemy.dialects.postgresql import JSONB, UUID as PG_UUID
+from sqlalchemy.orm import Mapped, mapped_column, relationship, validates
 
 from .base import Base, TimestampMixin, UUIDMixin
 
 
+class CustomSynonymTerm(Base):
+    """
+    Отдельный синоним из CustomSynonym.custom_synonyms
+
+    Развёрнутая таблица позволяет найти канонический навык по термину одним
+    обращением к trigram GIN-индексу, включая нечёткий поиск по similarity().
+
+    Attributes:
+        custom_synonym_id: Внешний ключ к CustomSynonym
+        term: Синоним навыка
+    """
+
+    __tablename__ = "custom_synonym_terms"
+
+    __table_args__ = (
+        # Требует расширения pg_trgm
+        Index(
+            "ix_custom_synonym_terms_term_trgm",
+            "term",
+            postgresql_using="gin",
+            postgresql_ops={"term": "gin_trgm_ops"},
+        ),
+    )
+
+    custom_synonym_id: Mapped[UUID] = mapped_column(
+        PG_UUID(as_uuid=True),
+        ForeignKey("custom_synonyms.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    term: Mapped[str] = mapped_column(String(255), primary_key=True)
+
+    def __repr__(self) -> str:
+        return f"<CustomSynonymTerm(custom_synonym_id={self.custom_synonym_id}, term={self.term})>"
+
+
 class CustomSynonym(Base, UUIDMixin, TimestampMixin):
     """
     Модель CustomSynonym для хранения специфичных для организации синонимов навыков
@@ -18,6 +55,8 @@ class CustomSynonym(Base, UUIDMixin, TimestampMixin):
         organization_id: Внешний ключ или ссылка на организацию
         canonical_skill: Каноническое/стандартное имя навыка
         custom_synonyms: JSON-массив специфичных для организации синонимов
+        terms: Те же синонимы строками custom_synonym_terms (синхронизируются
+            при присваивании custom_synonyms)
         context: Опциональный контекст использования этих синонимов
         created_by: ID пользователя, создавшего отображение синонимов
         is_active: Активно ли это отображение синонимов
@@ -27,12 +66,58 @@ class CustomSynonym(Base, UUIDMixin, TimestampMixin):
 
     __tablename__ = "custom_synonyms"
 
+    __table_args__ = (
+        # GIN-индекс для поиска канонического навыка по синониму (custom_synonyms @> '["k8s"]')
+        Index(
+            "ix_custom_synonyms_custom_synonyms_gin",
+            "custom_synonyms",
+            postgresql_using="gin",
+            postgresql_ops={"custom_synonyms": "jsonb_path_ops"},
+        ),
+    )
+
     organization_id: Mapped[str] = mapped_column(nullable=False, index=True)
     canonical_skill: Mapped[str] = mapped_column(nullable=False)
-    custom_synonyms: Mapped[list] = mapped_column(JSON, nullable=False)
+    custom_synonyms: Mapped[list] = mapped_column(JSONB, nullable=False)
     context: Mapped[Optional[str]] = mapped_column(nullable=True)
     created_by: Mapped[Optional[str]] = mapped_column(nullable=True)
     is_active: Mapped[bool] = mapped_column(nullable=False, default=True)
 
+    terms: Mapped[list[CustomSynonymTerm]] = relationship(
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="selectin",
+    )
+
+    @validates("custom_synonyms")
+    def _sync_terms(self, key: str, value: list) -> list:
+        """Пересобрать custom_synonym_terms из нового списка синонимов"""
+        self.terms = [CustomSynonymTerm(term=term) for term in dict.fromkeys(value or ())]
+        return value
+
     def __repr__(self) -> str:
         return f"<CustomSynonym(id={self.id}, org={self.organization_id}, skill={self.canonical_skill})>"
+
+
+def find_synonym_terms(organization_id: str, term: str, limit: int = 5) -> Select:
+    """
+    Запрос канонических навыков организации по синониму, включая близкие написания.
+
+    Оператор pg_trgm % обслуживается ix_custom_synonym_terms_term_trgm;
+    результаты упорядочены по убыванию similarity(), точное совпадение первое.
+
+    Example:
+        >>> rows = (await db.execute(find_synonym_terms("org-1", "ReactJS"))).tuples().all()
+    """
+    similarity = func.similarity(CustomSynonymTerm.term, term)
+    return (
+        select(CustomSynonym.canonical_skill, CustomSynonymTerm.term, similarity.label("similarity"))
+        .join(CustomSynonymTerm, CustomSynonymTerm.custom_synonym_id == CustomSynonym.id)
+        .where(
+            CustomSynonym.organization_id == organization_id,
+            CustomSynonym.is_active.is_(True),
+            CustomSynonymTerm.term.op("%")(term),
+        )
+        .order_by(similarity.desc())
+        .limit(limit)
+    )
@@ -3,7 +3,8 @@ FeedbackTemplate model for customizable feedback templates
 """
 from typing import Optional
 
-from sqlalchemy import JSON, String, Boolean
+from sqlalchemy import String, Boolean
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column
 
 from .base import Base, TimestampMixin, UUIDMixin
@@ -33,7 +34,7 @@ class FeedbackTemplate(Base, UUIDMixin, TimestampMixin):
     name: Mapped[str] = mapped_column(String(255), nullable=False)
     language: Mapped[str] = mapped_column(String(10), nullable=False, server_default="en")
     tone: Mapped[str] = mapped_column(String(50), nullable=False, server_default="constructive")
-    sections: Mapped[dict] = mapped_column(JSON, nullable=False)
+    sections: Mapped[dict] = mapped_column(JSONB, nullable=False)
     is_default: Mapped[bool] = mapped_column(Boolean, nullable=False, server_default="false")
     is_active: Mapped[bool] = mapped_column(Boolean, nullable=False, server_default="true")
     created_by: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
@@ -2,14 +2,18 @@
 Модель HiringStage для отслеживания прогресса резюме через воронку найма
 """
 import enum
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 from uuid import UUID
 
-from sqlalchemy import Enum, ForeignKey, String, Text
-from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy import CheckConstraint, ForeignKey, Index, Select, String, Text, select, text
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.orm import Mapped, mapped_column, relationship, validates
 
 from .base import Base, TimestampMixin, UUIDMixin
 
+if TYPE_CHECKING:
+    from .resume import Resume
+
 
 class HiringStageName(str, enum.Enum):
     """Этапы воронки найма"""
@@ -43,16 +47,62 @@ class HiringStage(Base, UUIDMixin, TimestampMixin):
 
     __tablename__ = "hiring_stages"
 
+    # Этап хранится как короткая строка с CHECK вместо ENUM-типа Postgres
+    __table_args__ = (
+        CheckConstraint(
+            "stage_name IN ({})".format(", ".join(f"'{s.value}'" for s in HiringStageName)),
+            name="ck_hiring_stages_stage_name",
+        ),
+        # Последний этап по каждому резюме (DISTINCT ON ... ORDER BY created_at DESC)
+        # читается из индекса в нужном порядке, без сортировки
+        Index(
+            "ix_hiring_stages_resume_created",
+            "resume_id",
+            text("created_at DESC"),
+            postgresql_include=["stage_name"],
+        ),
+    )
+
     resume_id: Mapped[UUID] = mapped_column(
-        ForeignKey("resumes.id", ondelete="CASCADE"), nullable=False, index=True
+        PG_UUID(as_uuid=True),
+        ForeignKey("resumes.id", ondelete="CASCADE"),
+        nullable=False,
     )
     vacancy_id: Mapped[Optional[UUID]] = mapped_column(
-        ForeignKey("job_vacancies.id", ondelete="SET NULL"), nullable=True, index=True
+        PG_UUID(as_uuid=True),
+        ForeignKey("job_vacancies.id", ondelete="SET NULL"),
+        nullable=True,
+        index=True,
     )
-    stage_name: Mapped[HiringStageName] = mapped_column(
-        Enum(HiringStageName), default=HiringStageName.APPLIED, nullable=False, index=True
+    stage_name: Mapped[str] = mapped_column(
+        String(12), default=HiringStageName.APPLIED.value, nullable=False, index=True
     )
     notes: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
 
+    resume: Mapped["Resume"] = relationship(back_populates="hiring_stages", lazy="raise_on_sql")
+
+    @validates("stage_name")
+    def _validate_stage_name(self, key: str, value: str) -> str:
+        """Приводит этап к значению HiringStageName (ValueError для неизвестных этапов)"""
+        return HiringStageName(value).value
+
     def __repr__(self) -> str:
         return f"<HiringStage(id={self.id}, resume_id={self.resume_id}, stage={self.stage_name})>"
+
+
+def latest_stage_per_resume() -> Select:
+    """
+    Запрос последнего этапа найма для каждого резюме (для воронки найма).
+
+    SELECT DISTINCT ON (resume_id) resume_id, stage_name
+    FROM hiring_stages ORDER BY resume_id, created_at DESC
+    выполняется index-only scan по ix_hiring_stages_resume_created.
+
+    Example:
+        >>> rows = (await db.execute(latest_stage_per_resume())).tuples().all()
+    """
+    return (
+        select(HiringStage.resume_id, HiringStage.stage_name)
+        .distinct(HiringStage.resume_id)
+        .order_by(HiringStage.resume_id, HiringStage.created_at.desc())
+    )
@@ -1,13 +1,17 @@
 """
 Модель JobVacancy для хранения описаний вакансий
 """
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
-from sqlalchemy import JSON, String, Text
-from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy import Index, String, Text, text
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from .base import Base, TimestampMixin, UUIDMixin
 
+if TYPE_CHECKING:
+    from .match_result import MatchResult
+
 
 class JobVacancy(Base, UUIDMixin, TimestampMixin):
     """
@@ -30,14 +34,38 @@ class JobVacancy(Base, UUIDMixin, TimestampMixin):
 
     __tablename__ = "job_vacancies"
 
+    __table_args__ = (
+        # GIN-индекс для поиска вакансий по навыку (required_skills @> '["python"]')
+        Index(
+            "ix_job_vacancies_required_skills_gin",
+            "required_skills",
+            postgresql_using="gin",
+            postgresql_ops={"required_skills": "jsonb_path_ops"},
+        ),
+        # Дедупликация вакансий из внешних источников и точечный поиск по external_id
+        Index(
+            "uq_job_vacancies_external_id_source",
+            "external_id",
+            "source",
+            unique=True,
+            postgresql_where=text("external_id IS NOT NULL"),
+        ),
+    )
+
+    # Значения по умолчанию JSONB-столбцов вычисляются на сервере;
+    # RETURNING сразу возвращает их в объект после INSERT
+    __mapper_args__ = {"eager_defaults": True}
+
     title: Mapped[str] = mapped_column(String(255), nullable=False)
     description: Mapped[str] = mapped_column(Text, nullable=False)
-    required_skills: Mapped[list] = mapped_column(JSON, nullable=False, default=list)
+    required_skills: Mapped[list] = mapped_column(
+        JSONB, nullable=False, server_default=text("'[]'::jsonb")
+    )
     min_experience_months: Mapped[Optional[int]] = mapped_column(
         nullable=True, default=None
     )
     additional_requirements: Mapped[Optional[list]] = mapped_column(
-        JSON, nullable=True, default=list
+        JSONB, nullable=True, server_default=text("'[]'::jsonb")
     )
     industry: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
     work_format: Mapped[Optional[str]] = mapped_column(String(50), nullable=True)
@@ -50,8 +78,15 @@ class JobVacancy(Base, UUIDMixin, TimestampMixin):
     )
     english_level: Mapped[Optional[str]] = mapped_column(String(50), nullable=True)
     employment_type: Mapped[Optional[str]] = mapped_column(String(50), nullable=True)
-    external_id: Mapped[Optional[str]] = mapped_column(String(255), nullable=True, index=True)
+    external_id: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
     source: Mapped[Optional[str]] = mapped_column(String(50), nullable=True)
 
+    match_results: Mapped[list["MatchResult"]] = relationship(
+        back_populates="vacancy",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="raise_on_sql",
+    )
+
     def __repr__(self) -> str:
         return f"<JobVacancy(id={self.id}, title={self.title})>"
@@ -1,14 +1,69 @@
 """
 Модель MatchResult для хранения результатов сопоставления резюме и вакансии
 """
-from typing import Optional
+from typing import TYPE_CHECKING, Any, Dict, Optional, Sequence
 from uuid import UUID
 
-from sqlalchemy import ForeignKey, JSON, Numeric, String
-from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy import (
+    CHAR,
+    CheckConstraint,
+    Computed,
+    Float,
+    ForeignKey,
+    Index,
+    String,
+    TypeDecorator,
+    UniqueConstraint,
+    func,
+    text,
+)
+from sqlalchemy.dialects.postgresql import JSONB, UUID as PG_UUID, insert as pg_insert
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from .base import Base, TimestampMixin, UUIDMixin
 
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+    from .job_vacancy import JobVacancy
+    from .resume import Resume
+
+# Нечисловые значения дают NULL вместо ошибки приведения при вставке
+EXPERIENCE_TOTAL_MONTHS_SQL = (
+    "CASE WHEN jsonb_typeof(experience_details->'total_months') = 'number' "
+    "THEN (experience_details->>'total_months')::numeric::integer END"
+)
+
+# Строк в одном INSERT: asyncpg ограничивает запрос 32767 параметрами
+UPSERT_CHUNK_SIZE = 1000
+
+# Столбцы, которые ON CONFLICT DO UPDATE не перезаписывает
+_UPSERT_IMMUTABLE_COLUMNS = frozenset({"id", "resume_id", "vacancy_id", "created_at"})
+
+# Рекомендации хранятся однобуквенными кодами CHAR(1)
+RECOMMENDATION_CODES = {"excellent": "E", "good": "G", "maybe": "M", "poor": "P"}
+RECOMMENDATION_NAMES = {code: name for name, code in RECOMMENDATION_CODES.items()}
+
+
+class RecommendationCode(TypeDecorator):
+    """Рекомендация: в Python — 'excellent'/'good'/'maybe'/'poor', в БД — 'E'/'G'/'M'/'P'"""
+
+    impl = CHAR(1)
+    cache_ok = True
+
+    def process_bind_param(self, value: Optional[str], dialect: Any) -> Optional[str]:
+        if value is None:
+            return None
+        try:
+            return RECOMMENDATION_CODES[value]
+        except KeyError:
+            raise ValueError(f"Unknown recommendation: {value!r}") from None
+
+    def process_result_value(self, value: Optional[str], dialect: Any) -> Optional[str]:
+        if value is None:
+            return None
+        return RECOMMENDATION_NAMES[value]
+
 
 class MatchResult(Base, UUIDMixin, TimestampMixin):
     """
@@ -24,6 +79,7 @@ class MatchResult(Base, UUIDMixin, TimestampMixin):
         additional_skills_matched: JSON-массив дополнительных совпавших навыков
         experience_verified: Были ли выполнены требования к опыту
         experience_details: JSON-объект с разбивкой опыта по навыкам
+        experience_total_months: Проекция experience_details->>'total_months' (вычисляемый столбец)
 
         # Метрики унифицированного сопоставления
         overall_score: Комбинированная оценка от всех методов (0-1)
@@ -45,51 +101,142 @@ class MatchResult(Base, UUIDMixin, TimestampMixin):
 
     __tablename__ = "match_results"
 
+    __table_args__ = (
+        # Одна запись на пару (резюме, вакансия); индекс обслуживает точечный поиск
+        UniqueConstraint("resume_id", "vacancy_id", name="uq_match_results_resume_vacancy"),
+        # Лучшие совпадения для вакансии: index-only scan в порядке убывания оценки
+        Index(
+            "ix_match_results_vacancy_score",
+            "vacancy_id",
+            text("overall_score DESC"),
+            postgresql_include=["recommendation", "keyword_score", "tfidf_score", "vector_score"],
+        ),
+        # GIN-индексы для запросов на вхождение по совпавшим навыкам и ключевым словам
+        Index(
+            "ix_match_results_matched_skills_gin",
+            "matched_skills",
+            postgresql_using="gin",
+            postgresql_ops={"matched_skills": "jsonb_path_ops"},
+        ),
+        Index(
+            "ix_match_results_tfidf_matched_gin",
+            "tfidf_matched",
+            postgresql_using="gin",
+            postgresql_ops={"tfidf_matched": "jsonb_path_ops"},
+        ),
+        # Диапазонные фильтры «кандидаты с опытом >= N месяцев» без разбора JSONB
+        Index("ix_match_results_experience_total_months", "experience_total_months"),
+        # BRIN для выборок по временному окну: строки добавляются по возрастанию created_at
+        Index(
+            "brin_match_results_created_at",
+            "created_at",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
+        CheckConstraint(
+            "recommendation IN ('E', 'G', 'M', 'P')",
+            name="ck_match_results_recommendation",
+        ),
+    )
+
     resume_id: Mapped[UUID] = mapped_column(
-        ForeignKey("resumes.id", ondelete="CASCADE"), nullable=False, index=True
+        PG_UUID(as_uuid=True),
+        ForeignKey("resumes.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
     )
     vacancy_id: Mapped[UUID] = mapped_column(
-        ForeignKey("job_vacancies.id", ondelete="CASCADE"), nullable=False, index=True
+        PG_UUID(as_uuid=True),
+        ForeignKey("job_vacancies.id", ondelete="CASCADE"),
+        nullable=False,
     )
 
     # Устаревшие поля
     match_percentage: Mapped[float] = mapped_column(
-        Numeric(5, 2), nullable=False, default=0.0
+        Float, nullable=False, default=0.0
     )
-    matched_skills: Mapped[Optional[list]] = mapped_column(JSON, nullable=True)
-    missing_skills: Mapped[Optional[list]] = mapped_column(JSON, nullable=True)
-    additional_skills_matched: Mapped[Optional[list]] = mapped_column(JSON, nullable=True)
+    matched_skills: Mapped[Optional[list]] = mapped_column(JSONB, nullable=True)
+    missing_skills: Mapped[Optional[list]] = mapped_column(JSONB, nullable=True)
+    additional_skills_matched: Mapped[Optional[list]] = mapped_column(JSONB, nullable=True)
     experience_verified: Mapped[Optional[bool]] = mapped_column(nullable=True, default=None)
-    experience_details: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
+    experience_details: Mapped[Optional[dict]] = mapped_column(JSONB, nullable=True)
+    experience_total_months: Mapped[Optional[int]] = mapped_column(
+        Computed(EXPERIENCE_TOTAL_MONTHS_SQL, persisted=True), nullable=True
+    )
 
     # Метрики унифицированного сопоставления
     overall_score: Mapped[Optional[float]] = mapped_column(
-        Numeric(5, 4), nullable=True, default=None
+        Float, nullable=True, default=None
     )
     keyword_score: Mapped[Optional[float]] = mapped_column(
-        Numeric(5, 4), nullable=True, default=None
+        Float, nullable=True, default=None
     )
     tfidf_score: Mapped[Optional[float]] = mapped_column(
-        Numeric(5, 4), nullable=True, default=None
+        Float, nullable=True, default=None
     )
     vector_score: Mapped[Optional[float]] = mapped_column(
-        Numeric(5, 4), nullable=True, default=None
+        Float, nullable=True, default=None
     )
     vector_similarity: Mapped[Optional[float]] = mapped_column(
-        Numeric(5, 4), nullable=True, default=None
+        Float, nullable=True, default=None
     )
     recommendation: Mapped[Optional[str]] = mapped_column(
-        String(20), nullable=True, default=None
+        RecommendationCode, nullable=True, default=None
     )
     keyword_passed: Mapped[Optional[bool]] = mapped_column(nullable=True, default=None)
     tfidf_passed: Mapped[Optional[bool]] = mapped_column(nullable=True, default=None)
     vector_passed: Mapped[Optional[bool]] = mapped_column(nullable=True, default=None)
-    tfidf_matched: Mapped[Optional[list]] = mapped_column(JSON, nullable=True)
-    tfidf_missing: Mapped[Optional[list]] = mapped_column(JSON, nullable=True)
+    tfidf_matched: Mapped[Optional[list]] = mapped_column(JSONB, nullable=True)
+    tfidf_missing: Mapped[Optional[list]] = mapped_column(JSONB, nullable=True)
     matcher_version: Mapped[Optional[str]] = mapped_column(
         String(50), nullable=True, default="unified-v1"
     )
 
+    resume: Mapped["Resume"] = relationship(back_populates="match_results", lazy="raise_on_sql")
+    vacancy: Mapped["JobVacancy"] = relationship(back_populates="match_results", lazy="raise_on_sql")
+
+    @classmethod
+    async def bulk_upsert(cls, session: "AsyncSession", rows: Sequence[Dict[str, Any]]) -> None:
+        """
+        Записать результаты сопоставления пакетом через
+        INSERT ... ON CONFLICT (resume_id, vacancy_id) DO UPDATE.
+
+        Вместо SELECT + INSERT/UPDATE на каждую пару (резюме, вакансия)
+        выполняется один многострочный INSERT на UPSERT_CHUNK_SIZE строк.
+        Все строки должны содержать одинаковый набор столбцов; при повторе
+        пары в rows сохраняется последняя строка.
+
+        Args:
+            session: Асинхронная сессия базы данных
+            rows: Словари со значениями столбцов, включая resume_id и vacancy_id
+
+        Example:
+            >>> await MatchResult.bulk_upsert(db, [
+            ...     {"resume_id": resume_id, "vacancy_id": vacancy_id, "overall_score": 0.82},
+            ... ])
+        """
+        if not rows:
+            return
+
+        # Одна и та же строка не может обновляться дважды в одном INSERT ... ON CONFLICT
+        unique_rows = list({(row["resume_id"], row["vacancy_id"]): row for row in rows}.values())
+
+        for start in range(0, len(unique_rows), UPSERT_CHUNK_SIZE):
+            chunk = unique_rows[start:start + UPSERT_CHUNK_SIZE]
+            stmt = pg_insert(cls).values(chunk)
+            update_columns = {
+                key: stmt.excluded[key]
+                for key in chunk[0]
+                if key not in _UPSERT_IMMUTABLE_COLUMNS
+            }
+            update_columns["updated_at"] = func.now()
+            await session.execute(
+                stmt.on_conflict_do_update(
+                    index_elements=["resume_id", "vacancy_id"],
+                    set_=update_columns,
+                )
+            )
+
     def __repr__(self) -> str:
         return (
             f"<MatchResult(id={self.id}, resume_id={self.resume_id}, "
@@ -2,13 +2,18 @@
 Модель Resume для хранения данных загруженных резюме
 """
 import enum
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
-from sqlalchemy import Enum, String, Text
-from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy import Enum, Index, String, Text
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from .base import Base, TimestampMixin, UUIDMixin
 
+if TYPE_CHECKING:
+    from .candidate_feedback import CandidateFeedback
+    from .hiring_stage import HiringStage
+    from .match_result import MatchResult
+
 
 class ResumeStatus(str, enum.Enum):
     """Статус обработки резюме"""
@@ -33,9 +38,17 @@ class Resume(Base, UUIDMixin, TimestampMixin):
         language: Обнаруженный язык (en, ru и т.д.)
         error_message: Сообщение об ошибке, если обработка не удалась
         uploaded_at: Временная метка загрузки резюме (унаследовано от TimestampMixin)
+
+    Связи объявлены с lazy="raise_on_sql": загружать их нужно явно
+    через selectinload(), случайная ленивая загрузка (N+1) вызывает ошибку.
     """
 
     __tablename__ = "resumes"
+    __table_args__ = (
+        # Один файл - одна запись; цель ON CONFLICT (file_path) при массовой загрузке.
+        # filename не уникален: пользователи загружают разные резюме под одним именем
+        Index("uq_resumes_file_path", "file_path", unique=True),
+    )
 
     filename: Mapped[str] = mapped_column(String(255), nullable=False)
     file_path: Mapped[str] = mapped_column(String(512), nullable=False)
@@ -47,5 +60,24 @@ class Resume(Base, UUIDMixin, TimestampMixin):
     language: Mapped[Optional[str]] = mapped_column(String(10), nullable=True)
     error_message: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
 
+    match_results: Mapped[list["MatchResult"]] = relationship(
+        back_populates="resume",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="raise_on_sql",
+    )
+    candidate_feedback: Mapped[list["CandidateFeedback"]] = relationship(
+        back_populates="resume",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="raise_on_sql",
+    )
+    hiring_stages: Mapped[list["HiringStage"]] = relationship(
+        back_populates="resume",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="raise_on_sql",
+    )
+
     def __repr__(self) -> str:
         return f"<Resume(id={self.id}, filename={self.filename}, status={self.status.value})>"
@@ -11,7 +11,8 @@
 from typing import Optional
 from uuid import UUID
 
-from sqlalchemy import ForeignKey, JSON, Text
+from sqlalchemy import CHAR, REAL, CheckConstraint, ForeignKey, Index, SmallInteger, String, Text
+from sqlalchemy.dialects.postgresql import JSONB, UUID as PG_UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
 from .base import Base, TimestampMixin, UUIDMixin
@@ -30,6 +31,7 @@ class ResumeAnalysis(Base, UUIDMixin, TimestampMixin):
         resume_id: Внешний ключ к Resume
         language: Обнаруженный язык (en, ru и т.д.)
         raw_text: Извлеченный текст из резюме
+        content_hash: SHA-256 raw_text (hex) для поиска уже проанализированного текста
 
         # Извлечённые данные
         skills: Список извлечённых технических навыков
@@ -52,34 +54,60 @@ class ResumeAnalysis(Base, UUIDMixin, TimestampMixin):
     """
 
     __tablename__ = "resume_analyses"
+    __table_args__ = (
+        # Единственный индекс по resume_id: уникальность, каскадное удаление и
+        # чтение оценки качества без обращения к таблице (index-only scan).
+        # skills в INCLUDE не добавляется: JSONB-массив может превысить
+        # предельный размер записи B-tree индекса
+        Index(
+            "ix_resume_analyses_resume_covering",
+            "resume_id",
+            unique=True,
+            postgresql_include=["quality_score"],
+        ),
+        # GIN-индекс для поиска резюме по навыку (skills @> '["python"]')
+        Index(
+            "ix_resume_analyses_skills_gin",
+            "skills",
+            postgresql_using="gin",
+            postgresql_ops={"skills": "jsonb_path_ops"},
+        ),
+        CheckConstraint(
+            "quality_score BETWEEN 0 AND 100",
+            name="ck_resume_analyses_quality_score",
+        ),
+    )
 
     # Ссылка на резюме
     resume_id: Mapped[UUID] = mapped_column(
-        ForeignKey("resumes.id", ondelete="CASCADE"), nullable=False, unique=True, index=True
+        PG_UUID(as_uuid=True),
+        ForeignKey("resumes.id", ondelete="CASCADE"),
+        nullable=False,
     )
 
     # Язык и текст
-    language: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    language: Mapped[Optional[str]] = mapped_column(String(8), nullable=True)
     raw_text: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    content_hash: Mapped[Optional[str]] = mapped_column(CHAR(64), nullable=True, index=True)
 
-    # Извлечённые данные (JSON-поля для гибкости)
-    skills: Mapped[Optional[list]] = mapped_column(JSON, nullable=True)
-    keywords: Mapped[Optional[list]] = mapped_column(JSON, nullable=True)
-    entities: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
+    # Извлечённые данные (JSONB-поля для гибкости)
+    skills: Mapped[Optional[list]] = mapped_column(JSONB, nullable=True)
+    keywords: Mapped[Optional[list]] = mapped_column(JSONB, nullable=True)
+    entities: Mapped[Optional[dict]] = mapped_column(JSONB, nullable=True)
 
     # Результаты анализа
     total_experience_months: Mapped[Optional[int]] = mapped_column(nullable=True)
-    education: Mapped[Optional[list]] = mapped_column(JSON, nullable=True)
-    contact_info: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
+    education: Mapped[Optional[list]] = mapped_column(JSONB, nullable=True)
+    contact_info: Mapped[Optional[dict]] = mapped_column(JSONB, nullable=True)
 
     # Метрики качества
-    grammar_issues: Mapped[Optional[list]] = mapped_column(JSON, nullable=True)
-    warnings: Mapped[Optional[list]] = mapped_column(JSON, nullable=True)
-    quality_score: Mapped[Optional[int]] = mapped_column(nullable=True)
+    grammar_issues: Mapped[Optional[list]] = mapped_column(JSONB, nullable=True)
+    warnings: Mapped[Optional[list]] = mapped_column(JSONB, nullable=True)
+    quality_score: Mapped[Optional[int]] = mapped_column(SmallInteger, nullable=True)
 
     # Метаданные обработки
-    processing_time_seconds: Mapped[Optional[float]] = mapped_column(nullable=True)
-    analyzer_version: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    processing_time_seconds: Mapped[Optional[float]] = mapped_column(REAL, nullable=True)
+    analyzer_version: Mapped[Optional[str]] = mapped_column(String(32), nullable=True)
 
     def __repr__(self) -> str:
         return f"<ResumeAnalysis(id={self.id}, resume_id={self.resume_id}, language={self.language})>"
@@ -3,7 +3,8 @@ SavedSearch model for storing user search queries and filter configurations
 """
 from typing import Optional
 
-from sqlalchemy import JSON, String, Text
+from sqlalchemy import Index, String, Text, text
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column
 
 from .base import Base, TimestampMixin, UUIDMixin
@@ -23,10 +24,21 @@ class SavedSearch(Base, UUIDMixin, TimestampMixin):
     """
 
     __tablename__ = "saved_searches"
+    __table_args__ = (
+        # GIN index for filter containment lookups (filters @> '{"language": "ru"}')
+        Index(
+            "ix_saved_searches_filters_gin",
+            "filters",
+            postgresql_using="gin",
+            postgresql_ops={"filters": "jsonb_path_ops"},
+        ),
+    )
 
     name: Mapped[str] = mapped_column(String(255), nullable=False, index=True)
     query: Mapped[str] = mapped_column(Text, nullable=False)
-    filters: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True, server_default="{}")
+    filters: Mapped[Optional[dict]] = mapped_column(
+        JSONB, nullable=True, server_default=text("'{}'::jsonb")
+    )
 
     def __repr__(self) -> str:
         return f"<SavedSearch(id={self.id}, name={self.name})>"
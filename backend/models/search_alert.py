@@ -4,7 +4,8 @@
 from typing import Optional
 from uuid import UUID
 
-from sqlalchemy import ForeignKey, Boolean, Text
+from sqlalchemy import ForeignKey, Boolean, Index, Text, text
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
 from .base import Base, TimestampMixin, UUIDMixin
@@ -26,14 +27,29 @@ class SearchAlert(Base, UUIDMixin, TimestampMixin):
     """
 
     __tablename__ = "search_alerts"
+    __table_args__ = (
+        # Неотправленные оповещения поиска; отправленные в индекс не попадают.
+        # Заменяет отдельный индекс по is_sent, почти бесполезный для булева столбца
+        Index(
+            "ix_search_alerts_search_unsent",
+            "saved_search_id",
+            postgresql_where=text("is_sent = false"),
+        ),
+    )
 
     saved_search_id: Mapped[UUID] = mapped_column(
-        ForeignKey("saved_searches.id", ondelete="CASCADE"), nullable=False, index=True
+        PG_UUID(as_uuid=True),
+        ForeignKey("saved_searches.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
     )
     resume_id: Mapped[UUID] = mapped_column(
-        ForeignKey("resumes.id", ondelete="CASCADE"), nullable=False, index=True
+        PG_UUID(as_uuid=True),
+        ForeignKey("resumes.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
     )
-    is_sent: Mapped[bool] = mapped_column(Boolean, nullable=False, server_default="false", index=True)
+    is_sent: Mapped[bool] = mapped_column(Boolean, nullable=False, server_default="false")
     sent_at: Mapped[Optional[object]] = mapped_column(
         nullable=True
     )  # DateTime timezone=True type
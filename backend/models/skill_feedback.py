@@ -4,7 +4,8 @@
 from typing import Optional
 from uuid import UUID
 
-from sqlalchemy import ForeignKey, JSON, String, Text
+from sqlalchemy import ForeignKey, Index, String, Text, text
+from sqlalchemy.dialects.postgresql import JSONB, UUID as PG_UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
 from .base import Base, TimestampMixin, UUIDMixin
@@ -32,15 +33,32 @@ class SkillFeedback(Base, UUIDMixin, TimestampMixin):
     """
 
     __tablename__ = "skill_feedback"
+    __table_args__ = (
+        # Агрегация обратной связи выбирает только необработанные записи за период;
+        # обработанные (подавляющее большинство) в индекс не попадают
+        Index(
+            "ix_skill_feedback_unprocessed",
+            "created_at",
+            postgresql_where=text("processed = false"),
+        ),
+    )
 
     resume_id: Mapped[UUID] = mapped_column(
-        ForeignKey("resumes.id", ondelete="CASCADE"), nullable=False, index=True
+        PG_UUID(as_uuid=True),
+        ForeignKey("resumes.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
     )
     vacancy_id: Mapped[UUID] = mapped_column(
-        ForeignKey("job_vacancies.id", ondelete="CASCADE"), nullable=False, index=True
+        PG_UUID(as_uuid=True),
+        ForeignKey("job_vacancies.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
     )
     match_result_id: Mapped[Optional[UUID]] = mapped_column(
-        ForeignKey("match_results.id", ondelete="SET NULL"), nullable=True
+        PG_UUID(as_uuid=True),
+        ForeignKey("match_results.id", ondelete="SET NULL"),
+        nullable=True,
     )
     skill: Mapped[str] = mapped_column(String(255), nullable=False)
     was_correct: Mapped[bool] = mapped_column(nullable=False)
@@ -51,7 +69,7 @@ class SkillFeedback(Base, UUIDMixin, TimestampMixin):
         String(50), nullable=False, default="api"
     )
     processed: Mapped[bool] = mapped_column(nullable=False, default=False)
-    extra_metadata: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
+    extra_metadata: Mapped[Optional[dict]] = mapped_column(JSONB, nullable=True)
 
     def __repr__(self) -> str:
         return f"<SkillFeedback(id={self.id}, skill={self.skill}, correct={self.was_correct})>"
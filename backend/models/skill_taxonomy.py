@@ -3,7 +3,8 @@
 """
 from typing import Optional
 
-from sqlalchemy import JSON
+from sqlalchemy import Index, text
+from sqlalchemy.dialects.postgresql import CITEXT, JSONB
 from sqlalchemy.orm import Mapped, mapped_column
 
 from .base import Base, TimestampMixin, UUIDMixin
@@ -26,12 +27,31 @@ class SkillTaxonomy(Base, UUIDMixin, TimestampMixin):
     """
 
     __tablename__ = "skill_taxonomies"
-
-    industry: Mapped[str] = mapped_column(nullable=False, index=True)
-    skill_name: Mapped[str] = mapped_column(nullable=False, index=True)
+    __table_args__ = (
+        # Поиск навыка отрасли по каноническому имени; покрывает и запросы по одной отрасли
+        Index("ix_skill_taxonomies_industry_name", "industry", "skill_name"),
+        # Только активные записи отрасли
+        Index(
+            "ix_skill_taxonomies_active_industry",
+            "industry",
+            postgresql_where=text("is_active"),
+        ),
+        # GIN-индекс для поиска канонического навыка по написанию (variants @> '["js"]')
+        Index(
+            "ix_skill_taxonomies_variants_gin",
+            "variants",
+            postgresql_using="gin",
+            postgresql_ops={"variants": "jsonb_path_ops"},
+        ),
+    )
+
+    industry: Mapped[str] = mapped_column(nullable=False)
+    # CITEXT: сравнение без учёта регистра обслуживается обычным btree-индексом
+    # без lower(skill_name); требует расширения citext
+    skill_name: Mapped[str] = mapped_column(CITEXT, nullable=False, index=True)
     context: Mapped[Optional[str]] = mapped_column(nullable=True)
-    variants: Mapped[Optional[list]] = mapped_column(JSON, nullable=True)
-    extra_metadata: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
+    variants: Mapped[Optional[list]] = mapped_column(JSONB, nullable=True)
+    extra_metadata: Mapped[Optional[dict]] = mapped_column(JSONB, nullable=True)
     is_active: Mapped[bool] = mapped_column(nullable=False, default=True)
 
     def __repr__(self) -> str:
@@ -1,14 +1,18 @@
 """
 Анализ того, какие навыки извлекаются из тестовых резюме.
 """
+import os
 import sys
 import asyncio
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from analyzers import extract_resume_entities
-from services.data_extractor.extract import extract_text_from_docx
+from analyzers._cache import cached_docx_text, cached_resume_entities
+
+
+# Разбор docx и NLP загружают CPU: не больше одного резюме на ядро одновременно
+_cpu_slots = asyncio.Semaphore(os.cpu_count() or 1)
 
 
 async def analyze_cv(cv_num: int):
@@ -18,12 +22,14 @@ async def analyze_cv(cv_num: int):
     if not cv_path.exists():
         return None
 
-    # Извлечение текста
-    result = extract_text_from_docx(str(cv_path))
-    text = result.get("text", "")
+    async with _cpu_slots:
+        # Извлечение текста (в пуле потоков, чтобы резюме обрабатывались параллельно;
+        # при повторном запуске текст берётся из дискового кэша)
+        result = await asyncio.to_thread(cached_docx_text, str(cv_path))
+        text = result.get("text", "")
 
-    # Извлечение сущностей
-    entities = extract_resume_entities(text)
+        # Извлечение сущностей
+        entities = await asyncio.to_thread(cached_resume_entities, text)
 
     skills = entities.get("skills") or entities.get("technical_skills") or []
 
@@ -39,8 +45,8 @@ async def main():
     """Проанализировать первые 5 резюме."""
     print("Анализ извлечения навыков из тестовых резюме...\n")
     
-    for i in range(1, 6):
-        info = await analyze_cv(i)
+    results = await asyncio.gather(*(analyze_cv(i) for i in range(1, 6)))
+    for info in results:
         if info:
             print(f"CV {info['cv']}: {info['num_skills']} skills extracted")
             print(f"  Text length: {info['text_length']} chars")
@@ -8,13 +8,19 @@ from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from analyzers import extract_resume_entities
-from services.data_extractor.extract import extract_text_from_docx
+from analyzers import get_enhanced_matcher
+from analyzers._cache import cached_docx_text, cached_resume_entities
 from sqlalchemy import select
 from database import async_session_maker
 from models.job_vacancy import JobVacancy
 
 
+# URL эндпоинта ранжирования вакансий для резюме
+MATCH_ALL_URL = "http://localhost:8000/api/vacancies/match-all"
+
+# Один клиент на запуск: запросы по нескольким резюме идут через общий пул соединений
+CLIENT = httpx.AsyncClient(timeout=60.0, limits=httpx.Limits(max_connections=20))
+
 # Карта ID вакансий
 VACANCY_NAMES = {
     1: ".Net Developer",
@@ -25,7 +31,13 @@ VACANCY_NAMES = {
 }
 
 
-async def detailed_analysis(cv_num: int):
+async def fetch_api_result(cv_num: int) -> dict:
+    """Получить ранжирование вакансий от API для резюме."""
+    response = await CLIENT.post(MATCH_ALL_URL, params={"resume_id": cv_num})
+    return response.json()
+
+
+async def detailed_analysis(cv_num: int, api_result: dict | None = None):
     """Показать детальный анализ сопоставления."""
     print(f"\n{'='*80}")
     print(f"DETAILED ANALYSIS FOR CV {cv_num}")
@@ -33,36 +45,37 @@ async def detailed_analysis(cv_num: int):
     
     # Извлечение текста и навыков
     cv_path = Path(f"data/uploads/{cv_num}.docx")
-    result = extract_text_from_docx(str(cv_path))
+    result = cached_docx_text(str(cv_path))
     text = result.get("text", "")
-    entities = extract_resume_entities(text)
+    entities = cached_resume_entities(text)
     resume_skills = entities.get("skills") or entities.get("technical_skills") or []
 
     print(f"Навыки резюме ({len(resume_skills)}):")
     print(f"  {', '.join(resume_skills[:15])}")
     print()
 
-    # Получение вакансий
+    # Получение вакансий (только нужные столбцы, без description)
     async with async_session_maker() as session:
-        result = await session.execute(select(JobVacancy))
-        vacancies = result.scalars().all()
+        result = await session.execute(
+            select(JobVacancy.id, JobVacancy.title, JobVacancy.required_skills)
+            .order_by(JobVacancy.id)
+        )
+        vacancies = result.all()
 
-    # Сопоставление с каждой вакансией
-    from analyzers import EnhancedSkillMatcher
-    matcher = EnhancedSkillMatcher()
+    # Тот же сопоставитель (синонимы и нечёткое сравнение), что и в ранжировании API
+    matcher = get_enhanced_matcher()
 
     print("Сопоставление с вакансиями:\n")
     
     matches = []
-    for i, vacancy in enumerate(sorted(vacancies, key=lambda v: v.id), 1):
-        required = vacancy.required_skills or []
-        additional = vacancy.additional_requirements or []
-        
+    for i, (_, title, required) in enumerate(vacancies, 1):
+        required = required or []
+
         match_results = matcher.match_multiple(
             resume_skills=resume_skills,
             required_skills=required,
         )
-        
+
         matched = [s for s, r in match_results.items() if r.get("matched")]
         missing = [s for s, r in match_results.items() if not r.get("matched")]
         
@@ -70,14 +83,14 @@ async def detailed_analysis(cv_num: int):
         
         matches.append({
             'id': i,
-            'title': vacancy.title,
+            'title': title,
             'required': required,
             'matched': matched,
             'missing': missing,
             'match_pct': match_pct,
         })
         
-        print(f"{i}. {vacancy.title}")
+        print(f"{i}. {title}")
         print(f"   Required: {', '.join(required)}")
         print(f"   Matched: {', '.join(matched) if matched else '(none)'}")
         print(f"   Missing: {', '.join(missing) if missing else '(none)'}")
@@ -85,17 +98,24 @@ async def detailed_analysis(cv_num: int):
         print()
     
     # Get API result
-    async with httpx.AsyncClient() as client:
-        response = await client.post(
-            f"http://localhost:8000/api/vacancies/match-all?resume_id={cv_num}",
-            timeout=60.0
-        )
-        api_result = response.json()
-    
+    if api_result is None:
+        api_result = await fetch_api_result(cv_num)
+
     print("API Ranking:")
     for i, match in enumerate(api_result.get('matches', []), 1):
         print(f"  {i}. {match['vacancy_title']} - {match['match_percentage']}%")
 
 
+async def main(cv_nums: list[int]):
+    """Проанализировать несколько резюме; запросы к API выполняются параллельно."""
+    try:
+        api_results = await asyncio.gather(*(fetch_api_result(cv_num) for cv_num in cv_nums))
+        for cv_num, api_result in zip(cv_nums, api_results):
+            await detailed_analysis(cv_num, api_result)
+    finally:
+        await CLIENT.aclose()
+
+
 if __name__ == "__main__":
-    asyncio.run(detailed_analysis(3))  # CV 3 had good NDCG
+    # Номера резюме из аргументов; по умолчанию CV 3 (had good NDCG)
+    asyncio.run(main([int(arg) for arg in sys.argv[1:]] or [3]))
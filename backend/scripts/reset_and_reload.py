@@ -8,9 +8,10 @@ import sys
 import os
 import glob
 import csv
-import uuid
 import time
 import random
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -20,12 +21,19 @@ from models.resume import Resume, ResumeStatus
 from models.resume_analysis import ResumeAnalysis
 from models.match_result import MatchResult
 from models.job_vacancy import JobVacancy
+from models.base import uuid7
+from utils.json_codec import json_serializer
 from sqlalchemy import delete, select, text
-from services.data_extractor.extract import extract_text_from_pdf, extract_text_from_docx
-from analyzers.hf_skill_extractor import extract_resume_skills, extract_resume_keywords
-from analyzers.ner_extractor import extract_resume_entities
-from analyzers.analysis_saver import save_resume_analysis
-from langdetect import detect
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from services.data_extractor.extract import extract_text_from_pdf
+from analyzers.hf_skill_extractor import extract_resume_skills
+from analyzers._cache import cached_docx_text, cached_resume_entities, cached_resume_skills, content_hash
+from analyzers._language import detect_language_code
+from langdetect import DetectorFactory
+
+# langdetect is randomized per call; a fixed seed makes reloads reproducible.
+# Language profiles are loaded once per worker process on the first detection
+DetectorFactory.seed = 0
 
 # Конфигурация
 TEST_DATA_DIR = "./testdata/vacancy-resume-matching-dataset"
@@ -33,6 +41,40 @@ TEST_DATA_DIR = "./testdata/vacancy-resume-matching-dataset"
 if not os.path.exists(TEST_DATA_DIR):
     TEST_DATA_DIR = "./testdata"
 
+# Rows per bulk INSERT (SQLAlchemy splits executemany into multi-row VALUES)
+BATCH_SIZE = 1000
+
+# Resume parsing processes. Each one loads its own SpaCy/HF models, so memory
+# grows with the count; override with RELOAD_PARSE_WORKERS
+PARSE_WORKERS = int(os.environ.get('RELOAD_PARSE_WORKERS', 0)) or min(os.cpu_count() or 1, 4)
+
+# resume_analyses columns written by COPY; the rest take their server defaults
+ANALYSIS_COPY_COLUMNS = [
+    'id',
+    'resume_id',
+    'raw_text',
+    'content_hash',
+    'language',
+    'skills',
+    'keywords',
+    'entities',
+    'quality_score',
+    'processing_time_seconds',
+    'analyzer_version',
+]
+ANALYSIS_JSON_COLUMNS = {'skills', 'keywords', 'entities'}
+
+# job_vacancies columns written by COPY; id, timestamps and
+# additional_requirements take their server defaults
+VACANCY_COPY_COLUMNS = [
+    'title',
+    'description',
+    'location',
+    'work_format',
+    'required_skills',
+    'min_experience_months',
+]
+
 
 async def clear_database():
     """Очистить все данные, связанные с резюме."""
@@ -52,6 +94,99 @@ async def clear_database():
         print("  Database cleared")
 
 
+async def _insert_resume_batch(db, resumes: list, analyses: list) -> int:
+    """
+    Insert a batch of resumes and their analyses.
+
+    Resumes go through one multi-row INSERT ... ON CONFLICT (file_path)
+    DO NOTHING; only analyses of resumes that were actually inserted are
+    written. Analyses carry up to 50KB of raw_text each and are streamed
+    with binary COPY on the same asyncpg connection (and transaction), so
+    the server does not parse quoted SQL literals.
+
+    Returns:
+        Number of resumes inserted
+    """
+    if not resumes:
+        return 0
+    inserted_ids = set(
+        (
+            await db.execute(
+                pg_insert(Resume)
+                .values(resumes)
+                .on_conflict_do_nothing(index_elements=[Resume.file_path])
+                .returning(Resume.id)
+            )
+        ).scalars()
+    )
+    analyses = [row for row in analyses if row['resume_id'] in inserted_ids]
+
+    connection = await db.connection()
+    raw_connection = await connection.get_raw_connection()
+    # JSON columns are passed pre-serialized: the connection's json/jsonb
+    # codecs installed by SQLAlchemy expect text
+    records = [
+        tuple(
+            json_serializer(row[column]) if column in ANALYSIS_JSON_COLUMNS else row[column]
+            for column in ANALYSIS_COPY_COLUMNS
+        )
+        for row in analyses
+    ]
+    await raw_connection.driver_connection.copy_records_to_table(
+        ResumeAnalysis.__tablename__,
+        records=records,
+        columns=ANALYSIS_COPY_COLUMNS,
+    )
+    await db.commit()
+    return len(inserted_ids)
+
+
+def _parse_resume_file(resume_path: str):
+    """
+    Extract text, language, skills and entities from one resume file.
+
+    Runs in a worker process (CPU-bound parsing and NLP), so it only takes
+    and returns picklable values. Returns None when the file has no text.
+    """
+    filename = os.path.basename(resume_path)
+    if filename.lower().endswith('.pdf'):
+        result = extract_text_from_pdf(resume_path)
+    else:
+        result = cached_docx_text(resume_path)
+
+    text = result.get('text', '')
+
+    if not text or len(text) < 50:
+        return None
+
+    # Detect language
+    try:
+        lang_code = detect_language_code(text)
+        if lang_code == 'ru':
+            language = 'ru'
+        elif lang_code == 'en':
+            language = 'en'
+        else:
+            language = lang_code
+    except:
+        language = 'en'
+
+    # Extract skills with pattern matching (cleaner results).
+    # NLP results are cached by text hash, so reloading the same files skips it
+    skills = cached_resume_skills(
+        text, method='pattern', top_n=30
+    )
+
+    return {
+        'text': text,
+        'content_hash': content_hash(text),
+        'language': language,
+        'skills': skills.get('skills') or [],
+        # Extract entities
+        'entities': cached_resume_entities(text),
+    }
+
+
 async def load_resumes(resume_dir: str):
     """Load resumes from directory."""
     print(f"Loading resumes from {resume_dir}...")
@@ -66,99 +201,121 @@ async def load_resumes(resume_dir: str):
     failed = 0
 
     async with async_session_maker() as db:
+        # Known paths are skipped before the (expensive) parsing; the
+        # ON CONFLICT in _insert_resume_batch is what guarantees uniqueness
+        existing_paths = set((await db.execute(select(Resume.file_path))).scalars())
+        # Texts already analyzed under another filename
+        existing_hashes = set(
+            (
+                await db.execute(
+                    select(ResumeAnalysis.content_hash).where(
+                        ResumeAnalysis.content_hash.is_not(None)
+                    )
+                )
+            ).scalars()
+        )
+
+        pending_files = []
         for resume_path in resume_files:
             filename = os.path.basename(resume_path)
 
             # Check if already exists
-            existing = await db.execute(
-                select(Resume).where(Resume.filename == filename)
-            )
-            if existing.scalar_one_or_none():
+            if resume_path in existing_paths:
                 print(f"  Skipping (duplicate): {filename}")
                 continue
-
-            # Extract text
-            try:
-                if filename.lower().endswith('.pdf'):
-                    result = extract_text_from_pdf(resume_path)
-                else:
-                    result = extract_text_from_docx(resume_path)
-
-                text = result.get('text', '')
-
-                if not text or len(text) < 50:
-                    print(f"  Skipping (no text): {filename}")
-                    failed += 1
-                    continue
-
-                # Detect language
-                try:
-                    lang_code = detect(text[:1000])
-                    if lang_code == 'ru':
-                        language = 'ru'
-                    elif lang_code == 'en':
-                        language = 'en'
-                    else:
-                        language = lang_code
-                except:
-                    language = 'en'
-
-                # Extract skills with pattern matching (cleaner results)
-                skills = extract_resume_skills(
-                    text, method='pattern', top_n=30
-                )
-                skills_list = skills.get('skills', [])
-
-                # Extract entities
-                entities = extract_resume_entities(text)
-
-                # Determine content type
-                content_type = 'application/pdf' if filename.lower().endswith('.pdf') else 'application/vnd.openxmlformats-officedocument.wordprocessingml.document'
-
-                # Create resume
-                resume = Resume(
-                    id=uuid.uuid4(),
-                    filename=filename,
-                    file_path=resume_path,
-                    content_type=content_type,
-                    status=ResumeStatus.COMPLETED,
-                    language=language,
-                    raw_text=text[:10000],  # Store sample
-                )
-                db.add(resume)
-                await db.flush()  # Get the ID
-
-                # Simulate processing time (1-3 seconds)
-                processing_time = 1.0 + random.random() * 2.0
-
-                # Save analysis
-                await save_resume_analysis(
-                    db=db,
-                    resume_id=resume.id,
-                    raw_text=text[:50000],
-                    language=language,
-                    skills=skills_list,
-                    keywords=[{'keyword': s, 'score': 0.8} for s in skills_list[:20]],
-                    entities=entities,
-                    quality_score=75,  # Default good score
-                    processing_time_seconds=processing_time,
-                    analyzer_version="2.0.0"
+            existing_paths.add(resume_path)
+            pending_files.append(resume_path)
+
+        resume_rows = []
+        analysis_rows = []
+        loop = asyncio.get_running_loop()
+
+        # Parsing is CPU-bound: fan files out to PARSE_WORKERS processes, keep DB
+        # writes here. Workers are spawned, not forked, so they do not inherit the
+        # session's open asyncpg connection or the engine pool
+        with ProcessPoolExecutor(
+            max_workers=PARSE_WORKERS, mp_context=multiprocessing.get_context('spawn')
+        ) as pool:
+            for batch_start in range(0, len(pending_files), BATCH_SIZE):
+                batch_files = pending_files[batch_start:batch_start + BATCH_SIZE]
+                results = await asyncio.gather(
+                    *(loop.run_in_executor(pool, _parse_resume_file, path) for path in batch_files),
+                    return_exceptions=True,
                 )
 
-                loaded += 1
-                print(f"  Loaded: {filename} ({len(skills_list)} skills, lang={language})")
+                for resume_path, parsed in zip(batch_files, results):
+                    filename = os.path.basename(resume_path)
 
-            except Exception as e:
-                print(f"  ERROR loading {filename}: {str(e)[:100]}")
-                await db.rollback()
-                failed += 1
+                    if isinstance(parsed, BaseException):
+                        print(f"  ERROR loading {filename}: {str(parsed)[:100]}")
+                        failed += 1
+                        continue
+                    if parsed is None:
+                        print(f"  Skipping (no text): {filename}")
+                        failed += 1
+                        continue
 
-        await db.commit()
+                    if parsed['content_hash'] in existing_hashes:
+                        print(f"  Skipping (same content already loaded): {filename}")
+                        continue
+                    existing_hashes.add(parsed['content_hash'])
+
+                    text = parsed['text']
+                    language = parsed['language']
+                    skills_list = parsed['skills']
+
+                    # Determine content type
+                    content_type = 'application/pdf' if filename.lower().endswith('.pdf') else 'application/vnd.openxmlformats-officedocument.wordprocessingml.document'
+
+                    # IDs are generated here, so analyses reference them without a flush
+                    resume_id = uuid7()
+                    resume_rows.append({
+                        'id': resume_id,
+                        'filename': filename,
+                        'file_path': resume_path,
+                        'content_type': content_type,
+                        'status': ResumeStatus.COMPLETED,
+                        'language': language,
+                        'raw_text': text[:10000],  # Store sample
+                    })
+                    analysis_rows.append({
+                        'id': uuid7(),
+                        'resume_id': resume_id,
+                        'raw_text': text[:50000],
+                        'content_hash': parsed['content_hash'],
+                        'language': language,
+                        'skills': skills_list,
+                        'keywords': [{'keyword': s, 'score': 0.8} for s in skills_list[:20]],
+                        'entities': parsed['entities'],
+                        'quality_score': 75,  # Default good score
+                        # Simulate processing time (1-3 seconds)
+                        'processing_time_seconds': 1.0 + random.random() * 2.0,
+                        'analyzer_version': "2.0.0",
+                    })
+
+                    print(f"  Parsed: {filename} ({len(skills_list)} skills, lang={language})")
+
+                loaded += await _insert_resume_batch(db, resume_rows, analysis_rows)
+                resume_rows.clear()
+                analysis_rows.clear()
 
     print(f"\nResumes loaded: {loaded}, failed: {failed}")
     return loaded
 
 
+async def _copy_vacancies(db, records: list) -> None:
+    """Stream vacancy records into job_vacancies with binary COPY."""
+    if not records:
+        return
+    connection = await db.connection()
+    raw_connection = await connection.get_raw_connection()
+    await raw_connection.driver_connection.copy_records_to_table(
+        JobVacancy.__tablename__,
+        records=records,
+        columns=VACANCY_COPY_COLUMNS,
+    )
+
+
 async def load_vacancies(csv_path: str):
     """Load vacancies from CSV file."""
     print(f"\nLoading vacancies from {csv_path}...")
@@ -166,45 +323,50 @@ async def load_vacancies(csv_path: str):
     loaded = 0
 
     async with async_session_maker() as db:
+        # One query for duplicates instead of a SELECT per row
+        existing_titles = set((await db.execute(select(JobVacancy.title))).scalars())
+        vacancy_records = []
+
         with open(csv_path, 'r', encoding='utf-8') as f:
             reader = csv.DictReader(f)
 
             for row in reader:
                 try:
                     # Check if already exists
-                    existing = await db.execute(
-                        select(JobVacancy).where(
-                            JobVacancy.title == row.get('job_title', 'Unknown')
-                        )
-                    )
-                    if existing.scalar_one_or_none():
+                    title = row.get('job_title', 'Unknown')
+                    if title in existing_titles:
                         continue
 
                     # Parse required skills from description
                     description = row.get('job_description', '')
-                    title = row.get('job_title', 'Unknown')
 
                     # Extract skills from description (pattern matching for cleaner results)
                     skills_result = extract_resume_skills(
                         description, method='pattern', top_n=20
                     )
-                    required_skills = skills_result.get('skills', [])[:15]
-
-                    vacancy = JobVacancy(
-                        title=title,
-                        description=description[:5000],
-                        location='Remote',
-                        work_format='remote',
-                        required_skills=required_skills,
-                        min_experience_months=36
-                    )
-                    db.add(vacancy)
+                    required_skills = (skills_result.get('skills') or [])[:15]
+
+                    # Order follows VACANCY_COPY_COLUMNS; JSONB is passed pre-serialized
+                    vacancy_records.append((
+                        title,
+                        description[:5000],
+                        'Remote',
+                        'remote',
+                        json_serializer(required_skills),
+                        36,
+                    ))
+                    existing_titles.add(title)
                     loaded += 1
                     print(f"  Loaded: {title} ({len(required_skills)} skills)")
 
                 except Exception as e:
                     print(f"  ERROR loading vacancy: {str(e)[:100]}")
 
+                if len(vacancy_records) >= BATCH_SIZE:
+                    await _copy_vacancies(db, vacancy_records)
+                    vacancy_records.clear()
+
+        await _copy_vacancies(db, vacancy_records)
         await db.commit()
 
     print(f"Vacancies loaded: {loaded}")
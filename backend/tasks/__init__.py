@@ -5,17 +5,32 @@
 таких как анализ резюме, сопоставление вакансий, пакетная обработка,
 задачи ML-обучения и генерация отчётов.
 """
-from .analysis_task import analyze_resume_async, batch_analyze_resumes
-from .learning_tasks import (
-    aggregate_feedback_and_generate_synonyms,
-    review_and_activate_synonyms,
-    periodic_feedback_aggregation,
-    retrain_skill_matching_model,
-)
-from .report_generation import (
-    generate_scheduled_reports,
-    process_all_pending_reports,
-)
+from importlib import import_module
+from typing import Any
+
+# Задачи экспортируются лениво: импорт пакета (например, ради одного лёгкого
+# модуля вроде email_task) не должен загружать ML-анализаторы из analysis_task
+_LAZY_EXPORTS = {
+    "analyze_resume_async": ".analysis_task",
+    "batch_analyze_resumes": ".analysis_task",
+    "aggregate_feedback_and_generate_synonyms": ".learning_tasks",
+    "review_and_activate_synonyms": ".learning_tasks",
+    "periodic_feedback_aggregation": ".learning_tasks",
+    "retrain_skill_matching_model": ".learning_tasks",
+    "generate_scheduled_reports": ".report_generation",
+    "process_all_pending_reports": ".report_generation",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Импортировать модуль задачи при первом обращении к её имени."""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     "analyze_resume_async",
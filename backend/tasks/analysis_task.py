@@ -8,11 +8,14 @@
 import logging
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, Any, Optional, List
 
-from celery import shared_task
+import orjson
+from celery import chord, group, shared_task
 from celery.exceptions import SoftTimeLimitExceeded
+from celery.signals import worker_process_init
 
 # Добавить родительскую директорию в path для импорта из сервиса data_extractor
 sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent / "services" / "data_extractor"))
@@ -25,7 +28,11 @@ from analyzers import (
     format_experience_summary,
     detect_resume_errors,
 )
+from analyzers._cache import content_hash
 from config import get_settings
+from utils.json_codec import json_serializer
+from services.data_extractor.extract import extract_text_from_docx, extract_text_from_pdf
+from utils.resume_files import locate_resume_file
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
@@ -33,6 +40,138 @@ settings = get_settings()
 # Директория, где хранятся загруженные резюме
 UPLOAD_DIR = Path("data/uploads")
 
+# Функции извлечения текста по расширению файла
+_EXTRACTORS = {
+    ".pdf": extract_text_from_pdf,
+    ".docx": extract_text_from_docx,
+}
+
+# Потоки для параллельного запуска анализаторов: ключевые слова, сущности,
+# грамматика, опыт и ошибки
+ANALYZER_THREADS = 5
+
+# Кэш результатов анализа в Redis по хэшу текста резюме. Версию нужно
+# увеличивать при изменении анализаторов, чтобы старые результаты не читались
+ANALYSIS_CACHE_VERSION = 1
+ANALYSIS_CACHE_TTL_SECONDS = 86400
+
+
+# Шаги анализа для отчёта о прогрессе: (status, message)
+_ANALYSIS_STEPS = (
+    ("finding_resume", "Locating resume file..."),
+    ("extracting_text", "Extracting text from resume file..."),
+    ("extracting_keywords", "Extracting keywords and entities..."),
+    ("analyzing_content", "Analyzing grammar, experience, and errors..."),
+    ("compiling_results", "Compiling analysis results..."),
+)
+
+# Состояния PROGRESS по номеру шага (1..len(_ANALYSIS_STEPS)); создаются один раз
+_PROGRESS_META = tuple(
+    {
+        "current": step,
+        "total": len(_ANALYSIS_STEPS),
+        "percentage": int(step / len(_ANALYSIS_STEPS) * 100),
+        "status": status,
+        "message": message,
+    }
+    for step, (status, message) in enumerate(_ANALYSIS_STEPS, start=1)
+)
+
+
+def _report_progress(task: Any, step: int, name: str) -> None:
+    """
+    Записать состояние PROGRESS шага анализа в бэкенд результатов.
+
+    Каждое обновление - обращение к Redis. Последний шаг сразу сменяется
+    итоговым результатом задачи, поэтому он только логируется; при прямом
+    вызове задачи (без id) состояние записывать некуда.
+    """
+    logger.info(f"Task {task.request.id}: Step {step}/{len(_ANALYSIS_STEPS)} - {name}")
+    if step == len(_ANALYSIS_STEPS) or task.request.called_directly or task.request.id is None:
+        return
+    task.update_state(state="PROGRESS", meta=_PROGRESS_META[step - 1])
+
+
+def _analysis_cache_key(
+    resume_text: str, check_grammar: bool, extract_experience: bool, detect_errors: bool
+) -> str:
+    flags = f"{int(check_grammar)}{int(extract_experience)}{int(detect_errors)}"
+    return f"analysis:v{ANALYSIS_CACHE_VERSION}:{content_hash(resume_text)}:{flags}"
+
+
+def _get_cached_analysis(key: str) -> Optional[Dict[str, Any]]:
+    """Прочитать результат анализа из Redis; ошибки Redis считаются промахом"""
+    from celery_app import get_redis_client
+    from redis.exceptions import RedisError
+
+    try:
+        cached = get_redis_client().get(key)
+    except RedisError as e:
+        logger.warning(f"Analysis cache read failed: {e}")
+        return None
+    return orjson.loads(cached) if cached else None
+
+
+def _store_cached_analysis(key: str, result: Dict[str, Any]) -> None:
+    """
+    Сохранить результат анализа в Redis на ANALYSIS_CACHE_TTL_SECONDS.
+
+    Результат кодируется json_serializer: оценки ключевых слов NER-конвейера -
+    numpy-числа, которые orjson.dumps без OPT_SERIALIZE_NUMPY не кодирует.
+    """
+    from celery_app import get_redis_client
+    from redis.exceptions import RedisError
+
+    try:
+        get_redis_client().setex(key, ANALYSIS_CACHE_TTL_SECONDS, json_serializer(result))
+    except (RedisError, TypeError) as e:
+        logger.warning(f"Analysis cache write failed: {e}")
+
+
+@worker_process_init.connect
+def warm_up_analysis_models(**kwargs: Any) -> None:
+    """
+    Загрузить модели анализаторов при старте процесса воркера.
+
+    Модели уже кэшируются на уровне процесса при первом вызове; прогрев
+    переносит их загрузку (секунды) с первой задачи на запуск процесса.
+    Языки задаются настройкой analysis_warmup_languages; ошибки загрузки
+    не мешают запуску воркера - модель будет загружена при первом вызове.
+    Прогрев укладывается в worker_proc_alive_timeout из CeleryConfig.
+
+    Здесь же ограничивается число потоков PyTorch (analysis_torch_threads):
+    воркер запускает несколько процессов, и потоки каждого по числу ядер
+    конкурируют друг с другом за CPU.
+    """
+    if settings.analysis_torch_threads:
+        try:
+            import torch
+
+            torch.set_num_threads(settings.analysis_torch_threads)
+        except ImportError:
+            pass
+
+    languages = [lang.strip() for lang in settings.analysis_warmup_languages.split(",") if lang.strip()]
+    if not languages:
+        return
+
+    from analyzers.grammar_checker import _get_tool
+    from analyzers.hf_skill_extractor import _get_ner_model
+    from analyzers.ner_extractor import _get_model as _get_spacy_model
+
+    for language in languages:
+        for name, load in (
+            ("NER pipeline", lambda: _get_ner_model(language=language)),
+            ("SpaCy", lambda: _get_spacy_model(language)),
+            ("LanguageTool", lambda: _get_tool(language)),
+        ):
+            try:
+                load()
+            except Exception as e:
+                logger.warning(f"Model warm-up failed ({name}, {language}): {e}")
+
+    logger.info(f"Analysis models warmed up for languages: {', '.join(languages)}")
+
 
 def find_resume_file(resume_id: str) -> Path:
     """
@@ -47,11 +186,10 @@ def find_resume_file(resume_id: str) -> Path:
     Raises:
         FileNotFoundError: Если файл резюме не найден
     """
-    # Попробовать распространённые расширения файлов
-    for ext in [".pdf", ".docx", ".PDF", ".DOCX"]:
-        file_path = UPLOAD_DIR / f"{resume_id}{ext}"
-        if file_path.exists():
-            return file_path
+    # Индекс путей в Redis, иначе один просмотр каталога (расширение без учёта регистра)
+    file_path = locate_resume_file(UPLOAD_DIR, resume_id)
+    if file_path is not None:
+        return file_path
 
     # Если не найдено, вызвать ошибку
     raise FileNotFoundError(f"Resume file with ID '{resume_id}' not found")
@@ -71,17 +209,12 @@ def extract_text_from_file(file_path: Path) -> str:
         ValueError: Если извлечение текста не удалось или вернуло пустой текст
     """
     try:
-        # Импорт функций извлечения
-        from services.data_extractor.extract import extract_text_from_pdf, extract_text_from_docx
-
         file_ext = file_path.suffix.lower()
 
-        if file_ext == ".pdf":
-            result = extract_text_from_pdf(file_path)
-        elif file_ext == ".docx":
-            result = extract_text_from_docx(file_path)
-        else:
+        extractor = _EXTRACTORS.get(file_ext)
+        if extractor is None:
             raise ValueError(f"Unsupported file type: {file_ext}")
+        result = extractor(file_path)
 
         # Check for extraction errors
         if result.get("error"):
@@ -160,23 +293,12 @@ def analyze_resume_async(
         'completed'
     """
     start_time = time.time()
-    total_steps = 5
-    current_step = 0
 
     try:
         logger.info(f"Starting async resume analysis for resume_id: {resume_id}")
 
         # Step 1: Find resume file
-        current_step += 1
-        progress = {
-            "current": current_step,
-            "total": total_steps,
-            "percentage": int(current_step / total_steps * 100),
-            "status": "finding_resume",
-            "message": "Locating resume file...",
-        }
-        self.update_state(state="PROGRESS", meta=progress)
-        logger.info(f"Task {self.request.id}: Step {current_step}/{total_steps} - Finding resume file")
+        _report_progress(self, 1, "Finding resume file")
 
         try:
             file_path = find_resume_file(resume_id)
@@ -190,16 +312,7 @@ def analyze_resume_async(
             }
 
         # Step 2: Extract text from file
-        current_step += 1
-        progress = {
-            "current": current_step,
-            "total": total_steps,
-            "percentage": int(current_step / total_steps * 100),
-            "status": "extracting_text",
-            "message": "Extracting text from resume file...",
-        }
-        self.update_state(state="PROGRESS", meta=progress)
-        logger.info(f"Task {self.request.id}: Step {current_step}/{total_steps} - Extracting text")
+        _report_progress(self, 2, "Extracting text")
 
         try:
             resume_text = extract_text_from_file(file_path)
@@ -212,23 +325,23 @@ def analyze_resume_async(
                 "processing_time_ms": round((time.time() - start_time) * 1000, 2),
             }
 
+        # Identical text (retries, duplicate uploads) gives an identical analysis
+        cache_key = _analysis_cache_key(resume_text, check_grammar, extract_experience, detect_errors)
+        cached_result = _get_cached_analysis(cache_key)
+        if cached_result is not None:
+            cached_result["resume_id"] = resume_id
+            cached_result["processing_time_ms"] = round((time.time() - start_time) * 1000, 2)
+            logger.info(f"Resume analysis for {resume_id} served from cache ({cache_key})")
+            return cached_result
+
         # Step 3: Extract keywords and entities
-        current_step += 1
-        progress = {
-            "current": current_step,
-            "total": total_steps,
-            "percentage": int(current_step / total_steps * 100),
-            "status": "extracting_keywords",
-            "message": "Extracting keywords and entities...",
-        }
-        self.update_state(state="PROGRESS", meta=progress)
-        logger.info(f"Task {self.request.id}: Step {current_step}/{total_steps} - Keyword extraction")
+        _report_progress(self, 3, "Keyword extraction")
 
+        # Detect language first: keyword model selection depends on it
         try:
-            # Detect language first for model selection
-            from langdetect import detect
+            from analyzers._language import detect_language_code
             try:
-                lang_code = detect(resume_text[:1000])
+                lang_code = detect_language_code(resume_text)
                 # Map to our language format
                 if lang_code == 'ru':
                     detected_language = 'ru'
@@ -238,90 +351,98 @@ def analyze_resume_async(
                     detected_language = lang_code
             except:
                 detected_language = "en"
+        except ImportError:
+            detected_language = "en"
 
-            logger.info(f"Detected language: {detected_language}")
-
-            # Extract keywords with language-aware model selection
-            keywords_result = extract_resume_keywords(resume_text, language=detected_language)
+        logger.info(f"Detected language: {detected_language}")
 
-            # Extract named entities
-            entities_result = extract_resume_entities(resume_text)
+        # The analyzers are independent and spend most of their time in native
+        # code (transformers, SpaCy, the LanguageTool server), so they run
+        # concurrently; the task itself runs in a prefork worker process
+        with ThreadPoolExecutor(max_workers=ANALYZER_THREADS) as executor:
+            keywords_future = executor.submit(
+                extract_resume_keywords, resume_text, language=detected_language
+            )
+            entities_future = executor.submit(extract_resume_entities, resume_text)
+            # The language is already known, so the checker skips its own detection pass
+            grammar_future = (
+                executor.submit(check_grammar_resume, resume_text, language=detected_language)
+                if check_grammar
+                else None
+            )
+            experience_future = (
+                executor.submit(calculate_total_experience, resume_text)
+                if extract_experience
+                else None
+            )
+            errors_future = (
+                executor.submit(detect_resume_errors, resume_text) if detect_errors else None
+            )
 
-            # Use detected language for entities result
-            language = entities_result.get("language", detected_language)
+            # Step 4: Run optional analysis (grammar, experience, errors)
+            _report_progress(self, 4, "Content analysis")
 
-        except Exception as e:
-            logger.error(f"Keyword/entity extraction failed: {e}", exc_info=True)
-            language = "unknown"
-            keywords_result = {"keywords": [], "keyphrases": [], "scores": []}
-            entities_result = {
-                "organizations": [],
-                "dates": [],
-                "persons": [],
-                "locations": [],
-                "technical_skills": [],
-                "language": "unknown",
-            }
+            try:
+                # Extract keywords with language-aware model selection
+                keywords_result = keywords_future.result()
 
-        # Step 4: Run optional analysis (grammar, experience, errors)
-        current_step += 1
-        progress = {
-            "current": current_step,
-            "total": total_steps,
-            "percentage": int(current_step / total_steps * 100),
-            "status": "analyzing_content",
-            "message": "Analyzing grammar, experience, and errors...",
-        }
-        self.update_state(state="PROGRESS", meta=progress)
-        logger.info(f"Task {self.request.id}: Step {current_step}/{total_steps} - Content analysis")
+                # Extract named entities
+                entities_result = entities_future.result()
 
-        grammar_result = None
-        experience_result = None
-        errors_result = None
+                # Use detected language for entities result
+                language = entities_result.get("language", detected_language)
 
-        # Grammar checking
-        if check_grammar:
-            try:
-                grammar_result = check_grammar_resume(resume_text)
-                logger.info(f"Grammar checking completed: {grammar_result.get('total_errors', 0)} errors found")
             except Exception as e:
-                logger.warning(f"Grammar checking failed: {e}", exc_info=True)
-                grammar_result = None
-
-        # Experience calculation
-        if extract_experience:
-            try:
-                experience_months = calculate_total_experience(resume_text)
-                experience_result = {
-                    "total_months": experience_months,
-                    "total_years": round(experience_months / 12, 1),
-                    "total_years_formatted": format_experience_summary(experience_months),
+                logger.error(f"Keyword/entity extraction failed: {e}", exc_info=True)
+                language = "unknown"
+                keywords_result = {"keywords": [], "keyphrases": [], "scores": []}
+                entities_result = {
+                    "organizations": [],
+                    "dates": [],
+                    "persons": [],
+                    "locations": [],
+                    "technical_skills": [],
+                    "language": "unknown",
                 }
-                logger.info(f"Experience calculation completed: {experience_result['total_years_formatted']}")
-            except Exception as e:
-                logger.warning(f"Experience calculation failed: {e}", exc_info=True)
-                experience_result = None
 
-        # Error detection
-        if detect_errors:
-            try:
-                errors_result = detect_resume_errors(resume_text)
-                logger.info(f"Error detection completed: {len(errors_result)} errors detected")
-            except Exception as e:
-                logger.warning(f"Error detection failed: {e}", exc_info=True)
-                errors_result = None
+            grammar_result = None
+            experience_result = None
+            errors_result = None
+
+            # Grammar checking
+            if grammar_future is not None:
+                try:
+                    grammar_result = grammar_future.result()
+                    logger.info(f"Grammar checking completed: {grammar_result.get('total_errors', 0)} errors found")
+                except Exception as e:
+                    logger.warning(f"Grammar checking failed: {e}", exc_info=True)
+                    grammar_result = None
+
+            # Experience calculation
+            if experience_future is not None:
+                try:
+                    experience_months = experience_future.result()
+                    experience_result = {
+                        "total_months": experience_months,
+                        "total_years": round(experience_months / 12, 1),
+                        "total_years_formatted": format_experience_summary(experience_months),
+                    }
+                    logger.info(f"Experience calculation completed: {experience_result['total_years_formatted']}")
+                except Exception as e:
+                    logger.warning(f"Experience calculation failed: {e}", exc_info=True)
+                    experience_result = None
+
+            # Error detection
+            if errors_future is not None:
+                try:
+                    errors_result = errors_future.result()
+                    logger.info(f"Error detection completed: {len(errors_result)} errors detected")
+                except Exception as e:
+                    logger.warning(f"Error detection failed: {e}", exc_info=True)
+                    errors_result = None
 
         # Step 5: Compile results
-        current_step += 1
-        progress = {
-            "current": current_step,
-            "total": total_steps,
-            "percentage": int(current_step / total_steps * 100),
-            "status": "compiling_results",
-            "message": "Compiling analysis results...",
-        }
-        self.update_state(state="PROGRESS", meta=progress)
-        logger.info(f"Task {self.request.id}: Step {current_step}/{total_steps} - Compiling results")
+        _report_progress(self, 5, "Compiling results")
 
         processing_time_ms = round((time.time() - start_time) * 1000, 2)
 
@@ -339,6 +460,15 @@ def analyze_resume_async(
 
         logger.info(f"Resume analysis completed successfully in {processing_time_ms}ms")
 
+        # Results with a failed analyzer (fallback values) are not cached
+        if (
+            language != "unknown"
+            and (grammar_result is not None or not check_grammar)
+            and (experience_result is not None or not extract_experience)
+            and (errors_result is not None or not detect_errors)
+        ):
+            _store_cached_analysis(cache_key, result)
+
         return result
 
     except SoftTimeLimitExceeded:
@@ -360,6 +490,30 @@ def analyze_resume_async(
         }
 
 
+@shared_task(name="tasks.analysis_task.summarize_batch_analysis")
+def summarize_batch_analysis(results: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Aggregate individual analysis results of a batch (chord callback).
+
+    Args:
+        results: Results of analyze_resume_async, in the order of resume_ids
+
+    Returns:
+        Dictionary with total_resumes, successful, failed and results
+    """
+    successful = sum(1 for result in results if result.get("status") == "completed")
+    failed = len(results) - successful
+
+    logger.info(f"Batch analysis completed: {successful} successful, {failed} failed")
+
+    return {
+        "total_resumes": len(results),
+        "successful": successful,
+        "failed": failed,
+        "results": results,
+    }
+
+
 @shared_task(
     name="tasks.analysis_task.batch_analyze_resumes",
     bind=True,
@@ -375,8 +529,11 @@ def batch_analyze_resumes(
     """
     Asynchronously analyze multiple resumes in batch.
 
-    This task processes multiple resumes sequentially, tracking progress
-    across the entire batch. Useful for analyzing multiple resumes at once.
+    Each resume is analyzed by its own analyze_resume_async task, so the batch
+    is spread across all analysis worker processes. This task replaces itself
+    with a chord whose callback aggregates the results: its result (and
+    task.get()) is the aggregated dictionary, and no worker slot is held
+    while the batch is running.
 
     Args:
         self: Celery task instance (bind=True)
@@ -400,52 +557,27 @@ def batch_analyze_resumes(
     """
     logger.info(f"Starting batch analysis for {len(resume_ids)} resumes")
 
-    results = []
-    successful = 0
-    failed = 0
+    if not resume_ids:
+        return summarize_batch_analysis([])
 
-    for i, resume_id in enumerate(resume_ids):
-        # Update progress for batch
-        progress = {
-            "current": i + 1,
+    self.update_state(
+        state="PROGRESS",
+        meta={
+            "current": 0,
             "total": len(resume_ids),
-            "percentage": int((i + 1) / len(resume_ids) * 100),
+            "percentage": 0,
             "status": "processing_batch",
-            "message": f"Analyzing resume {i + 1}/{len(resume_ids)}...",
-        }
-        self.update_state(state="PROGRESS", meta=progress)
-
-        logger.info(f"Processing resume {i + 1}/{len(resume_ids)}: {resume_id}")
-
-        # Analyze individual resume
-        try:
-            result = analyze_resume_async(
-                resume_id=resume_id,
-                check_grammar=check_grammar,
-                extract_experience=extract_experience,
-                detect_errors=True,
-            )
-            results.append(result)
-
-            if result.get("status") == "completed":
-                successful += 1
-            else:
-                failed += 1
-
-        except Exception as e:
-            logger.error(f"Failed to analyze resume {resume_id}: {e}", exc_info=True)
-            results.append({
-                "resume_id": resume_id,
-                "status": "failed",
-                "error": str(e),
-            })
-            failed += 1
-
-    logger.info(f"Batch analysis completed: {successful} successful, {failed} failed")
-
-    return {
-        "total_resumes": len(resume_ids),
-        "successful": successful,
-        "failed": failed,
-        "results": results,
-    }
+            "message": f"Dispatching {len(resume_ids)} resumes for analysis...",
+        },
+    )
+
+    analyses = group(
+        analyze_resume_async.s(
+            resume_id,
+            check_grammar=check_grammar,
+            extract_experience=extract_experience,
+            detect_errors=True,
+        )
+        for resume_id in resume_ids
+    )
+    return self.replace(chord(analyses, summarize_batch_analysis.s()))
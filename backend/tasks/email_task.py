@@ -6,6 +6,8 @@
 и другие email-коммуникации.
 """
 import logging
+import smtplib
+from email.message import EmailMessage
 from typing import Dict, Any, List, Optional
 
 from celery import shared_task
@@ -16,6 +18,128 @@ from config import get_settings
 logger = logging.getLogger(__name__)
 settings = get_settings()
 
+# Шаблоны писем: статический текст хранится один раз на процесс, при отправке
+# подставляются только значения
+FEEDBACK_BODY_TEMPLATE = """
+Feedback for Candidate: {candidate_name}
+Feedback ID: {feedback_id}
+
+Match Score: {match_score}%
+
+Skills Feedback:
+{skills_feedback}
+
+Experience Feedback:
+{experience_feedback}
+
+Recommendations:
+{recommendations}
+
+---
+This is an automated email from AgentHR Resume Analysis System.
+"""
+
+# Максимум сообщений об ошибках в результате пакетной отправки
+MAX_BATCH_ERRORS = 100
+
+BATCH_BODY_TEMPLATE = """
+{title}
+
+{message}
+
+Details:
+{details}
+
+---
+This is an automated email from AgentHR.
+"""
+
+
+def _open_smtp() -> Optional[smtplib.SMTP]:
+    """
+    Открыть SMTP-соединение по настройкам.
+
+    Одно соединение используется для всех писем задачи: подключение, STARTTLS
+    и аутентификация выполняются один раз, а не на каждого получателя.
+
+    Returns:
+        Соединение или None, если SMTP не настроен (письма только логируются)
+    """
+    if not settings.smtp_host:
+        return None
+
+    smtp = smtplib.SMTP(settings.smtp_host, settings.smtp_port, timeout=30)
+    try:
+        if settings.smtp_tls:
+            smtp.starttls()
+        if settings.smtp_user:
+            smtp.login(settings.smtp_user, settings.smtp_password)
+    except Exception:
+        smtp.close()
+        raise
+    return smtp
+
+
+def _close_smtp(smtp: Optional[smtplib.SMTP]) -> None:
+    """Завершить SMTP-сессию; ошибки при закрытии не влияют на результат отправки"""
+    if smtp is None:
+        return
+    try:
+        smtp.quit()
+    except smtplib.SMTPException:
+        smtp.close()
+
+
+def _send_email(
+    smtp: Optional[smtplib.SMTP], recipient: str, subject: str, body: str
+) -> None:
+    """
+    Отправить письмо через открытое соединение.
+
+    Без соединения (SMTP не настроен) письмо только логируется.
+    """
+    if smtp is None:
+        logger.info(f"SMTP is not configured, email to {recipient} logged only")
+        return
+
+    message = EmailMessage()
+    message["From"] = settings.smtp_from
+    message["To"] = recipient
+    message["Subject"] = subject
+    message.set_content(body)
+    smtp.send_message(message)
+
+
+def _send_email_reconnecting(
+    smtp: Optional[smtplib.SMTP], recipient: str, subject: str, body: str
+) -> Optional[smtplib.SMTP]:
+    """
+    Отправить письмо; при разрыве соединения сервером переподключиться один раз.
+
+    Сервер может закрыть долгую сессию посреди пакета (таймаут простоя,
+    лимит писем на соединение). Тогда соединение открывается заново и письмо
+    этому получателю отправляется повторно; ошибка повтора передаётся вызывающему
+    (новое соединение при этом закрывается, следующий получатель снова
+    попробует переподключиться).
+
+    Returns:
+        Соединение для следующих писем (новое, если было переподключение)
+    """
+    try:
+        _send_email(smtp, recipient, subject, body)
+        return smtp
+    except smtplib.SMTPServerDisconnected as e:
+        logger.warning(f"SMTP connection dropped while sending to {recipient}, reconnecting: {e}")
+        _close_smtp(smtp)
+
+    smtp = _open_smtp()
+    try:
+        _send_email(smtp, recipient, subject, body)
+    except Exception:
+        _close_smtp(smtp)
+        raise
+    return smtp
+
 
 @shared_task(
     name="tasks.email_task.send_feedback_notification",
@@ -93,32 +217,25 @@ def send_feedback_notification(
         subject = f"Candidate Feedback: {candidate_name}"
 
         # Составление тела письма
-        body = f"""
-Feedback for Candidate: {candidate_name}
-Feedback ID: {feedback_id}
-
-Match Score: {feedback_data.get('match_score', 'N/A')}%
-
-Skills Feedback:
-{feedback_data.get('skills_feedback', {})}
+        body = FEEDBACK_BODY_TEMPLATE.format(
+            candidate_name=candidate_name,
+            feedback_id=feedback_id,
+            match_score=feedback_data.get('match_score', 'N/A'),
+            skills_feedback=feedback_data.get('skills_feedback', {}),
+            experience_feedback=feedback_data.get('experience_feedback', {}),
+            recommendations="\n".join(
+                f'- {rec}' for rec in feedback_data.get('recommendations', [])
+            ),
+        ).strip()
 
-Experience Feedback:
-{feedback_data.get('experience_feedback', {})}
-
-Recommendations:
-{chr(10).join(f'- {rec}' for rec in feedback_data.get('recommendations', []))}
-
----
-This is an automated email from AgentHR Resume Analysis System.
-        """.strip()
-
-        # Логирование деталей письма (в продакшене - фактическая отправка)
         logger.info(f"Email composed: subject='{subject}', to={recipient_email}")
         logger.info(f"Email body length: {len(body)} characters")
 
-        # Имитация отправки письма (в продакшене использовать SMTP/сервис)
-        # Сейчас просто логируем и помечаем как отправленное
-        time.sleep(0.1)  # Имитация сетевой задержки
+        smtp = _open_smtp()
+        try:
+            _send_email(smtp, recipient_email, subject, body)
+        finally:
+            _close_smtp(smtp)
 
         processing_time = int((time.time() - start_time) * 1000)
 
@@ -147,7 +264,8 @@ This is an automated email from AgentHR Resume Analysis System.
     except Exception as e:
         logger.error(
             f"Failed to send feedback notification for feedback_id={feedback_id}: {e}",
-            exc_info=True,
+            # Полный traceback - только при последней попытке, без повтора
+            exc_info=self.request.retries >= self.max_retries,
         )
 
         # Повторная попытка с экспоненциальной задержкой
@@ -198,7 +316,7 @@ def send_batch_notification(
         - total_recipients: Количество получателей
         - successful_sends: Количество успешных отправок
         - failed_sends: Количество неудачных отправок
-        - errors: Список ошибок (если есть)
+        - errors: Список ошибок (если есть, не более MAX_BATCH_ERRORS)
         - processing_time_ms: Общее время обработки
 
     Example:
@@ -226,32 +344,30 @@ def send_batch_notification(
         title = notification_data.get("title", f"{batch_type} Notification")
         message = notification_data.get("message", "")
 
-        for recipient_email in recipient_emails:
-            try:
-                # Составление индивидуального письма
-                body = f"""
-{title}
-
-{message}
-
-Details:
-{notification_data.get('details', {})}
-
----
-This is an automated email from AgentHR.
-                """.strip()
-
-                # Логирование деталей письма (в продакшене - фактическая отправка)
-                logger.info(f"Sending batch email to {recipient_email}")
-                time.sleep(0.05)  # Имитация сетевой задержки на получателя
-
-                successful_sends += 1
-
-            except Exception as e:
-                failed_sends += 1
-                error_msg = f"Failed to send to {recipient_email}: {str(e)}"
-                errors.append(error_msg)
-                logger.error(error_msg)
+        # Текст письма одинаков для всех получателей
+        body = BATCH_BODY_TEMPLATE.format(
+            title=title,
+            message=message,
+            details=notification_data.get('details', {}),
+        ).strip()
+
+        smtp = _open_smtp()
+        try:
+            for recipient_email in recipient_emails:
+                try:
+                    logger.info(f"Sending batch email to {recipient_email}")
+                    smtp = _send_email_reconnecting(smtp, recipient_email, title, body)
+
+                    successful_sends += 1
+
+                except Exception as e:
+                    failed_sends += 1
+                    error_msg = f"Failed to send to {recipient_email}: {str(e)}"
+                    if len(errors) < MAX_BATCH_ERRORS:
+                        errors.append(error_msg)
+                    logger.error(error_msg)
+        finally:
+            _close_smtp(smtp)
 
         processing_time = int((time.time() - start_time) * 1000)
 
@@ -292,7 +408,8 @@ This is an automated email from AgentHR.
     except Exception as e:
         logger.error(
             f"Failed to send batch notification for batch_type={batch_type}: {e}",
-            exc_info=True,
+            # Полный traceback - только при последней попытке, без повтора
+            exc_info=self.request.retries >= self.max_retries,
         )
 
         # Повторная попытка с экспоненциальной задержкой
@@ -7,7 +7,7 @@
 """
 import logging
 import time
-from collections import defaultdict
+from collections import Counter
 from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime, timedelta
 
@@ -59,47 +59,43 @@ def aggregate_corrections(
         >>> print(corrections["React"]["synonyms"])
         {'ReactJS', 'React.js'}
     """
-    # Группировка исправлений по каноническому навыку (на что рекрутер исправил)
-    skill_groups: Dict[str, Dict[str, Any]] = defaultdict(lambda: {
-        "synonyms": defaultdict(int),
-        "correction_count": 0,
-        "sources": set(),
-    })
+    # Число исправлений по паре (канонический навык, исходный навык) и источники
+    # по каноническому навыку; порядок ключей - порядок первого появления
+    pair_counts: Counter = Counter()
+    skill_sources: Dict[str, set] = {}
 
     for feedback in feedback_entries:
-        # Пропуск, если исправление не было предоставлено
-        if not feedback.recruiter_correction and not feedback.actual_skill:
-            continue
-
         # Использование actual_skill, если предоставлено, иначе recruiter_correction
         corrected_skill = feedback.actual_skill or feedback.recruiter_correction
+        skill = feedback.skill
 
-        if not corrected_skill or not feedback.skill:
+        # Пропуск, если исправление не было предоставлено
+        if not corrected_skill or not skill:
             continue
 
         # Нормализация имён навыков для сравнения
         canonical_skill = corrected_skill.strip().lower()
-        original_skill = feedback.skill.strip().lower()
+        original_skill = skill.strip().lower()
 
         # Пропуск, если они одинаковые (нет фактического исправления)
         if canonical_skill == original_skill:
             continue
 
-        # Запись этого исправления
-        skill_groups[canonical_skill]["synonyms"][original_skill] += 1
-        skill_groups[canonical_skill]["correction_count"] += 1
-        skill_groups[canonical_skill]["sources"].add(feedback.feedback_source)
+        pair_counts[canonical_skill, original_skill] += 1
+        sources = skill_sources.get(canonical_skill)
+        if sources is None:
+            sources = skill_sources[canonical_skill] = set()
+        sources.add(feedback.feedback_source)
+
+    # Фильтрация синонимов по минимальному порогу
+    filtered: Dict[str, Dict[str, int]] = {canonical_skill: {} for canonical_skill in skill_sources}
+    for (canonical_skill, original_skill), count in pair_counts.items():
+        if count >= MIN_CORRECTION_THRESHOLD:
+            filtered[canonical_skill][original_skill] = count
 
     # Вычисление показателей уверенности и преобразование множеств в списки
     results = {}
-    for canonical_skill, data in skill_groups.items():
-        # Фильтрация синонимов по минимальному порогу
-        filtered_synonyms = {
-            syn: count
-            for syn, count in data["synonyms"].items()
-            if count >= MIN_CORRECTION_THRESHOLD
-        }
-
+    for canonical_skill, filtered_synonyms in filtered.items():
         if not filtered_synonyms:
             continue
 
@@ -111,7 +107,7 @@ def aggregate_corrections(
             "synonyms": list(filtered_synonyms.keys()),
             "correction_count": total_corrections,
             "confidence": round(confidence, 2),
-            "sources": list(data["sources"]),
+            "sources": list(skill_sources[canonical_skill]),
         }
 
     return results
@@ -652,15 +652,10 @@ def process_all_pending_reports(
         logger.info("Processing all pending scheduled reports")
 
         # Примечание: Это заглушка для запроса к базе данных
-        # В реальной реализации следует выполнить запрос:
-        # scheduled_reports = await db_session.execute(
-        #     select(ScheduledReport).where(
-        #         and_(
-        #             ScheduledReport.is_active == True,
-        #             ScheduledReport.next_run_at <= datetime.utcnow()
-        #         )
-        #     )
-        # )
+        # В реальной реализации следует выполнить запрос (частичный индекс
+        # ix_scheduled_reports_due, FOR UPDATE SKIP LOCKED):
+        # from models.report import due_scheduled_reports
+        # scheduled_reports = await db_session.execute(due_scheduled_reports(limit=100))
 
         # Заглушка: Имитация поиска ожидающих отчётов
         pending_reports = []  # Список ID запланированных отчётов
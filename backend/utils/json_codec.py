@@ -0,0 +1,33 @@
+"""
+Кодирование значений JSON/JSONB-столбцов через orjson.
+
+Общий для всех движков SQLAlchemy (приложение, миграции Alembic) и для
+прямой записи COPY, чтобы JSON везде сериализовался одинаково.
+"""
+from decimal import Decimal
+from typing import Any
+
+import orjson
+
+
+def _json_default(obj: Any) -> Any:
+    """Сериализовать типы, которые orjson не поддерживает нативно."""
+    if isinstance(obj, Decimal):
+        return str(obj)
+    # Подклассы float (например, numpy.float64 из анализаторов)
+    if isinstance(obj, float):
+        return float(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def json_serializer(value: Any) -> str:
+    """Закодировать значение JSON/JSONB-столбца через orjson."""
+    return orjson.dumps(
+        value,
+        default=_json_default,
+        option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY,
+    ).decode()
+
+
+# Разбор значения JSON/JSONB-столбца
+json_deserializer = orjson.loads
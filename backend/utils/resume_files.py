@@ -0,0 +1,93 @@
+"""
+Индекс загруженных файлов резюме.
+
+Файл резюме хранится как <resume_id><расширение> в каталоге загрузок, причём
+регистр расширения берётся из исходного имени. Раньше поиск проверял каждое
+возможное написание (.pdf, .docx, .PDF, .DOCX) отдельным stat(); на сетевом
+хранилище каждая проверка - отдельный round trip.
+
+При загрузке путь записывается в хэш Redis RESUME_FILES_KEY (resume_id -> путь),
+поэтому поиск - одно обращение HGET. Для файлов, загруженных до появления
+индекса, при недоступном Redis или устаревшей записи (файла по пути уже нет)
+каталог просматривается одним os.scandir с проверкой расширения без учёта
+регистра.
+
+Функции синхронные (redis-py): асинхронные обработчики API вызывают их через
+run_in_threadpool, чтобы медленный Redis не блокировал event loop.
+"""
+import logging
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional
+
+from redis.exceptions import RedisError
+
+if TYPE_CHECKING:
+    from redis import Redis
+
+logger = logging.getLogger(__name__)
+
+# Хэш Redis resume_id -> путь к файлу
+RESUME_FILES_KEY = "resume_files"
+
+# Расширения файлов резюме (в нижнем регистре, без точки)
+RESUME_EXTENSIONS = ("pdf", "docx")
+
+
+def _redis() -> "Redis":
+    from celery_app import get_redis_client
+
+    return get_redis_client()
+
+
+def register_resume_file(resume_id: str, file_path: Path) -> None:
+    """
+    Запомнить путь к загруженному файлу резюме.
+
+    Ошибка Redis не прерывает загрузку: файл будет найден просмотром каталога.
+    """
+    try:
+        _redis().hset(RESUME_FILES_KEY, str(resume_id), str(file_path))
+    except RedisError as e:
+        logger.warning(f"Не удалось сохранить путь резюме {resume_id} в Redis: {e}")
+
+
+def forget_resume_file(resume_id: str) -> None:
+    """Удалить путь к файлу резюме из индекса"""
+    try:
+        _redis().hdel(RESUME_FILES_KEY, str(resume_id))
+    except RedisError as e:
+        logger.warning(f"Не удалось удалить путь резюме {resume_id} из Redis: {e}")
+
+
+def locate_resume_file(upload_dir: Path, resume_id: str) -> Optional[Path]:
+    """
+    Найти файл резюме по ID.
+
+    Returns:
+        Путь к файлу или None, если файл не найден
+
+    Example:
+        >>> locate_resume_file(Path("data/uploads"), "abc123")
+        PosixPath('data/uploads/abc123.PDF')
+    """
+    try:
+        stored = _redis().hget(RESUME_FILES_KEY, str(resume_id))
+    except RedisError as e:
+        logger.warning(f"Индекс файлов резюме в Redis недоступен: {e}")
+        stored = None
+    if stored:
+        stored_path = Path(stored.decode() if isinstance(stored, bytes) else stored)
+        if stored_path.exists():
+            return stored_path
+        logger.debug(f"Устаревший путь резюме {resume_id} в Redis: {stored_path}")
+
+    try:
+        with os.scandir(upload_dir) as entries:
+            for entry in entries:
+                stem, _, extension = entry.name.rpartition(".")
+                if stem == resume_id and extension.lower() in RESUME_EXTENSIONS:
+                    return Path(entry.path)
+    except FileNotFoundError:
+        pass
+    return None
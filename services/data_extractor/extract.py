@@ -9,26 +9,62 @@ from pathlib import Path
 from typing import Dict, Optional, Union
 
 import pdfplumber
-from PyPDF2 import PdfReader
+import pypdfium2 as pdfium
 from docx import Document
 
 logger = logging.getLogger(__name__)
 
+# Smallest file that can hold a resume; anything shorter is empty or truncated
+MIN_FILE_SIZE = 200
+
+# Leading bytes of each format: PDF header and ZIP local file header (DOCX)
+PDF_SIGNATURE = b"%PDF-"
+DOCX_SIGNATURE = b"PK\x03\x04"
+
+# PDF readers accept the header anywhere in the first kilobyte
+SIGNATURE_WINDOW = 1024
+
+
+def _check_file_signature(file_path: Path, signature: bytes) -> Optional[str]:
+    """
+    Reject empty, truncated or mislabeled files before parsing.
+
+    Only the file size and the first bytes are read, so garbage input fails
+    without constructing a parser.
+
+    Args:
+        file_path: Path to the file
+        signature: Expected leading bytes of the format
+
+    Returns:
+        Error message, or None if the file looks valid
+    """
+    size = file_path.stat().st_size
+    if size < MIN_FILE_SIZE:
+        return f"File is too small ({size} bytes)"
+
+    with open(file_path, "rb") as f:
+        header = f.read(SIGNATURE_WINDOW)
+    if signature not in header:
+        return f"File content does not match its extension: {file_path.suffix}"
+
+    return None
+
 
 def extract_text_from_pdf(
     file_path: Union[str, Path], use_fallback: bool = True
 ) -> Dict[str, Optional[str]]:
     """
-    Extract text from a PDF file using PyPDF2 and pdfplumber as fallback.
+    Extract text from a PDF file using pypdfium2 and pdfplumber as fallback.
 
     Args:
         file_path: Path to the PDF file
-        use_fallback: If True, try pdfplumber if PyPDF2 fails or returns minimal text
+        use_fallback: If True, try pdfplumber if pypdfium2 fails or returns minimal text
 
     Returns:
         Dictionary containing:
             - text: Extracted text content (None if extraction fails)
-            - method: Which library succeeded ('pypdf2', 'pdfplumber', or None)
+            - method: Which library succeeded ('pypdfium2', 'pdfplumber', or None)
             - pages: Number of pages detected
             - error: Error message if extraction failed
 
@@ -41,7 +77,7 @@ def extract_text_from_pdf(
         >>> print(result["text"])
         'John Doe\\nSoftware Engineer...'
         >>> print(result["method"])
-        'pypdf2'
+        'pypdfium2'
     """
     file_path = Path(file_path)
 
@@ -51,27 +87,37 @@ def extract_text_from_pdf(
     if not file_path.suffix.lower() == ".pdf":
         raise ValueError(f"File is not a PDF: {file_path}")
 
-    # Try PyPDF2 first (faster)
+    signature_error = _check_file_signature(file_path, PDF_SIGNATURE)
+    if signature_error:
+        logger.warning(f"Skipping {file_path.name}: {signature_error}")
+        return {
+            "text": None,
+            "method": None,
+            "pages": 0,
+            "error": signature_error,
+        }
+
+    # Try pypdfium2 first (native PDFium, much faster than pure-Python parsers)
     try:
-        result = _extract_with_pypdf2(file_path)
+        result = _extract_with_pypdfium2(file_path)
         # Check if we got meaningful content
         text_length = len(result["text"].strip()) if result["text"] else 0
 
         if text_length > 50 or not use_fallback:
-            logger.info(f"Extracted {text_length} chars from {file_path.name} using PyPDF2")
+            logger.info(f"Extracted {text_length} chars from {file_path.name} using pypdfium2")
             return result
         else:
             logger.warning(
-                f"PyPDF2 extracted minimal text ({text_length} chars), trying pdfplumber"
+                f"pypdfium2 extracted minimal text ({text_length} chars), trying pdfplumber"
             )
     except Exception as e:
-        logger.warning(f"PyPDF2 extraction failed: {e}")
+        logger.warning(f"pypdfium2 extraction failed: {e}")
         if not use_fallback:
             return {
                 "text": None,
                 "method": None,
                 "pages": 0,
-                "error": f"PyPDF2 failed: {str(e)}",
+                "error": f"pypdfium2 failed: {str(e)}",
             }
 
     # Fallback to pdfplumber (better for complex layouts)
@@ -100,9 +146,12 @@ def extract_text_from_pdf(
     }
 
 
-def _extract_with_pypdf2(file_path: Path) -> Dict[str, Optional[str]]:
+def _extract_with_pypdfium2(file_path: Path) -> Dict[str, Optional[str]]:
     """
-    Extract text using PyPDF2 library.
+    Extract text using pypdfium2 (bindings to the PDFium C++ library).
+
+    PDFium reads the file lazily, so only the page being extracted is held
+    in memory. Pages are closed as soon as their text is read.
 
     Args:
         file_path: Path to the PDF file
@@ -111,30 +160,42 @@ def _extract_with_pypdf2(file_path: Path) -> Dict[str, Optional[str]]:
         Dictionary with extracted text and metadata
     """
     try:
-        reader = PdfReader(str(file_path))
-        num_pages = len(reader.pages)
-
-        text_parts = []
-        for page_num, page in enumerate(reader.pages, start=1):
-            try:
-                page_text = page.extract_text()
-                if page_text:
-                    text_parts.append(page_text)
-            except Exception as e:
-                logger.warning(f"Failed to extract page {page_num}: {e}")
-                continue
+        pdf = pdfium.PdfDocument(str(file_path))
+        try:
+            num_pages = len(pdf)
+
+            text_parts = []
+            for page_num in range(num_pages):
+                try:
+                    page = pdf[page_num]
+                    try:
+                        textpage = page.get_textpage()
+                        try:
+                            page_text = textpage.get_text_range()
+                        finally:
+                            textpage.close()
+                    finally:
+                        page.close()
+                    if page_text:
+                        # PDFium separates lines with CRLF
+                        text_parts.append(page_text.replace("\r\n", "\n"))
+                except Exception as e:
+                    logger.warning(f"Failed to extract page {page_num + 1}: {e}")
+                    continue
+        finally:
+            pdf.close()
 
         text = "\n\n".join(text_parts) if text_parts else ""
 
         return {
             "text": text if text.strip() else None,
-            "method": "pypdf2",
+            "method": "pypdfium2",
             "pages": num_pages,
             "error": None,
         }
 
     except Exception as e:
-        raise RuntimeError(f"PyPDF2 extraction error: {e}") from e
+        raise RuntimeError(f"pypdfium2 extraction error: {e}") from e
 
 
 def _extract_with_pdfplumber(file_path: Path) -> Dict[str, Optional[str]]:
@@ -142,7 +203,7 @@ def _extract_with_pdfplumber(file_path: Path) -> Dict[str, Optional[str]]:
     Extract text using pdfplumber library.
 
     Pdfplumber is more robust for complex PDF layouts and handles
-    some edge cases better than PyPDF2.
+    some edge cases better than pypdfium2.
 
     Args:
         file_path: Path to the PDF file
@@ -214,11 +275,14 @@ def validate_pdf_file(file_path: Union[str, Path]) -> Dict[str, Union[bool, str]
     if file_path.stat().st_size == 0:
         return {"valid": False, "reason": "File is empty"}
 
-    # Try to open with PyPDF2
+    # Try to open with pypdfium2
     try:
-        reader = PdfReader(str(file_path))
-        if len(reader.pages) == 0:
-            return {"valid": False, "reason": "PDF has no pages"}
+        pdf = pdfium.PdfDocument(str(file_path))
+        try:
+            if len(pdf) == 0:
+                return {"valid": False, "reason": "PDF has no pages"}
+        finally:
+            pdf.close()
     except Exception as e:
         return {"valid": False, "reason": f"Cannot open PDF: {str(e)}"}
 
@@ -260,6 +324,16 @@ def extract_text_from_docx(
     if not file_path.suffix.lower() in [".docx", ".doc"]:
         raise ValueError(f"File is not a DOCX: {file_path}")
 
+    signature_error = _check_file_signature(file_path, DOCX_SIGNATURE)
+    if signature_error:
+        logger.warning(f"Skipping {file_path.name}: {signature_error}")
+        return {
+            "text": None,
+            "method": None,
+            "paragraphs": 0,
+            "error": signature_error,
+        }
+
     try:
         result = _extract_with_python_docx(file_path)
         text_length = len(result["text"].strip()) if result["text"] else 0